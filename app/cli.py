@@ -0,0 +1,589 @@
+"""헤드리스 배치 변환 CLI (PySide6 불필요)
+
+사용법:
+    python -m app.cli convert INPUT... -o OUT [--rotation 2 --noise 3 ...]
+    python -m app.cli random INPUT... -o OUT [--seed 42 ...]
+    python -m app.cli watch DIR... -o OUT [--random | --preset p.json ...]
+
+INPUT은 파일, 폴더, 글롭 패턴(예: "photos/**/*.jpg") 모두 가능.
+진행 상황은 stdout에 JSON Lines로 출력 (이벤트당 한 줄), 사람용 메시지는 stderr.
+"""
+import argparse
+import glob
+import json
+import random
+import signal
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+from app.core.batch_engine import BatchEngine, default_worker_count
+from app.core.constants import IMAGE_EXTENSIONS
+from app.core.random_transform import RandomTransformConfig, generate_random_task_options
+from app.core.profiling import DEFAULT_PROFILE_EVERY, MERGED_FILENAME, hot_functions
+from app.core.profiling import summary_lines as profile_summary_lines
+from app.core.run_report import RunReport, report_path_for, summary_lines, write_report
+from app.core.random_config import (
+    CROP_RANGE,
+    ROTATION_RANGE,
+    NOISE_RANGE,
+    PERSPECTIVE_RANGE,
+    DATE_DAYS_BACK,
+)
+from app.core.save_output import create_output_folder
+from app.core.trace import trace_path_for
+from app.core.scheduler import read_oriented_size, resolve_memory_budget
+from app.core.watch import (
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_SETTLE_SECONDS,
+    LEDGER_FILENAME,
+    CompletionLedger,
+    FolderWatcher,
+    WatchService,
+)
+
+GLOB_CHARS = set("*?[")
+
+
+def emit_event(event: str, **fields):
+    """진행 이벤트 1줄 (JSON Lines)"""
+    print(json.dumps({"event": event, **fields}, ensure_ascii=False), flush=True)
+
+
+def log(message: str):
+    print(message, file=sys.stderr, flush=True)
+
+
+def _is_image(path: Path) -> bool:
+    return path.is_file() and path.suffix.lower() in IMAGE_EXTENSIONS
+
+
+def _glob_root(pattern: str) -> Path:
+    """글롭 패턴에서 와일드카드 앞의 고정 디렉토리"""
+    parts = []
+    for part in Path(pattern).parts:
+        if GLOB_CHARS & set(part):
+            break
+        parts.append(part)
+    return Path(*parts) if parts else Path(".")
+
+
+def collect_inputs(inputs: list[str], recursive: bool = False) -> list[tuple[str, Path]]:
+    """입력(파일/폴더/글롭) → (파일 경로, 기준 루트) 목록, 중복 제거 + 이름순"""
+    found: dict[str, Path] = {}
+
+    for item in inputs:
+        path = Path(item)
+        if GLOB_CHARS & set(item):
+            root = _glob_root(item)
+            for match in glob.glob(item, recursive=True):
+                if _is_image(Path(match)):
+                    found.setdefault(str(Path(match).resolve()), root.resolve())
+        elif path.is_dir():
+            candidates = path.rglob("*") if recursive else path.iterdir()
+            for f in candidates:
+                if _is_image(f):
+                    found.setdefault(str(f.resolve()), path.resolve())
+        elif _is_image(path):
+            found.setdefault(str(path.resolve()), path.resolve().parent)
+        else:
+            log(f"건너뜀 (이미지 아님/없음): {item}")
+
+    return sorted(found.items())
+
+
+def resolve_output_dir(
+    layout: str,
+    output: Path,
+    filepath: str,
+    root: Path,
+    auto_dir: Optional[Path],
+) -> Path:
+    """출력 레이아웃별 파일의 저장 폴더
+
+    - auto: GUI와 같은 옵션 이름 하위 폴더 (예: 회전2_노이즈3)
+    - flat: 출력 폴더에 바로 저장
+    - mirror: 입력 루트 기준 하위 폴더 구조 유지
+    """
+    if layout == "auto":
+        return auto_dir
+    if layout == "mirror":
+        return output / Path(filepath).parent.relative_to(root)
+    return output
+
+
+def find_name_collisions(inputs: list[tuple[str, Path]], output_format: str) -> dict[str, list[str]]:
+    """한 폴더에 모아 저장(auto/flat)할 때 같은 결과 파일명이 되는 입력 목록 (결과 파일명 → 입력 경로들)"""
+    ext = ".webp" if output_format == "webp" else ".jpg"
+    by_name: dict[str, list[str]] = {}
+    for filepath, _root in inputs:
+        by_name.setdefault(f"{Path(filepath).stem}{ext}".lower(), []).append(filepath)
+    return {name: paths for name, paths in by_name.items() if len(paths) > 1}
+
+
+def _warn_name_collisions(args: argparse.Namespace, inputs: list[tuple[str, Path]]):
+    """auto/flat에서 이름이 겹치는 입력 경고 (뒤 파일은 _1, _2 ... 로 저장됨)"""
+    if args.layout == "mirror":
+        return
+    collisions = find_name_collisions(inputs, args.format)
+    if not collisions:
+        return
+    files = sum(len(paths) for paths in collisions.values())
+    paths = next(iter(collisions.values()))
+    emit_event("warning", kind="name_collision", names=len(collisions), files=files, example=paths)
+    log(
+        f"경고: 같은 이름의 입력 {files}개({len(collisions)}종, 예: {Path(paths[0]).name})가 한 출력 폴더에 저장됩니다. "
+        "겹치는 파일은 _1, _2 ... 이름으로 저장되며, 폴더 구조를 유지하려면 --layout mirror를 사용하세요."
+    )
+
+
+def build_convert_options(args: argparse.Namespace) -> dict:
+    """convert 명령 인자 → 변환 옵션 (프리셋 JSON 위에 명령행 값 덮어쓰기)"""
+    options: dict = {}
+    if args.preset:
+        with open(args.preset, "r", encoding="utf-8") as f:
+            options.update(json.load(f))
+
+    if args.crop is not None:
+        options["crop"] = {k: args.crop for k in ("top", "bottom", "left", "right")}
+    for key in ("rotation", "brightness", "contrast", "saturation", "noise"):
+        value = getattr(args, key)
+        if value is not None:
+            options[key] = value
+
+    if args.exif_remove:
+        options["exif"] = {"remove_all": True, "override": False}
+    elif args.exif_date:
+        options["exif"] = {"remove_all": False, "override": True, "datetime": args.exif_date}
+
+    return options
+
+
+def _use_random(args: argparse.Namespace) -> bool:
+    return args.command == "random" or getattr(args, "random", False)
+
+
+def make_task_factory(args: argparse.Namespace):
+    """인자 → 파일별 작업 생성 함수 make_task(filepath, root) (실패 시 None)
+
+    batch(convert/random)와 watch 모드가 같은 작업 생성 규칙을 사용한다.
+    """
+    output = Path(args.output)
+    output.mkdir(parents=True, exist_ok=True)
+
+    # 시드 지정 시 랜덤 옵션 생성과 작업별 노이즈 시드 모두 재현 가능
+    task_seeds = None
+    if args.seed is not None:
+        random.seed(args.seed)
+        task_seeds = random.Random(args.seed)
+
+    if _use_random(args):
+        config = RandomTransformConfig(
+            crop_range=args.crop_range,
+            rotation_range=args.rotation_range,
+            noise_range=args.noise_range,
+            perspective_range=args.perspective_range,
+            date_days_back=args.date_days_back,
+        )
+        folder_options = {"random": True}
+    else:
+        options = build_convert_options(args)
+        folder_options = options
+
+    auto_dir = create_output_folder(str(output), folder_options) if args.layout == "auto" else None
+
+    def make_task(filepath: str, root: Path) -> Optional[dict]:
+        if _use_random(args):
+            size = read_oriented_size(filepath)
+            if size is None:
+                emit_event("error", file=filepath, error="이미지 헤더를 읽을 수 없습니다")
+                return None
+            task_options = generate_random_task_options(config, *size)
+            if not args.perspective:
+                task_options.pop("perspective_corners", None)
+            if not args.date:
+                task_options.pop("exif", None)
+        else:
+            task_options = options
+
+        output_dir = resolve_output_dir(args.layout, output, filepath, root, auto_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return {
+            "filepath": filepath,
+            "options": task_options,
+            "output_dir": str(output_dir),
+            "output_format": args.format,
+            "quality": args.quality,
+            "seed": task_seeds.randrange(2**63) if task_seeds is not None else None,
+        }
+
+    return make_task
+
+
+def build_tasks(args: argparse.Namespace, inputs: list[tuple[str, Path]]) -> list[dict]:
+    make_task = make_task_factory(args)
+    tasks = []
+    for filepath, root in inputs:
+        task = make_task(filepath, root)
+        if task is not None:
+            tasks.append(task)
+    return tasks
+
+
+def _result_reporter(args: argparse.Namespace, counts: dict, run_report: RunReport):
+    """BatchEngine on_result → 성공/실패 집계 + 실행 리포트 + result 이벤트"""
+
+    def on_result(result: dict, completed: int, total: int):
+        counts["success" if result["success"] else "failed"] += 1
+        run_report.add(result)
+        if args.quiet:
+            return
+        fields = {
+            "file": result["filepath"],
+            "success": result["success"],
+            "completed": completed,
+            "total": total,
+        }
+        if result["success"]:
+            fields["output"] = result["result"]
+        else:
+            fields["error"] = result["result"]
+        emit_event("result", **fields)
+
+    return on_result
+
+
+def _create_engine(args: argparse.Namespace, on_result) -> BatchEngine:
+    return BatchEngine(
+        max_workers=args.workers,
+        memory_budget=resolve_memory_budget(args.memory_budget_mb),
+        on_result=on_result,
+        on_throttle=lambda message: emit_event("throttle", message=message),
+        profile_memory=args.profile_memory,
+        profile_dir=str(Path(args.output).resolve()) if args.profile else None,
+        profile_every=args.profile_every,
+        trace=args.trace is not None,
+    )
+
+
+def _sigint_handler(engine: BatchEngine, message: str):
+    def on_sigint(signum, frame):
+        # 첫 Ctrl+C: 협조적 취소, 두 번째: 워커 강제 종료
+        if engine.cancelled:
+            log("워커 강제 종료")
+            engine.terminate_workers()
+        else:
+            log(f"{message} (다시 누르면 강제 종료)")
+            engine.cancel()
+
+    return on_sigint
+
+
+def _report_stage_stats(args: argparse.Namespace, engine: BatchEngine):
+    """배치 종료 시 단계별 시간/메모리/CPU 프로파일 요약 (stages·memory·profile 이벤트 + stderr 표)"""
+    stats = engine.stage_stats
+    if not stats.images:
+        return
+    emit_event("stages", **stats.to_dict())
+    if not args.quiet:
+        for line in stats.summary_lines():
+            log(line)
+
+    if engine.memory_stats.images:
+        emit_event("memory", **engine.memory_stats.to_dict())
+        for line in engine.memory_stats.summary_lines():
+            log(line)
+
+    if engine.profile_stats is not None:
+        emit_event(
+            "profile",
+            path=str(Path(engine.profile_dir) / MERGED_FILENAME),
+            hot=hot_functions(engine.profile_stats),
+        )
+        for line in profile_summary_lines(engine.profile_stats):
+            log(line)
+
+
+def _report_run(args: argparse.Namespace, engine: BatchEngine, run_report: RunReport):
+    """실행 리포트 (report 이벤트 + stderr 요약 + JSON 파일)"""
+    sections = {"stages": engine.stage_stats.to_dict()}
+    if engine.memory_stats.images:
+        sections["memory"] = engine.memory_stats.to_dict()
+    if engine.profile_stats is not None:
+        sections["profile"] = hot_functions(engine.profile_stats)
+    report = run_report.finish(cancelled=engine.cancelled, **sections)
+
+    path = Path(args.report) if args.report else report_path_for(Path(args.output), run_report.started_at)
+    try:
+        write_report(report, path)
+    except OSError as e:
+        log(f"리포트 저장 실패: {e}")
+        path = None
+    # stages/memory는 별도 이벤트로 이미 출력했으므로 파일에만 포함
+    emit_event(
+        "report",
+        path=str(path) if path else None,
+        **{k: v for k, v in report.items() if k not in sections},
+    )
+    if not args.quiet:
+        for line in summary_lines(report):
+            log(line)
+    if path:
+        log(f"리포트: {path}")
+
+
+def _save_trace(args: argparse.Namespace, engine: BatchEngine, started_at=None):
+    """타임라인 트레이스 저장 (trace 이벤트)"""
+    if engine.trace is None:
+        return
+    path = Path(args.trace) if args.trace else trace_path_for(Path(args.output), started_at)
+    try:
+        engine.trace.save(path)
+    except OSError as e:
+        log(f"트레이스 저장 실패: {e}")
+        return
+    emit_event("trace", path=str(path), events=len(engine.trace.events))
+    log(f"트레이스: {path} (chrome://tracing 또는 ui.perfetto.dev에서 열기)")
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    inputs = collect_inputs(args.inputs, args.recursive)
+    if not inputs:
+        log("처리할 이미지가 없습니다.")
+        return 2
+
+    _warn_name_collisions(args, inputs)
+    tasks = build_tasks(args, inputs)
+    counts = {"success": 0, "failed": 0}
+    engine = _create_engine(args, None)
+    run_report = RunReport(args.command, engine.max_workers, len(tasks))
+    engine.on_result = _result_reporter(args, counts, run_report)
+
+    previous_handler = signal.signal(signal.SIGINT, _sigint_handler(engine, "취소 중..."))
+    emit_event("start", total=len(tasks), workers=engine.max_workers, mode=args.command)
+    start = time.perf_counter()
+    try:
+        engine.run(tasks)
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+
+    _report_stage_stats(args, engine)
+    _report_run(args, engine, run_report)
+    _save_trace(args, engine, run_report.started_at)
+    emit_event(
+        "done",
+        total=len(tasks),
+        succeeded=counts["success"],
+        failed=counts["failed"],
+        cancelled=engine.cancelled,
+        elapsed=round(time.perf_counter() - start, 3),
+    )
+
+    if engine.cancelled:
+        return 130
+    return 1 if counts["failed"] else 0
+
+
+def run_watch(args: argparse.Namespace) -> int:
+    """폴더 감시 모드: 중단(Ctrl+C)할 때까지 새 이미지를 처리"""
+    roots = [Path(d).resolve() for d in args.inputs]
+    missing = [str(d) for d in roots if not d.is_dir()]
+    if missing:
+        log(f"감시할 폴더가 없습니다: {', '.join(missing)}")
+        return 2
+
+    output = Path(args.output).resolve()
+    make_task = make_task_factory(args)
+    counts = {"success": 0, "failed": 0}
+
+    def make_watch_task(filepath: str) -> Optional[dict]:
+        # mirror 레이아웃 기준 루트 = 파일을 포함하는 감시 폴더
+        root = next((r for r in roots if Path(filepath).is_relative_to(r)), roots[0])
+        task = make_task(filepath, root)
+        if task is None:
+            counts["failed"] += 1  # 헤더를 읽지 못해 작업을 만들지 못함 (error 이벤트는 make_task가 출력)
+        return task
+
+    watcher = FolderWatcher(
+        [str(r) for r in roots],
+        recursive=args.recursive,
+        exclude=str(output),
+        settle_seconds=args.settle,
+        poll_interval=args.poll_interval,
+        force_polling=args.poll,
+    )
+    ledger = CompletionLedger(Path(args.state) if args.state else output / LEDGER_FILENAME)
+    service = WatchService(watcher, ledger, make_watch_task)
+
+    engine = _create_engine(args, None)
+    run_report = RunReport("watch", engine.max_workers, 0)
+    report = _result_reporter(args, counts, run_report)
+
+    def on_result(result: dict, completed: int, total: int):
+        service.on_result(result)
+        report(result, completed, total)
+
+    engine.on_result = on_result
+    previous_handler = signal.signal(signal.SIGINT, _sigint_handler(engine, "감시 종료 중..."))
+
+    backlog = service.start()
+    emit_event(
+        "watch",
+        dirs=[str(r) for r in roots],
+        backend=watcher.backend.name,
+        backlog=backlog,
+        workers=engine.max_workers,
+        mode="random" if _use_random(args) else "convert",
+    )
+    log("감시 중... (Ctrl+C로 종료)")
+    start = time.perf_counter()
+    error = None
+    try:
+        engine.run([], feed=service.feed)
+    except Exception as e:
+        # 감시 백엔드/결과 처리 오류로 감시가 끝남 → 리포트는 남기고 실패로 종료
+        error = e
+        emit_event("error", error=str(e), error_type=type(e).__name__)
+        log(f"감시 중단 (오류): {e}")
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+        watcher.close()
+
+    _report_stage_stats(args, engine)
+    run_report.total = len(run_report.items)
+    _report_run(args, engine, run_report)
+    _save_trace(args, engine, run_report.started_at)
+    emit_event(
+        "done",
+        succeeded=counts["success"],
+        failed=counts["failed"],
+        cancelled=engine.cancelled,
+        elapsed=round(time.perf_counter() - start, 3),
+    )
+    # Ctrl+C는 감시 모드의 정상 종료 - 실패한 파일이 있거나 오류로 끝났을 때만 1
+    return 1 if error is not None or counts["failed"] else 0
+
+
+def _add_common_arguments(
+    parser: argparse.ArgumentParser,
+    layouts: tuple[str, ...] = ("auto", "flat", "mirror"),
+    default_layout: str = "auto",
+):
+    parser.add_argument("-o", "--output", required=True, help="출력 폴더")
+    parser.add_argument(
+        "--layout",
+        choices=layouts,
+        default=default_layout,
+        help="출력 구조: auto=옵션 이름 하위 폴더(GUI와 동일), flat=출력 폴더에 바로, "
+        f"mirror=입력 폴더 구조 유지 (기본: {default_layout})",
+    )
+    parser.add_argument("-r", "--recursive", action="store_true", help="폴더 입력 시 하위 폴더 포함")
+    parser.add_argument(
+        "-j", "--workers", type=int, default=None,
+        help=f"워커 프로세스 수 (기본: CPU-1 = {default_worker_count()})",
+    )
+    parser.add_argument(
+        "--memory-budget-mb", type=int, default=0,
+        help="배치 메모리 예산 MB (기본 0: 가용 메모리 기준 자동)",
+    )
+    parser.add_argument("--format", choices=("jpeg", "webp"), default="jpeg", help="출력 포맷")
+    parser.add_argument("--quality", type=int, default=None, help="인코딩 품질 (기본: JPEG 75, WebP 80)")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드 (같은 입력이면 같은 결과)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="파일별 result 이벤트 생략")
+    parser.add_argument(
+        "--profile-memory", action="store_true",
+        help="단계별 메모리 최고치 측정 + 권장 워커 수 보고 (처리 속도 느려짐)",
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help=f"워커에서 cProfile 계측 → 출력 폴더에 {MERGED_FILENAME}/profile.txt 저장, 상위 함수 요약",
+    )
+    parser.add_argument(
+        "--profile-every", type=int, default=DEFAULT_PROFILE_EVERY, metavar="N",
+        help="작업 N개마다 1개만 계측 (오버헤드 감소, 기본: 모두)",
+    )
+    parser.add_argument(
+        "--trace", nargs="?", const="", default=None, metavar="PATH",
+        help="워커/단계/큐 타임라인을 Trace Event JSON으로 저장 (기본 경로: 출력 폴더 안 trace_<시작 시각>.json)",
+    )
+    parser.add_argument(
+        "--report", default=None,
+        help="실행 리포트 JSON 경로 (기본: 출력 폴더 안 report_<시작 시각>.json)",
+    )
+
+
+def _add_convert_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--preset", help="옵션 JSON 파일 (명령행 값이 우선)")
+    parser.add_argument("--crop", type=int, default=None, help="테두리 크롭 px (음수 = 여백 추가)")
+    parser.add_argument("--rotation", type=float, default=None, help="회전 각도 (도)")
+    parser.add_argument("--brightness", type=int, default=None, help="밝기 (-100~100)")
+    parser.add_argument("--contrast", type=int, default=None, help="대비 (-100~100)")
+    parser.add_argument("--saturation", type=int, default=None, help="채도 (-100~100)")
+    parser.add_argument("--noise", type=float, default=None, help="노이즈 강도")
+    exif = parser.add_mutually_exclusive_group()
+    exif.add_argument("--exif-remove", action="store_true", help="EXIF 전체 삭제")
+    exif.add_argument("--exif-date", help='촬영일시 덮어쓰기 (예: "2024:01:01 12:00:00")')
+
+
+def _add_random_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--crop-range", type=float, default=CROP_RANGE)
+    parser.add_argument("--rotation-range", type=float, default=ROTATION_RANGE)
+    parser.add_argument("--noise-range", type=float, default=NOISE_RANGE)
+    parser.add_argument("--perspective-range", type=float, default=PERSPECTIVE_RANGE)
+    parser.add_argument("--date-days-back", type=int, default=DATE_DAYS_BACK)
+    parser.add_argument(
+        "--no-perspective", dest="perspective", action="store_false", help="자유변형(원근) 생략"
+    )
+    parser.add_argument("--no-date", dest="date", action="store_false", help="촬영일시 랜덤화 생략")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.cli",
+        description="Image Setakgi 헤드리스 배치 변환",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    convert = sub.add_parser("convert", help="모든 파일에 같은 옵션 적용")
+    convert.add_argument("inputs", nargs="+", help="입력 파일/폴더/글롭 패턴")
+    _add_common_arguments(convert)
+    _add_convert_arguments(convert)
+
+    rand = sub.add_parser("random", help="파일마다 다른 랜덤 변형 적용")
+    rand.add_argument("inputs", nargs="+", help="입력 파일/폴더/글롭 패턴")
+    _add_common_arguments(rand)
+    _add_random_arguments(rand)
+
+    # auto 레이아웃은 실행마다 새 폴더를 만들어 재시작 시 출력이 흩어지므로 제외
+    watch = sub.add_parser("watch", help="폴더를 감시하며 새 이미지를 한 번씩 변환")
+    watch.add_argument("inputs", nargs="+", help="감시할 폴더")
+    _add_common_arguments(watch, layouts=("flat", "mirror"), default_layout="mirror")
+    watch.add_argument(
+        "--random", action="store_true", help="랜덤 변형 적용 (기본: 변환 옵션/프리셋 적용)"
+    )
+    _add_convert_arguments(watch)
+    _add_random_arguments(watch)
+    watch.add_argument(
+        "--settle", type=float, default=DEFAULT_SETTLE_SECONDS,
+        help=f"파일 크기/수정 시각이 이 시간(초) 동안 변하지 않으면 처리 (기본: {DEFAULT_SETTLE_SECONDS})",
+    )
+    watch.add_argument(
+        "--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL,
+        help=f"폴링 감시 간격 초 (기본: {DEFAULT_POLL_INTERVAL})",
+    )
+    watch.add_argument("--poll", action="store_true", help="inotify 대신 폴링 감시 강제")
+    watch.add_argument("--state", help=f"처리 완료 기록 파일 (기본: 출력 폴더/{LEDGER_FILENAME})")
+
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command == "watch":
+        return run_watch(args)
+    return run_batch(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,506 @@
+"""병렬 배치 처리 엔진 (Qt 비의존)
+
+ProcessPoolExecutor로 이미지 처리를 병렬화한다.
+GUI(BatchTransformWorker)와 CLI(app.cli)가 같은 엔진을 사용한다.
+
+- 헤더를 미리 읽어 작업별 메모리/비용 추정 → 큰 작업부터 투입
+- 메모리 예산을 넘지 않도록 작업 투입 조절
+- 공유 취소 이벤트로 진행 중 작업도 단계 경계에서 중단
+- 작업별 단계 시간을 결과와 함께 받아 stage_stats 히스토그램에 집계
+- profile_memory=True면 단계별 메모리 최고치도 측정해 memory_stats에 집계
+- profile_dir이 주어지면 워커에서 cProfile 계측 후 출력 폴더에 병합 (profiling 참고)
+- trace=True면 워커/단계/큐 타임라인을 trace(TraceRecorder)에 기록 (trace 참고)
+- GUI에서는 워커를 낮은 OS 우선순위로 돌리고 미리보기 조작 중 새 작업 투입을 보류 (scheduler 참고)
+"""
+import multiprocessing as mp
+import pstats
+import random
+import signal
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+try:
+    from concurrent.futures.process import BrokenProcessPool
+except ImportError:  # Python 일부 버전 호환
+    class BrokenProcessPool(RuntimeError):  # type: ignore
+        """ProcessPoolExecutor가 비정상 종료됐을 때 사용되는 예외"""
+from pathlib import Path
+from typing import Callable, Optional
+
+from .cancellation import TaskCancelled
+from .memory_profile import MemoryStageTimer, MemoryStats
+from .pipeline import process_image_file
+from .profiling import DEFAULT_PROFILE_EVERY, merge_profiles, parts_dir_for, profile_task, should_profile
+from .save_output import cleanup_partial_outputs, release_reservations
+from .stage_timing import StageStats, StageTimer
+from .trace import TraceRecorder, worker_trace
+from .scheduler import (
+    InteractionGate,
+    MemoryBudget,
+    estimate_task_cost,
+    estimate_task_memory,
+    lower_process_priority,
+    order_largest_first,
+    read_image_sizes,
+)
+
+# 워커 프로세스 내 공유 취소 이벤트 (_init_worker에서 설정)
+_cancel_event = None
+
+# 스트리밍 모드에서 진행 중 작업이 없을 때 feed 확인 간격 (초)
+FEED_IDLE_INTERVAL = 0.2
+
+
+def _error_result(task: dict, error: BaseException) -> dict:
+    """워커에서 처리 결과 없이 예외로 끝난 작업의 실패 결과"""
+    return {
+        "filepath": task["filepath"],
+        "success": False,
+        "result": str(error),
+        "options": {},
+        "cancelled": False,
+        "error_type": type(error).__name__,
+    }
+
+
+class _PoolUnavailable(Exception):
+    """프로세스 풀 생성/작업 투입 실패 또는 워커 비정상 종료 → 순차 처리로 폴백
+
+    on_result 콜백 등 풀 밖의 예외와 구분하기 위해 풀 호출 지점에서만 발생시킨다.
+    """
+
+
+def default_worker_count() -> int:
+    return max(1, mp.cpu_count() - 1)
+
+
+def _init_worker(cancel_event=None, low_priority: bool = False):
+    """멀티프로세스 워커 초기화: OpenCV 내부 스레드 완전 비활성화 + 취소 이벤트 등록
+
+    low_priority면 OS 우선순위를 낮춰 GUI(미리보기)에 CPU를 양보
+    """
+    import os
+    os.environ["OMP_NUM_THREADS"] = "1"
+    os.environ["OPENBLAS_NUM_THREADS"] = "1"
+    os.environ["MKL_NUM_THREADS"] = "1"
+    os.environ["VECLIB_MAXIMUM_THREADS"] = "1"
+    os.environ["NUMEXPR_NUM_THREADS"] = "1"
+
+    # Ctrl+C는 코디네이터가 받아 취소 이벤트로 전달
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    global _cancel_event
+    _cancel_event = cancel_event
+
+    if low_priority:
+        lower_process_priority()
+
+    try:
+        import cv2
+        cv2.setNumThreads(0)
+    except Exception:
+        pass
+
+
+def _seed_task(seed: Optional[int]):
+    """작업별 난수 시드 고정 (노이즈 재현용)"""
+    if seed is None:
+        return
+    import numpy as np
+
+    random.seed(seed)
+    np.random.seed(seed % (2**32))
+
+
+def process_task(args: dict, cancel_event=None) -> dict:
+    """단일 이미지 처리 (멀티프로세스용 - 모듈 레벨 함수)
+
+    결과: filepath, success, result(출력 경로 또는 오류 메시지), options, cancelled,
+    timings(단계별 시간), memory(메모리 프로파일), trace(타임라인 구간), elapsed, megapixels, error_type
+    """
+    filepath = args["filepath"]
+    options = args["options"]
+    profile_memory = args.get("profile_memory", False)
+    timer = MemoryStageTimer(args.get("megapixels", 0.0)) if profile_memory else StageTimer()
+    if args.get("trace"):
+        timer.spans = []
+    start = time.perf_counter()
+    result = {
+        "filepath": filepath,
+        "success": False,
+        "options": {},
+        "cancelled": False,
+        "megapixels": args.get("megapixels", 0.0),
+        "error_type": None,
+    }
+
+    try:
+        _seed_task(args.get("seed"))
+        with profile_task(args.get("profile_parts")), timer.activate():
+            output_path = process_image_file(
+                filepath,
+                options,
+                Path(args["output_dir"]),
+                args.get("output_format", "jpeg"),
+                cancel_event=cancel_event or _cancel_event,
+                quality=args.get("quality"),
+            )
+        result.update(success=True, result=str(output_path), options=options)
+
+    except TaskCancelled as e:
+        release_reservations()
+        result.update(result=str(e), cancelled=True)
+        return result
+
+    except Exception as e:
+        release_reservations()
+        result.update(result=str(e), error_type=type(e).__name__)
+
+    end = time.perf_counter()
+    result["elapsed"] = end - start
+    result["timings"] = timer.durations
+    result["memory"] = timer.report() if profile_memory else None
+    result["trace"] = worker_trace(start, end, timer.spans) if args.get("trace") else None
+    return result
+
+
+def build_tasks(
+    files: list[str],
+    options: dict,
+    output_dir: str,
+    output_format: str = "jpeg",
+) -> list[dict]:
+    """모든 파일에 같은 옵션을 적용하는 작업 목록"""
+    return [
+        {
+            "filepath": f,
+            "options": options,
+            "output_dir": str(output_dir),
+            "output_format": output_format,
+        }
+        for f in files
+    ]
+
+
+def prepare_tasks(tasks: list[dict]) -> list[dict]:
+    """헤더를 미리 읽어 작업별 메모리/비용 추정 후 큰 작업부터 정렬"""
+    sizes = read_image_sizes([t["filepath"] for t in tasks])
+    for task, size in zip(tasks, sizes):
+        w, h = size if size else (0, 0)
+        task["megapixels"] = w * h / 1_000_000
+        task["mem_estimate"] = estimate_task_memory(w, h, task["options"])
+        task["cost_estimate"] = estimate_task_cost(w, h, task["options"])
+    return order_largest_first(tasks)
+
+
+class BatchEngine:
+    """병렬 배치 처리 엔진
+
+    작업은 추정 비용(메가픽셀 × 단계 가중치)이 큰 순서로 투입하고,
+    결과는 완료 순서대로 on_result(result, completed, total)로 보고한다.
+    memory_budget(바이트)이 주어지면 작업별 추정 메모리 합계가 예산을 넘지 않도록
+    작업 투입을 조절하고, 보류 사유를 on_throttle(message)로 알린다.
+
+    cancel()은 공유 이벤트로 워커 프로세스에 전달되어 진행 중 작업도 다음 단계
+    경계에서 중단된다. 응답이 없으면 terminate_workers()로 프로세스를 강제 종료.
+
+    완료된 작업의 단계별 시간은 stage_stats(StageStats)에 모인다 (run마다 초기화).
+    profile_memory=True면 워커가 단계별 메모리 최고치도 측정해 memory_stats(MemoryStats)에 모인다.
+    profile_dir이 주어지면 작업 profile_every개마다 1개를 cProfile로 계측해 종료 시
+    profile_dir/profile.prof로 병합하고 profile_stats(pstats.Stats)에 둔다.
+    trace=True면 run마다 새 TraceRecorder(trace)에 타임라인을 기록한다 (저장은 호출 측).
+
+    low_priority=True면 워커 프로세스를 낮은 OS 우선순위로 실행하고, interaction_gate가 주어지면
+    게이트가 active인 동안(미리보기 조작 직후) 새 작업 투입을 보류한다 (진행 중 작업 1개 이상 유지 시).
+
+    run(tasks, feed=...)로 실행하면 취소될 때까지 풀을 유지한 채 feed()가 돌려주는
+    새 작업을 도착 순서대로 처리한다 (폴더 감시 모드용).
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        memory_budget: Optional[int] = None,
+        on_result: Optional[Callable[[dict, int, int], None]] = None,
+        on_throttle: Optional[Callable[[str], None]] = None,
+        profile_memory: bool = False,
+        profile_dir: Optional[str] = None,
+        profile_every: int = DEFAULT_PROFILE_EVERY,
+        trace: bool = False,
+        low_priority: bool = False,
+        interaction_gate: Optional[InteractionGate] = None,
+    ):
+        self.max_workers = max_workers or default_worker_count()
+        self.low_priority = low_priority
+        self.interaction_gate = interaction_gate
+        self.profile_memory = profile_memory
+        self.profile_dir = profile_dir
+        self.profile_every = profile_every
+        self._profile_index = 0
+        self.trace_enabled = trace
+        self.trace: Optional[TraceRecorder] = None
+        self.memory_budget = memory_budget
+        self.on_result = on_result
+        self.on_throttle = on_throttle
+        self._cancelled = False
+        self._cancel_event = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.stage_stats = StageStats()
+        self.memory_stats = MemoryStats()
+        self.profile_stats: Optional[pstats.Stats] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self):
+        """처리 취소 - 대기 작업 폐기 + 진행 중 작업에 취소 전파"""
+        self._cancelled = True
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+
+    def terminate_workers(self):
+        """취소에 응답하지 않는 워커 프로세스 강제 종료"""
+        self.cancel()
+        executor = self._executor
+        if executor is None:
+            return
+        if hasattr(executor, "terminate_workers"):  # Python 3.14+
+            executor.terminate_workers()
+            return
+        for process in list((getattr(executor, "_processes", None) or {}).values()):
+            try:
+                process.terminate()
+            except Exception:
+                pass
+
+    def _prepare(self, tasks: list[dict]) -> list[dict]:
+        tasks = prepare_tasks(tasks)
+        if self.profile_memory:
+            for task in tasks:
+                task["profile_memory"] = True
+        if self.trace_enabled:
+            for task in tasks:
+                task["trace"] = True
+        if self.profile_dir:
+            parts_dir = str(parts_dir_for(Path(self.profile_dir)))
+            for task in tasks:
+                if should_profile(self._profile_index, self.profile_every):
+                    task["profile_parts"] = parts_dir
+                self._profile_index += 1
+        return tasks
+
+    def _report(self, result: dict, completed: int, total: int):
+        self.stage_stats.add(result.get("timings"))
+        self.memory_stats.add(result["filepath"], result.get("memory"))
+        if not self.on_result:
+            return
+        if self.trace is None:
+            self.on_result(result, completed, total)
+            return
+        self.trace.reported(result)
+        with self.trace.span("on_result", file=result["filepath"]):
+            self.on_result(result, completed, total)
+
+    def _throttle(self, message: str):
+        if self.trace is not None:
+            self.trace.instant("throttle", message=message)
+        if self.on_throttle:
+            self.on_throttle(message)
+
+    def _collect_finished(self, running: dict, done_ids: set[int], completed: int, total: int) -> int:
+        """running 중 풀이 깨지기 전에 끝난 future의 결과(실패 포함) 보고, 처리 완료 작업 수 반환"""
+        for future, task in list(running.items()):
+            if not future.done() or future.cancelled():
+                continue
+            error = future.exception()
+            if isinstance(error, BrokenProcessPool):
+                continue
+            del running[future]
+            result = future.result() if error is None else _error_result(task, error)
+            if self.trace is not None:
+                self.trace.completed(task, result, 0, len(running))
+            if result.get("cancelled"):
+                continue
+            completed += 1
+            done_ids.add(id(task))
+            self._report(result, completed, total)
+        return completed
+
+    def _run_sequential(
+        self,
+        tasks: list[dict],
+        done_ids: set[int],
+        completed: int,
+        total: int,
+        feed: Optional[Callable[[], list[dict]]],
+    ) -> int:
+        """끝나지 않은 작업을 현재 프로세스에서 순차 처리, 처리 완료 작업 수 반환
+
+        feed가 주어지면 풀 모드와 같이 취소될 때까지 feed()의 새 작업을 계속 처리
+        """
+        pending = deque(task for task in tasks if id(task) not in done_ids)
+        while not self._cancelled:
+            if feed is not None:
+                new_tasks = feed()
+                if new_tasks:
+                    self._prepare(new_tasks)
+                    tasks.extend(new_tasks)
+                    pending.extend(new_tasks)
+                    total += len(new_tasks)
+            if not pending:
+                if feed is None:
+                    break
+                time.sleep(FEED_IDLE_INTERVAL)
+                continue
+
+            task = pending.popleft()
+            if self.trace is not None:
+                self.trace.submitted(task, len(pending), 1)
+            result = process_task(task, self._cancel_event)
+            if self.trace is not None:
+                self.trace.completed(task, result, len(pending), 0)
+            if result.get("cancelled"):
+                break
+            completed += 1
+            done_ids.add(id(task))
+            self._report(result, completed, total)
+        return completed
+
+    def run(
+        self,
+        tasks: list[dict],
+        feed: Optional[Callable[[], list[dict]]] = None,
+    ) -> int:
+        """병렬 처리 실행 (실패 시 순차 처리로 폴백), 처리 완료 작업 수 반환
+
+        feed가 주어지면 작업이 없어도 종료하지 않고 feed()의 새 작업을 계속 처리
+        """
+        self._profile_index = 0
+        self.profile_stats = None
+        self.trace = TraceRecorder() if self.trace_enabled else None
+        tasks = self._prepare(tasks)
+        total = len(tasks)
+        completed = 0
+        done_ids: set[int] = set()
+        budget = MemoryBudget(self.memory_budget)
+        self.stage_stats = StageStats()
+        self.memory_stats = MemoryStats()
+        ctx = mp.get_context("spawn")
+        self._cancel_event = ctx.Event()
+        if self._cancelled:
+            self._cancel_event.set()
+        running = {}  # future → 작업 (풀이 깨지면 이미 끝난 결과를 회수하기 위해 try 밖에 둠)
+
+        try:
+            try:
+                executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_init_worker,
+                    initargs=(self._cancel_event, self.low_priority),
+                    mp_context=ctx,
+                )
+            except (OSError, NotImplementedError) as e:
+                raise _PoolUnavailable(str(e)) from e
+
+            with executor:
+                self._executor = executor
+                pending = deque(tasks)
+                throttled_path = None
+                gate = self.interaction_gate
+                holding = False
+
+                while pending or running or feed is not None:
+                    if self._cancelled:
+                        # 진행 중 작업은 다음 단계 경계에서 중단됨 (with 종료 시 대기)
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        break
+
+                    if feed is not None:
+                        new_tasks = feed()
+                        if new_tasks:
+                            # 스트리밍 작업은 도착 순서 유지 (크기순 정렬 안 함)
+                            self._prepare(new_tasks)
+                            tasks.extend(new_tasks)
+                            pending.extend(new_tasks)
+                            total += len(new_tasks)
+
+                    # 워커와 메모리 예산이 허용하는 만큼 투입 (순서 유지)
+                    while pending and len(running) < self.max_workers:
+                        if gate is not None and not gate.allows(len(running)):
+                            if not holding and self.trace is not None:
+                                self.trace.instant("interaction_hold", running=len(running))
+                            holding = True
+                            break
+                        holding = False
+                        task = pending[0]
+                        if not budget.try_acquire(task["mem_estimate"]):
+                            if throttled_path != task["filepath"]:
+                                throttled_path = task["filepath"]
+                                self._throttle(
+                                    budget.describe_throttle(
+                                        Path(task["filepath"]).name,
+                                        task["mem_estimate"],
+                                        len(running),
+                                        self.max_workers,
+                                    )
+                                )
+                            break
+                        try:
+                            future = executor.submit(process_task, task)
+                        except (BrokenProcessPool, OSError, RuntimeError) as e:
+                            raise _PoolUnavailable(str(e)) from e
+                        pending.popleft()
+                        running[future] = task
+                        if self.trace is not None:
+                            self.trace.submitted(task, len(pending), len(running))
+
+                    # 취소 확인을 위해 주기적으로 깨어남
+                    if not running:
+                        time.sleep(FEED_IDLE_INTERVAL)
+                        continue
+                    done, _ = wait(running, timeout=0.2, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        task = running.pop(future)
+                        budget.release(task["mem_estimate"])
+
+                        try:
+                            result = future.result()
+                        except BrokenProcessPool as e:
+                            raise _PoolUnavailable(str(e)) from e
+                        except Exception as e:
+                            result = _error_result(task, e)
+
+                        if self.trace is not None:
+                            self.trace.completed(task, result, len(pending), len(running))
+                        if result.get("cancelled"):
+                            continue
+
+                        completed += 1
+                        done_ids.add(id(task))
+                        self._report(result, completed, total)
+
+        except _PoolUnavailable:
+            # 멀티프로세싱 실패 시 남은 작업 순차 처리로 폴백 (취소/강제 종료 시 제외)
+            # on_result 콜백 예외는 여기서 잡지 않고 호출 측으로 전달 (이미 저장한 작업을 다시 처리하지 않도록)
+            # 풀이 깨지기 전에 끝났지만 아직 보고하지 않은 작업은 결과를 회수 (다시 처리하면 _1 중복 출력)
+            completed = self._collect_finished(running, done_ids, completed, total)
+            if not self._cancelled:
+                # 죽은 워커가 남긴 임시 파일/선점한 빈 결과 파일 정리 후 다시 처리
+                for output_dir in {t["output_dir"] for t in tasks if id(t) not in done_ids}:
+                    cleanup_partial_outputs(Path(output_dir))
+                completed = self._run_sequential(tasks, done_ids, completed, total, feed)
+
+        finally:
+            self._executor = None
+            if self._cancelled:
+                for output_dir in {t["output_dir"] for t in tasks}:
+                    cleanup_partial_outputs(Path(output_dir))
+            if self.profile_dir:
+                try:
+                    self.profile_stats = merge_profiles(Path(self.profile_dir))
+                except OSError:
+                    self.profile_stats = None
+
+        return completed
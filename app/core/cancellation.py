@@ -0,0 +1,19 @@
+"""협조적 취소 - 파이프라인 단계 사이에서 공유 이벤트 확인
+
+threading.Event(스레드 풀) / multiprocessing Event(프로세스 풀) 모두 is_set()만 사용한다.
+"""
+from typing import Optional, Protocol
+
+
+class CancelEvent(Protocol):
+    def is_set(self) -> bool: ...
+
+
+class TaskCancelled(Exception):
+    """취소 요청으로 작업이 중단됨"""
+
+
+def check_cancelled(cancel_event: Optional[CancelEvent]):
+    """취소 요청이 있으면 TaskCancelled 발생"""
+    if cancel_event is not None and cancel_event.is_set():
+        raise TaskCancelled("취소됨")
@@ -17,6 +17,18 @@ DEFAULT_CONFIG = {
     },
     "last_output_dir": "",
     "last_input_dir": "",
+    "memory_budget_mb": 0,  # 배치 메모리 예산 (0 = 가용 메모리 기준 자동)
+    "profile_memory": False,  # 배치 처리 시 단계별 메모리 측정 (로그에 요약)
+    "profile_every": 1,  # CPU 프로파일링 시 작업 N개마다 1개만 계측 (오버헤드 조절)
+    "trace": False,  # 배치 처리 타임라인을 출력 폴더 안 trace_<시작 시각>.json으로 저장
+    "scan_max_depth": 8,  # 폴더 추가 시 하위 폴더 검색 깊이 (0 = 선택한 폴더만)
+    "scan_include": [],  # 추가할 파일 이름 패턴 (비우면 지원 이미지 확장자 전체)
+    "scan_exclude": [],  # 건너뛸 파일/폴더 이름 패턴 (숨김/출력 폴더 기본 제외에 추가)
+    "preview_cache_mb": 128,  # 렌더된 미리보기 캐시 크기 (0 = 끔)
+    "decode_cache_mb": 64,  # 미리 디코딩한 썸네일 캐시 크기
+    "prefetch_neighbors": 2,  # 선택한 파일 앞뒤로 미리 디코딩할 파일 수
+    "preview_priority": True,  # 배치 중 미리보기 우선 (워커 낮은 우선순위 + 조작 중 작업 투입 보류)
+    "preview_debug": False,  # 미리보기 지연 p50/p95 오버레이 + ~/.image_setakgi/preview_latency.jsonl 기록
 }
 
 
@@ -1,5 +1,15 @@
 import piexif
 
+# 입력으로 받는 이미지 확장자
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp", ".bmp"}
+
+# 미리보기(썸네일) 최대 변 길이 - 자유변형 코너 좌표의 기준 해상도
+MAX_PREVIEW_SIZE = 512
+
+# 미리보기 렌더 해상도 단계 (긴 변) - 뷰 크기 x 화면 배율에 맞는 가장 작은 단계로 렌더
+# 좌표는 항상 MAX_PREVIEW_SIZE 기준, 다른 단계는 옵션을 비율대로 바꿔 렌더한 뒤 QPixmap 배율로 표시
+PREVIEW_LEVELS = (256, 512, 1024, 2048)
+
 # Windows 속성 "자세히" 탭 매핑:
 # - JPG: Windows 'Date taken' = EXIF DateTimeOriginal
 # - PNG: Windows 'Date taken' = PNG tEXt chunk 'Creation Time'
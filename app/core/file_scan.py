@@ -0,0 +1,99 @@
+"""입력 이미지 폴더 검색 (os.scandir, 하위 폴더 재귀)
+
+- 폴더마다 이름순으로 파일 먼저, 그 다음 하위 폴더 (깊이 우선) → 찾는 대로 바로 내보냄
+- include: 파일 이름 패턴 (기본 이미지 확장자), exclude: 파일/폴더 이름 패턴, exclude_dirs: 폴더 이름 패턴
+- 숨김 파일/폴더(저장 중 임시 파일 포함), NAS 메타데이터 폴더는 기본 제외
+- 이 앱의 출력 폴더(입력 폴더 안에 생김)는 폴더에만 적용 → output_001.jpg, 회전샷.jpg 같은 파일은 포함
+- 네트워크 드라이브에서 오래 걸리므로 cancel_event로 폴더 사이에서 중단
+"""
+import fnmatch
+import os
+from typing import Callable, Iterable, Iterator, Optional
+
+from .cancellation import CancelEvent
+from .constants import IMAGE_EXTENSIONS
+
+DEFAULT_MAX_DEPTH = 8  # 지정한 폴더 = 0
+DEFAULT_INCLUDE = tuple(sorted(f"*{ext}" for ext in IMAGE_EXTENSIONS))
+DEFAULT_EXCLUDE = (
+    ".*",  # 숨김 파일/폴더, 저장 중 임시 파일(.이름.partial.jpg)
+    "@eaDir",  # Synology 썸네일
+    "#recycle",
+    "$RECYCLE.BIN",
+    "System Volume Information",
+)
+# create_output_folder가 만드는 출력 폴더 - 폴더에만 적용
+# 옵션 없는 출력 폴더 "output"은 사용자 폴더 이름과 겹치므로 번호 붙은 것만 제외
+DEFAULT_EXCLUDE_DIRS = (
+    "output_[0-9]*",
+    "랜덤변환*",
+    "크롭*",
+    "회전*",
+    "밝기*",
+    "대비*",
+    "채도*",
+    "노이즈*",
+)
+
+
+def _matches(name: str, patterns: Iterable[str]) -> bool:
+    name = name.lower()
+    return any(fnmatch.fnmatchcase(name, pattern.lower()) for pattern in patterns)
+
+
+def scan_files(
+    roots: Iterable[str],
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    include: Iterable[str] = DEFAULT_INCLUDE,
+    exclude: Iterable[str] = DEFAULT_EXCLUDE,
+    exclude_dirs: Iterable[str] = DEFAULT_EXCLUDE_DIRS,
+    cancel_event: Optional[CancelEvent] = None,
+    on_dir: Optional[Callable[[str], None]] = None,
+) -> Iterator[str]:
+    """roots(파일/폴더) 아래 이미지 파일 경로를 찾는 대로 반환
+
+    roots에 직접 지정한 파일은 확장자만 확인 (exclude 무시).
+    on_dir(path): 폴더 1개를 읽을 때마다 호출 (진행 표시용)
+    """
+    include = tuple(include) or DEFAULT_INCLUDE
+    exclude = tuple(exclude)
+    exclude_dirs = tuple(exclude_dirs)
+
+    for root in roots:
+        if cancel_event is not None and cancel_event.is_set():
+            return
+        if not os.path.isdir(root):
+            if os.path.splitext(root)[1].lower() in IMAGE_EXTENSIONS:
+                yield root
+            continue
+
+        # (경로, 깊이) - 이름순으로 방문하도록 역순으로 쌓음
+        stack = [(root, 0)]
+        while stack:
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            current, depth = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                # 권한 없음/동기화 중 사라진 폴더는 건너뜀
+                continue
+            if on_dir is not None:
+                on_dir(current)
+
+            subdirs = []
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if _matches(entry.name, exclude):
+                    continue
+                if is_dir:
+                    if depth < max_depth and not _matches(entry.name, exclude_dirs):
+                        subdirs.append(entry.path)
+                elif _matches(entry.name, include) and entry.is_file():
+                    yield entry.path
+
+            stack.extend((path, depth + 1) for path in reversed(subdirs))
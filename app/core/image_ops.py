@@ -1,9 +1,25 @@
+"""이미지 변환 함수
+
+numpy/cv2는 import 비용이 커서(앱 시작 시간의 약 1/4) 사용하는 함수 안에서 가져온다.
+GUI는 창을 띄운 뒤 app.core.startup.preload_heavy_modules()로 미리 로드한다.
+"""
 import math
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from PIL import Image, ImageEnhance, ImageStat
+
+from .cancellation import CancelEvent, check_cancelled
+from .stage_timing import stage
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def fit_size(w: int, h: int, max_size: int) -> tuple[int, int]:
+    """max_size 안에 들어가도록 비율 유지 축소한 크기 (확대하지 않음)"""
+    ratio = min(max_size / w, max_size / h, 1.0)
+    return int(w * ratio), int(h * ratio)
 
-import numpy as np
-from PIL import Image, ImageEnhance
-import cv2
 
 def get_inscribed_rect_size(orig_w: int, orig_h: int, angle_deg: float) -> tuple[int, int]:
     """회전 후 빈 공간 없이 추출 가능한 최대 직사각형 크기 (원본 비율 유지)"""
@@ -38,7 +54,11 @@ def get_inscribed_rect_size(orig_w: int, orig_h: int, angle_deg: float) -> tuple
     return int(new_w), int(new_h)
 
 
-def rotate_and_crop(img: Image.Image, angle: float) -> Image.Image:
+def rotate_and_crop(
+    img: Image.Image,
+    angle: float,
+    resample: Image.Resampling = Image.Resampling.BICUBIC,
+) -> Image.Image:
     """회전 후 빈 공간 없이 중앙 크롭"""
     if angle == 0:
         return img.copy()
@@ -46,7 +66,7 @@ def rotate_and_crop(img: Image.Image, angle: float) -> Image.Image:
     orig_w, orig_h = img.size
 
     # 회전 (expand=True로 전체 이미지 보존)
-    rotated = img.rotate(-angle, expand=True, resample=Image.Resampling.BICUBIC)
+    rotated = img.rotate(-angle, expand=True, resample=resample)
     rot_w, rot_h = rotated.size
 
     # 내접 직사각형 크기 계산
@@ -181,65 +201,131 @@ def add_noise(img: Image.Image, intensity: float) -> Image.Image:
     if intensity == 0:
         return img.copy()
 
+    import numpy as np
+
     arr = np.array(img, dtype=np.float32)
     noise = np.random.normal(0, intensity, arr.shape)
     noisy = np.clip(arr + noise, 0, 255).astype(np.uint8)
     return Image.fromarray(noisy)
 
 
-def apply_transforms(
+def apply_geometry(
     img: Image.Image,
     rotation: float = 0.0,
-    brightness: int = 0,
-    contrast: int = 0,
-    saturation: int = 0,
-    noise: float = 0,
     perspective_corners: Optional[List[Tuple[float, float]]] = None,
     crop: Optional[dict] = None,
+    cancel_event: Optional[CancelEvent] = None,
+    resample: Image.Resampling = Image.Resampling.BICUBIC,
 ) -> Image.Image:
-    """이미지 변환 적용
-
-    노이즈는 저장 시점(crop_background 후)에 적용됨
-    → noise 값은 result.info["noise"]에 저장
-    """
+    """기하 단계: RGB/RGBA 변환 → 크롭 → 원근 → 회전 (항상 새 이미지 반환)"""
     result = img.copy()
-    orig_size = None
 
     if result.mode not in ("RGB", "RGBA"):
         result = result.convert("RGB")
 
     if crop:
-        result = crop_edges(
-            result,
-            top=crop.get("top", 0),
-            bottom=crop.get("bottom", 0),
-            left=crop.get("left", 0),
-            right=crop.get("right", 0),
-        )
+        with stage("crop"):
+            result = crop_edges(
+                result,
+                top=crop.get("top", 0),
+                bottom=crop.get("bottom", 0),
+                left=crop.get("left", 0),
+                right=crop.get("right", 0),
+            )
+        check_cancelled(cancel_event)
 
     if perspective_corners and len(perspective_corners) == 4:
-        result = perspective_transform(result, perspective_corners)
+        with stage("perspective"):
+            result = perspective_transform(result, perspective_corners, resample)
+        check_cancelled(cancel_event)
 
     if rotation != 0:
-        result = rotate_and_crop(result, rotation)
+        with stage("rotate"):
+            result = rotate_and_crop(result, rotation, resample)
         result.info["rotation"] = rotation  # 저장 시 내접 크롭용
+        check_cancelled(cancel_event)
 
-    if brightness != 0:
-        result = adjust_brightness(result, brightness)
+    return result
+
+
+def apply_color(img: Image.Image, brightness: int = 0, contrast: int = 0, saturation: int = 0) -> Image.Image:
+    """색상 단계: 밝기 → 대비 → 채도 (모두 0이면 그대로 반환)"""
+    if brightness == 0 and contrast == 0 and saturation == 0:
+        return img
+
+    with stage("color"):
+        if brightness != 0:
+            img = adjust_brightness(img, brightness)
+
+        if contrast != 0:
+            img = adjust_contrast(img, contrast)
+
+        if saturation != 0:
+            img = adjust_saturation(img, saturation)
+    return img
+
+
+def _blend_lut(base: int, factor: float) -> "np.ndarray":
+    """Image.blend(단색 base, img, factor)와 같은 값의 256단계 LUT (Pillow처럼 float32 계산 후 버림)"""
+    import numpy as np
+
+    values = np.arange(256, dtype=np.float32)
+    base32 = np.float32(base)
+    return np.clip(base32 + np.float32(factor) * (values - base32), 0, 255).astype(np.uint8)
 
+
+def luminance_mean(img: Image.Image) -> int:
+    """ImageEnhance.Contrast가 쓰는 회색 기준값 (L 평균 반올림)"""
+    return int(ImageStat.Stat(img.convert("L")).mean[0] + 0.5)
+
+
+def tone_lut(brightness: int, contrast: int, mean: int = 0) -> list[int]:
+    """adjust_brightness → adjust_contrast와 같은 결과의 채널 공통 LUT
+
+    mean: 밝기 적용 후 이미지의 luminance_mean (contrast가 0이면 무시)
+    """
+    import numpy as np
+
+    lut = np.arange(256, dtype=np.uint8)
+    if brightness != 0:
+        lut = _blend_lut(0, 1 + brightness / 100)[lut]
     if contrast != 0:
-        result = adjust_contrast(result, contrast)
+        lut = _blend_lut(mean, 1 + contrast / 100)[lut]
+    return lut.tolist()
+
+
+def apply_tone_lut(img: Image.Image, lut: list[int]) -> Image.Image:
+    """RGB 채널에 LUT 적용 (알파는 유지), point() 1번"""
+    identity = list(range(256))
+    return img.point(lut * 3 + (identity if img.mode == "RGBA" else []))
+
+
+def apply_transforms(
+    img: Image.Image,
+    rotation: float = 0.0,
+    brightness: int = 0,
+    contrast: int = 0,
+    saturation: int = 0,
+    noise: float = 0,
+    perspective_corners: Optional[List[Tuple[float, float]]] = None,
+    crop: Optional[dict] = None,
+    cancel_event: Optional[CancelEvent] = None,
+    resample: Image.Resampling = Image.Resampling.BICUBIC,
+) -> Image.Image:
+    """이미지 변환 적용 (apply_geometry → apply_color)
 
-    if saturation != 0:
-        result = adjust_saturation(result, saturation)
+    노이즈는 저장 시점(crop_background 후)에 적용됨
+    → noise 값은 result.info["noise"]에 저장
+    cancel_event가 설정되면 단계 사이에서 TaskCancelled 발생
+    resample: 원근/회전 보간 (미리보기 저해상도 단계는 BILINEAR)
+    """
+    result = apply_geometry(img, rotation, perspective_corners, crop, cancel_event, resample)
+    result = apply_color(result, brightness, contrast, saturation)
 
     # 노이즈는 crop_background 후에 적용하기 위해 info에 저장
     if noise > 0:
         result.info["noise"] = noise
 
-    if orig_size:
-        result.info["orig_size"] = orig_size
-
     return result
 
 
@@ -248,6 +334,8 @@ def find_perspective_coeffs(
     target_coords: List[Tuple[float, float]]
 ) -> Optional[Tuple]:
     """원근 변환 계수 계산. 특이 행렬이면 None 반환."""
+    import numpy as np
+
     try:
         matrix = []
         for s, t in zip(source_coords, target_coords):
@@ -265,7 +353,8 @@ def find_perspective_coeffs(
 
 def perspective_transform(
     img: Image.Image,
-    corners: List[Tuple[float, float]]
+    corners: List[Tuple[float, float]],
+    resample: Image.Resampling = Image.Resampling.BICUBIC,
 ) -> Image.Image:
     """원근 변형 후 빈 공간 없이 중앙 크롭"""
     if len(corners) != 4:
@@ -306,7 +395,7 @@ def perspective_transform(
         (output_w, output_h),
         Image.Transform.PERSPECTIVE,
         coeffs,
-        Image.Resampling.BICUBIC,
+        resample,
         fillcolor=(0, 0, 0, 0)
     )
 
@@ -317,9 +406,11 @@ def perspective_transform(
 
 
 def _detect_bg_color(
-    np_img: np.ndarray, sample_size: int = 10, white_thresh: int = 200
+    np_img: "np.ndarray", sample_size: int = 10, white_thresh: int = 200
 ) -> str:
     """모서리 샘플링으로 배경색 자동 감지 (white/black)"""
+    import numpy as np
+
     try:
         import cv2
     except ImportError:
@@ -363,6 +454,8 @@ def crop_background(
     - min_area: 전경 영역이 이보다 작으면 크롭하지 않음
     - morph_kernel: 노이즈 제거용 모폴로지 커널 크기
     """
+    import cv2
+    import numpy as np
 
     np_img = np.array(img.convert("RGB"))
     h, w = np_img.shape[:2]
@@ -420,6 +513,8 @@ def crop_transparent(img: Image.Image, min_alpha: int = 10) -> Image.Image:
     if img.mode != "RGBA":
         return img
 
+    import numpy as np
+
     alpha = np.array(img.split()[3])
     h, w = alpha.shape
     opaque = alpha >= min_alpha
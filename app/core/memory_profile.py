@@ -0,0 +1,269 @@
+"""배치 워커 메모리 프로파일링 (옵트인)
+
+대형 이미지에서 어느 단계가 메모리를 많이 쓰는지 확인하기 위한 모드.
+stage_timing의 stage() 경계마다 다음을 기록한다.
+
+- RSS 최고치: Linux는 /proc/self/clear_refs로 단계마다 최고치(VmHWM)를 초기화해 정확히 측정,
+  그 외 플랫폼은 백그라운드 스레드가 RSS를 짧은 간격으로 샘플링
+- tracemalloc 최고치: Python/NumPy 배열 할당 (Pillow 내부 버퍼는 RSS에만 잡힘)
+
+단계 값은 "단계 시작 시점 대비 추가로 늘어난 양"이다. 이미 해제된 메모리를
+할당자가 재사용하면 RSS 증가로 보이지 않으므로 실제보다 작게 잡힐 수 있다.
+코디네이터는 MemoryStats로 모아 단계별 바이트/MP, 최악 파일, 안전 워커 수를 보고한다.
+"""
+import multiprocessing as mp
+import os
+import platform
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from time import perf_counter
+from typing import Optional
+
+from .scheduler import DEFAULT_BUDGET_RATIO, STAGE_BYTES_PER_PIXEL, format_mb, get_available_memory
+from .stage_timing import STAGE_ORDER, StageTimer
+
+# RSS 최고치를 초기화할 수 없는 플랫폼의 샘플링 간격 (초)
+PEAK_SAMPLE_INTERVAL = 0.002
+
+WORST_FILES = 5
+
+_IS_LINUX = platform.system() == "Linux"
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def read_rss() -> Optional[int]:
+    """현재 프로세스 RSS (바이트)"""
+    if _IS_LINUX:
+        try:
+            with open("/proc/self/statm", "r") as f:
+                return int(f.read().split()[1]) * _PAGE_SIZE
+        except (OSError, ValueError, IndexError):
+            pass
+    try:
+        import psutil
+
+        return int(psutil.Process().memory_info().rss)
+    except ImportError:
+        return None
+
+
+def read_peak_rss() -> Optional[int]:
+    """RSS 최고치 (Linux: 마지막 reset_peak_rss 이후, 그 외: 프로세스 시작 이후)"""
+    if _IS_LINUX:
+        try:
+            with open("/proc/self/status", "r") as f:
+                for line in f:
+                    if line.startswith("VmHWM:"):
+                        return int(line.split()[1]) * 1024
+        except OSError:
+            pass
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS는 바이트, Linux는 KB
+        return peak if platform.system() == "Darwin" else peak * 1024
+    except ImportError:
+        return None
+
+
+def reset_peak_rss() -> bool:
+    """RSS 최고치를 현재 값으로 초기화 (Linux 전용), 성공 여부 반환"""
+    if not _IS_LINUX:
+        return False
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+class _RssSampler:
+    """단계 실행 중 RSS 최고치 샘플링 (최고치 초기화가 안 되는 플랫폼용)"""
+
+    def __init__(self):
+        self.peak = read_rss() or 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(PEAK_SAMPLE_INTERVAL):
+            self.peak = max(self.peak, read_rss() or 0)
+
+    def stop(self) -> int:
+        self._stop.set()
+        self._thread.join()
+        return max(self.peak, read_rss() or 0)
+
+
+class MemoryStageTimer(StageTimer):
+    """단계별 시간 + 메모리 최고치 기록 (이미지 1장)"""
+
+    def __init__(self, megapixels: float = 0.0):
+        super().__init__()
+        self.megapixels = megapixels
+        self.stages: dict[str, dict] = {}
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._resettable = reset_peak_rss()
+        self.baseline_rss = read_rss() or 0
+        self.peak_rss = self.baseline_rss
+        self._py_base = tracemalloc.get_traced_memory()[0]
+        self.py_peak = 0
+
+    @contextmanager
+    def measure(self, name: str):
+        rss_start = read_rss() or 0
+        py_start = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        sampler = None if self._resettable and reset_peak_rss() else _RssSampler()
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, perf_counter() - start, start)
+            peak = sampler.stop() if sampler else (read_peak_rss() or 0)
+            peak = max(peak, rss_start)
+            py_peak = tracemalloc.get_traced_memory()[1]
+
+            record = self.stages.setdefault(name, {"rss_delta": 0, "py_delta": 0})
+            record["rss_delta"] = max(record["rss_delta"], peak - rss_start)
+            record["py_delta"] = max(record["py_delta"], py_peak - py_start)
+            self.peak_rss = max(self.peak_rss, peak)
+            self.py_peak = max(self.py_peak, py_peak - self._py_base)
+
+    def report(self) -> dict:
+        return {
+            "megapixels": self.megapixels,
+            "baseline_rss": self.baseline_rss,
+            "peak_rss": self.peak_rss,
+            "py_peak": self.py_peak,
+            "stages": self.stages,
+        }
+
+
+class MemoryStats:
+    """배치 전체의 메모리 프로파일 (코디네이터 측 집계)"""
+
+    def __init__(self):
+        self.reports: list[tuple[str, dict]] = []
+
+    def add(self, filepath: str, report: Optional[dict]):
+        if report:
+            self.reports.append((filepath, report))
+
+    @property
+    def images(self) -> int:
+        return len(self.reports)
+
+    def stage_bytes_per_mp(self) -> dict[str, dict]:
+        """단계별 추가 RSS / tracemalloc 최고치 (원본 메가픽셀당 바이트, 최대/평균)"""
+        values: dict[str, list[tuple[float, float]]] = {}
+        for _, report in self.reports:
+            mp_ = report["megapixels"]
+            if mp_ <= 0:
+                continue
+            for name, record in report["stages"].items():
+                values.setdefault(name, []).append(
+                    (record["rss_delta"] / mp_, record["py_delta"] / mp_)
+                )
+
+        order = {name: i for i, name in enumerate(STAGE_ORDER)}
+        result = {}
+        for name in sorted(values, key=lambda n: (order.get(n, len(order)), n)):
+            rss = [v[0] for v in values[name]]
+            py = [v[1] for v in values[name]]
+            result[name] = {
+                "rss_max": int(max(rss)),
+                "rss_mean": int(sum(rss) / len(rss)),
+                "py_max": int(max(py)),
+                "model": STAGE_BYTES_PER_PIXEL.get(name, 0) * 1_000_000,
+            }
+        return result
+
+    def worst(self, limit: int = WORST_FILES) -> list[dict]:
+        """이미지 1장 처리 중 RSS 증가가 가장 큰 파일"""
+        rows = []
+        for filepath, report in self.reports:
+            stages = report["stages"]
+            worst_stage = max(stages, key=lambda n: stages[n]["rss_delta"]) if stages else None
+            rows.append(
+                {
+                    "file": filepath,
+                    "megapixels": round(report["megapixels"], 2),
+                    "peak_rss": report["peak_rss"],
+                    "working_set": report["peak_rss"] - report["baseline_rss"],
+                    "worst_stage": worst_stage,
+                }
+            )
+        rows.sort(key=lambda r: r["working_set"], reverse=True)
+        return rows[:limit]
+
+    def suggest_workers(self, available: Optional[int] = None) -> Optional[dict]:
+        """측정된 바이트/MP와 가용 메모리로 계산한 안전 워커 수
+
+        워커 1개 최대 메모리 = 유휴 워커 RSS + (이미지 처리 중 증가량 / MP) 최대값 × 배치 최대 MP
+        """
+        if not self.reports:
+            return None
+        available = available if available is not None else get_available_memory()
+        if not available:
+            return None
+
+        # 유휴 워커 RSS: 할당자가 붙잡고 있는 메모리를 중복 계산하지 않도록 최소값 사용
+        baseline = min(r["baseline_rss"] for _, r in self.reports)
+        max_mp = max(r["megapixels"] for _, r in self.reports)
+        per_mp = max(
+            (r["peak_rss"] - r["baseline_rss"]) / r["megapixels"]
+            for _, r in self.reports
+            if r["megapixels"] > 0
+        ) if max_mp > 0 else 0
+        per_worker = int(baseline + per_mp * max_mp)
+        usable = int(available * DEFAULT_BUDGET_RATIO)
+        memory_limit = usable // per_worker if per_worker else mp.cpu_count()
+        return {
+            "workers": max(1, min(mp.cpu_count(), memory_limit)),
+            "memory_limit": memory_limit,
+            "cpu_count": mp.cpu_count(),
+            "per_worker_bytes": per_worker,
+            "available_bytes": available,
+            "usable_bytes": usable,
+            "max_megapixels": round(max_mp, 2),
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "images": self.images,
+            "stage_bytes_per_mp": self.stage_bytes_per_mp(),
+            "worst": self.worst(),
+            "suggestion": self.suggest_workers(),
+        }
+
+    def summary_lines(self) -> list[str]:
+        if not self.reports:
+            return []
+        lines = [f"단계별 메모리 ({self.images}장, 원본 MP당 추가 RSS 최대/평균, NumPy·Python 최대, 모델 추정)"]
+        for name, row in self.stage_bytes_per_mp().items():
+            lines.append(
+                f"  {name:<16} {format_mb(row['rss_max']):>7}/{format_mb(row['rss_mean']):>7}  "
+                f"py {format_mb(row['py_max']):>7}  모델 {format_mb(row['model']):>6}"
+            )
+        lines.append("메모리 사용이 큰 파일")
+        for row in self.worst():
+            lines.append(
+                f"  {Path(row['file']).name} ({row['megapixels']}MP): 최고 {format_mb(row['peak_rss'])}, "
+                f"처리 중 +{format_mb(row['working_set'])} (최대 단계: {row['worst_stage']})"
+            )
+        suggestion = self.suggest_workers()
+        if suggestion:
+            lines.append(
+                f"권장 워커 수: {suggestion['workers']}개 (메모리 기준 {suggestion['memory_limit']}개, "
+                f"CPU {suggestion['cpu_count']}개 / 워커당 최대 {format_mb(suggestion['per_worker_bytes'])}, "
+                f"가용 {format_mb(suggestion['available_bytes'])}의 {int(DEFAULT_BUDGET_RATIO * 100)}% 기준, "
+                f"최대 {suggestion['max_megapixels']}MP)"
+            )
+        return lines
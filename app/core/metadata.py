@@ -1,3 +1,4 @@
+import io
 import os
 import platform
 import random
@@ -8,6 +9,7 @@ import piexif
 from PIL import Image
 
 from .constants import RANDOM_CAMERAS, READABLE_TAGS
+from .stage_timing import stage
 
 
 def read_exif(filepath: str) -> dict:
@@ -101,6 +103,23 @@ def save_with_exif(
         img.save(output_path, quality=quality)
 
 
+def _encode_and_write(img: Image.Image, output_path: str, image_format: str, **save_kwargs):
+    """메모리에 인코딩 후 파일에 기록 (encode/write 단계 시간 분리 계측용)"""
+    with stage("encode"):
+        buffer = io.BytesIO()
+        img.save(buffer, image_format, **save_kwargs)
+    with stage("write"):
+        with open(output_path, "wb") as f:
+            f.write(buffer.getbuffer())
+
+
+def _apply_file_times(output_path: str, metadata_overrides: dict):
+    dt_str = metadata_overrides.get("DateTimeOriginal") or metadata_overrides.get("datetime", "")
+    if dt_str:
+        with stage("set_file_times"):
+            set_file_times(output_path, dt_str)
+
+
 def save_jpeg_with_metadata(
     img: Image.Image,
     output_path: str,
@@ -122,13 +141,10 @@ def save_jpeg_with_metadata(
 
     if metadata_overrides is not None and len(metadata_overrides) > 0:
         exif_bytes = create_exif_bytes(metadata_overrides)
-        img.save(output_path, quality=quality, optimize=True, exif=exif_bytes)
-
-        dt_str = metadata_overrides.get("DateTimeOriginal") or metadata_overrides.get("datetime", "")
-        if dt_str:
-            set_file_times(output_path, dt_str)
+        _encode_and_write(img, output_path, "JPEG", quality=quality, optimize=True, exif=exif_bytes)
+        _apply_file_times(output_path, metadata_overrides)
     else:
-        img.save(output_path, quality=quality, optimize=True)
+        _encode_and_write(img, output_path, "JPEG", quality=quality, optimize=True)
 
 
 def save_webp_with_metadata(
@@ -161,14 +177,12 @@ def save_webp_with_metadata(
         except Exception:
             pass  # EXIF 실패해도 저장은 계속
 
-        img.save(output_path, "WEBP", **save_kwargs)
+        _encode_and_write(img, output_path, "WEBP", **save_kwargs)
 
         # 파일 시스템 타임스탬프 변경 (Windows 탐색기 날짜 표시용)
-        dt_str = metadata_overrides.get("DateTimeOriginal") or metadata_overrides.get("datetime", "")
-        if dt_str:
-            set_file_times(output_path, dt_str)
+        _apply_file_times(output_path, metadata_overrides)
     else:
-        img.save(output_path, "WEBP", **save_kwargs)
+        _encode_and_write(img, output_path, "WEBP", **save_kwargs)
 
 
 def set_file_times(filepath: str, datetime_str: str):
@@ -0,0 +1,104 @@
+"""단일 이미지 처리 파이프라인 (배치/랜덤 워커 공용)
+
+로드 → EXIF 회전 → 변형 → EXIF 처리 → 저장
+각 단계 사이에서 취소 요청을 확인한다.
+"""
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from PIL import Image, ImageOps
+
+from .cancellation import CancelEvent, check_cancelled
+from .image_ops import apply_transforms
+from .metadata import remove_exif
+from .save_output import save_transformed_image
+from .stage_timing import stage
+
+
+def scale_perspective_corners(
+    corners: list,
+    image_size: tuple[int, int],
+    thumb_size: tuple[int, int],
+) -> list[tuple[float, float]]:
+    """미리보기(썸네일) 좌표의 원근 코너를 원본 좌표로 스케일링"""
+    orig_w, orig_h = image_size
+    thumb_w, thumb_h = thumb_size
+    scale_x = orig_w / thumb_w
+    scale_y = orig_h / thumb_h
+    return [(x * scale_x, y * scale_y) for x, y in corners]
+
+
+def build_metadata_overrides(exif_opts: dict) -> Optional[dict]:
+    """EXIF 옵션 → 저장용 메타데이터 (DateTimeOriginal = Windows 촬영날짜)"""
+    if exif_opts.get("remove_all") or not exif_opts.get("override"):
+        return None
+
+    # datetime이 없으면 현재 시간 사용
+    datetime_val = exif_opts.get("datetime", "")
+    if not datetime_val:
+        datetime_val = datetime.now().strftime("%Y:%m:%d %H:%M:%S")
+    return {"DateTimeOriginal": datetime_val}
+
+
+def process_image_file(
+    filepath: str,
+    options: dict,
+    output_dir: Path,
+    output_format: str = "jpeg",
+    cancel_event: Optional[CancelEvent] = None,
+    quality: Optional[int] = None,
+) -> Path:
+    """이미지 1장 변환 후 저장, 저장 경로 반환
+
+    취소 요청 시 TaskCancelled 발생 (부분 출력 파일은 남기지 않음)
+    단계별 시간은 활성 StageTimer가 있을 때만 기록 (stage_timing 참고)
+    quality가 None이면 포맷별 기본 품질 사용
+    """
+    with stage("decode"):
+        img = Image.open(filepath)
+        img.load()
+    check_cancelled(cancel_event)
+
+    # EXIF Orientation 태그에 따라 이미지 자동 회전
+    with stage("exif_transpose"):
+        img = ImageOps.exif_transpose(img) if img else img
+    check_cancelled(cancel_event)
+
+    perspective_corners = None
+    if options.get("perspective_corners"):
+        orig_w, orig_h = img.size
+        perspective_corners = scale_perspective_corners(
+            options["perspective_corners"],
+            (orig_w, orig_h),
+            (options.get("thumb_w", orig_w), options.get("thumb_h", orig_h)),
+        )
+
+    result = apply_transforms(
+        img,
+        rotation=options.get("rotation", 0),
+        brightness=options.get("brightness", 0),
+        contrast=options.get("contrast", 0),
+        saturation=options.get("saturation", 0),
+        noise=options.get("noise", 0),
+        perspective_corners=perspective_corners,
+        crop=options.get("crop"),
+        cancel_event=cancel_event,
+    )
+
+    exif_opts = options.get("exif", {})
+    metadata_overrides = build_metadata_overrides(exif_opts)
+    if exif_opts.get("remove_all") or metadata_overrides:
+        with stage("exif_strip"):
+            result = remove_exif(result)
+    check_cancelled(cancel_event)
+
+    return save_transformed_image(
+        result,
+        output_dir,
+        Path(filepath).name,
+        metadata_overrides,
+        output_format,
+        cancel_event=cancel_event,
+        quality=quality,
+    )
@@ -1,12 +1,22 @@
-from PIL import Image
-from PySide6.QtCore import QThread, Signal, QObject
-from PySide6.QtGui import QImage, QPixmap
-from typing import Optional
+from PIL import Image, ImageOps
+from PySide6.QtCore import QThread, Signal, QObject, QPointF
+from PySide6.QtGui import QImage, QPixmap, QPolygonF, QTransform
+from time import perf_counter
+from typing import NamedTuple, Optional
 import io
 
-from .image_ops import apply_transforms
-
-MAX_PREVIEW_SIZE = 512
+from .constants import MAX_PREVIEW_SIZE, PREVIEW_LEVELS
+from .image_ops import (
+    adjust_saturation,
+    apply_geometry,
+    apply_tone_lut,
+    fit_size,
+    get_inscribed_rect_size,
+    luminance_mean,
+    tone_lut,
+)
+from .preview_cache import file_identity, options_fingerprint
+from .preview_latency import RenderTiming
 
 
 def create_thumbnail(img: Image.Image, max_size: int = MAX_PREVIEW_SIZE) -> Image.Image:
@@ -14,84 +24,401 @@ def create_thumbnail(img: Image.Image, max_size: int = MAX_PREVIEW_SIZE) -> Imag
     if w <= max_size and h <= max_size:
         return img.copy()
 
-    ratio = min(max_size / w, max_size / h)
-    new_w = int(w * ratio)
-    new_h = int(h * ratio)
-    return img.resize((new_w, new_h), Image.Resampling.LANCZOS)
+    return img.resize(fit_size(w, h, max_size), Image.Resampling.LANCZOS)
 
 
-def pil_to_qpixmap(img: Image.Image) -> QPixmap:
-    if img.mode == "RGBA":
-        qformat = QImage.Format.Format_RGBA8888
-        bytes_per_pixel = 4
-    else:
+class DecodedPreview(NamedTuple):
+    """미리보기 해상도로 디코딩한 파일"""
+    path: str
+    identity: tuple  # preview_cache.file_identity
+    original_size: tuple[int, int]  # EXIF 방향 반영
+    thumbnail: Image.Image
+
+
+def decode_preview(path: str, max_size: int = MAX_PREVIEW_SIZE) -> DecodedPreview:
+    """미리보기용 디코딩 - JPEG은 draft(DCT 축소 디코딩)로 전체 해상도를 풀지 않음
+
+    썸네일 크기는 전체 디코딩 후 create_thumbnail(img, max_size)한 결과와 같음.
+    max_size는 뷰에 필요한 렌더 단계 (PREVIEW_LEVELS), 좌표 기준 크기는 PreviewRenderer가 original_size로 계산
+    """
+    identity = file_identity(path)
+    with Image.open(path) as img:
+        w, h = img.size
+        orientation = img.getexif().get(0x0112, 1)
+        img.draft(None, fit_size(w, h, max_size))
+        img = ImageOps.exif_transpose(img)
+    original_size = (h, w) if orientation in (5, 6, 7, 8) else (w, h)
+    target = fit_size(*original_size, max_size)
+    if img.size != target:
+        img = img.resize(target, Image.Resampling.LANCZOS)
+    return DecodedPreview(path, identity, original_size, img)
+
+
+# PIL 모드 → (tobytes rawmode, QImage 형식), 모두 픽셀당 4바이트
+# PIL은 RGB도 내부적으로 픽셀당 4바이트로 저장하므로 RGBX 패킹은 줄 단위 복사에 가깝다
+_QIMAGE_LAYOUTS = {
+    "RGB": ("RGBX", QImage.Format.Format_RGBX8888),
+    "RGBX": ("RGBX", QImage.Format.Format_RGBX8888),
+    "RGBA": ("RGBA", QImage.Format.Format_RGBA8888),
+}
+
+
+def pil_to_qimage(img: Image.Image) -> QImage:
+    """PIL 이미지 → QImage (버퍼 복사는 tobytes 1번)
+
+    QImage는 bytes를 복사하지 않고 감싼다. PySide6가 QImage(및 데이터를 공유하는 QPixmap)가
+    살아 있는 동안 bytes 참조를 유지하므로 별도 copy()가 필요 없다.
+    """
+    layout = _QIMAGE_LAYOUTS.get(img.mode)
+    if layout is None:
         img = img.convert("RGB")
-        qformat = QImage.Format.Format_RGB888
-        bytes_per_pixel = 3
+        layout = _QIMAGE_LAYOUTS["RGB"]
+    rawmode, qformat = layout
+    data = img.tobytes("raw", rawmode)
+    return QImage(data, img.width, img.height, img.width * 4, qformat)
+
+
+def pil_to_qpixmap(img: Image.Image) -> QPixmap:
+    return QPixmap.fromImage(pil_to_qimage(img))
+
+
+# 미리보기 품질 단계: 조작 중에는 저해상도 빠른 렌더, 멈추면 고품질
+TIER_DRAFT = "draft"
+TIER_FULL = "full"
+DRAFT_REDUCE = 2  # 저해상도 단계 축소 배율 (512px → 256px)
+PREVIEW_IDLE_MS = 150  # 마지막 조작 후 고품질 렌더까지 대기
+# 필요한 픽셀보다 이 배율 이내로 작은 단계는 그대로 사용 (살짝 확대는 티가 나지 않고 렌더는 1/4)
+LEVEL_UPSCALE_TOLERANCE = 1.25
+
+
+def preview_level_for(pixels: float) -> int:
+    """긴 변 pixels 디바이스 픽셀을 덮는 가장 작은 렌더 단계"""
+    for level in PREVIEW_LEVELS:
+        if level * LEVEL_UPSCALE_TOLERANCE >= pixels:
+            return level
+    return PREVIEW_LEVELS[-1]
+
+
+def _scale_options(options: dict, scale: float) -> dict:
+    """썸네일 픽셀 기준 옵션(크롭/원근 코너)을 축소된 소스 기준으로 변환"""
+    scaled = dict(options)
+    crop = options.get("crop")
+    if crop:
+        scaled["crop"] = {key: int(round(value * scale)) for key, value in crop.items()}
+    corners = options.get("perspective_corners")
+    if corners:
+        scaled["perspective_corners"] = [(x * scale, y * scale) for x, y in corners]
+    return scaled
+
+
+# 픽셀 값을 바꾸는 옵션 - 이 값이 같으면 기하(크롭/원근/회전) 차이는 QTransform으로 대신 그릴 수 있다
+APPEARANCE_KEYS = ("brightness", "contrast", "saturation", "noise")
+
+
+def _quad(points) -> QPolygonF:
+    return QPolygonF([QPointF(x, y) for x, y in points])
+
+
+def frame_transform(options: dict, thumb_size: tuple[int, int]) -> tuple[QTransform, tuple[int, int]]:
+    """썸네일 좌표 → 렌더 결과 좌표 변환과 결과 크기
+
+    apply_transforms와 같은 순서(크롭 → 원근 → 회전 후 내접 크롭)를 좌표 계산으로만 따라간다.
+    """
+    w, h = thumb_size
+    transform = QTransform()
+
+    crop = options.get("crop") or {}
+    if any(crop.values()):
+        left, top = crop.get("left", 0), crop.get("top", 0)
+        transform *= QTransform.fromTranslate(-left, -top)
+        w = max(1, w - left - crop.get("right", 0))
+        h = max(1, h - top - crop.get("bottom", 0))
+
+    corners = options.get("perspective_corners")
+    if corners and len(corners) == 4:
+        xs = [x for x, _ in corners]
+        ys = [y for _, y in corners]
+        out_w, out_h = int(max(xs) - min(xs)), int(max(ys) - min(ys))
+        warp = QTransform.quadToQuad(_quad([(0, 0), (w, 0), (w, h), (0, h)]), _quad(corners))
+        # perspective_transform도 이 경우 원본을 그대로 돌려줌
+        if warp is not None and out_w > 0 and out_h > 0:
+            transform *= warp * QTransform.fromTranslate(-min(xs), -min(ys))
+            w, h = out_w, out_h
+
+    rotation = options.get("rotation", 0)
+    if rotation:
+        crop_w, crop_h = get_inscribed_rect_size(w, h, rotation)
+        transform *= (
+            QTransform.fromTranslate(-w / 2, -h / 2)
+            * QTransform().rotate(rotation)
+            * QTransform.fromTranslate(crop_w / 2, crop_h / 2)
+        )
+        w, h = crop_w, crop_h
+
+    return transform, (w, h)
+
+
+def proxy_transform(
+    displayed: dict, requested: dict, thumb_size: tuple[int, int]
+) -> Optional[tuple[QTransform, tuple[int, int]]]:
+    """displayed 옵션으로 렌더된 프레임을 requested 옵션의 기하로 옮기는 변환과 새 프레임 크기
+
+    밝기/대비/채도/노이즈가 다르거나 변환이 퇴화하면 None (다시 렌더해야 함)
+    """
+    if any(displayed.get(key, 0) != requested.get(key, 0) for key in APPEARANCE_KEYS):
+        return None
+    shown, _ = frame_transform(displayed, thumb_size)
+    target, size = frame_transform(requested, thumb_size)
+    inverted, ok = shown.inverted()
+    if not ok:
+        return None
+    return inverted * target, size
+
 
-    data = img.tobytes("raw", img.mode)
-    bytes_per_line = img.width * bytes_per_pixel
-    qimage = QImage(data, img.width, img.height, bytes_per_line, qformat)
-    return QPixmap.fromImage(qimage.copy())
+GEOMETRY_KEYS = ("crop", "perspective_corners", "rotation")
+
+
+class _Pyramid(NamedTuple):
+    """set_source가 한 번에 교체하는 소스 묶음 - 렌더는 시작할 때 1번 읽어 끝까지 사용"""
+    generation: int  # 단계 결과 키 (다른 소스의 결과와 섞이지 않도록)
+    source: Image.Image  # 디코딩된 이미지
+    full: Image.Image  # 좌표 기준 썸네일
+    levels: dict  # 단계 → 이미지
+
+
+class PreviewRenderer:
+    """미리보기 렌더러 - 해상도 단계(PREVIEW_LEVELS)별 이미지는 처음 쓸 때 1번만 만들고 재사용
+
+    - 좌표 기준: 512px 썸네일 (thumb_size, 크롭/원근 코너/배치 thumb_w·thumb_h)
+    - full: 요청한 단계 이미지에 BICUBIC 보간
+    - draft: 한 단계 아래 이미지에 BILINEAR 보간
+    기준과 다른 단계는 크롭/코너를 비율대로 바꿔 렌더하고, 표시 쪽은 render_scaled의 배율을
+    QPixmap devicePixelRatio로 써서 기준 좌표 크기로 그린다 (핸들 좌표 유지).
+
+    단계별 결과를 입력 키와 함께 1개씩 기억 (기하 → 밝기/대비 LUT → 채도):
+    밝기만 바꾸면 크롭/원근/회전은 다시 하지 않고, 대비/밝기 드래그는 LUT 1번(+채도)만 계산.
+    결과는 apply_transforms와 픽셀 단위로 같음.
+    """
+
+    def __init__(self):
+        # 렌더 스레드가 세대와 이미지를 한 번에 읽도록 튜플로 교체
+        self._pyramid: Optional[_Pyramid] = None
+        self._original_size: tuple[int, int] = (0, 0)
+        # 단계 이름 → (키, 결과). 키에 렌더 시작 때 읽은 소스 세대를 넣어 렌더 중 소스가 바뀌어도 섞이지 않음
+        self._stages: dict[str, tuple] = {}
+        self._generation = 0
+
+    def set_source(self, img: Optional[Image.Image], original_size: Optional[tuple[int, int]] = None):
+        """img: 원본 또는 미리보기용으로 줄여 디코딩한 이미지, original_size: 원본 크기 (기준 썸네일 크기 계산용)
+
+        같은 파일을 더 큰 해상도로 다시 디코딩해 넣어도 기준 썸네일 크기는 그대로 (코너 좌표 유지)
+        """
+        self._generation += 1
+        self._stages = {}
+        if img is None:
+            self._pyramid = None
+            return
+        self._original_size = original_size or img.size
+        thumb_size = fit_size(*self._original_size, MAX_PREVIEW_SIZE)
+        full = img.copy() if img.size == thumb_size else img.resize(thumb_size, Image.Resampling.LANCZOS)
+        self._pyramid = _Pyramid(self._generation, img, full, {MAX_PREVIEW_SIZE: full})
+
+    @property
+    def has_source(self) -> bool:
+        return self._pyramid is not None
+
+    @property
+    def thumb_size(self) -> tuple[int, int]:
+        """고품질 썸네일 크기 (원근 코너/크롭 좌표 기준)"""
+        pyramid = self._pyramid
+        return pyramid.full.size if pyramid is not None else (0, 0)
+
+    def level_for(self, pixels: float) -> int:
+        """pixels를 덮는 단계 (원본보다 큰 단계는 원본을 덮는 가장 작은 단계로)"""
+        level = preview_level_for(pixels)
+        longest = max(self._original_size)
+        return min(level, next((lv for lv in PREVIEW_LEVELS if lv >= longest), level))
+
+    def needs_larger_source(self, level: int) -> bool:
+        """level을 그리기에 디코딩된 이미지가 작은지 (원본이 더 크면 더 크게 다시 디코딩해야 함)"""
+        pyramid = self._pyramid
+        if pyramid is None:
+            return False
+        return max(pyramid.source.size) < min(level, max(self._original_size))
+
+    @staticmethod
+    def _resolve_level(tier: str, level: int) -> int:
+        if tier == TIER_DRAFT:
+            level = max(PREVIEW_LEVELS[0], level // DRAFT_REDUCE)
+        return level
+
+    @staticmethod
+    def _level_image(pyramid: _Pyramid, level: int) -> Image.Image:
+        _, source, full, levels = pyramid
+        img = levels.get(level)
+        if img is not None:
+            return img
+        if level < MAX_PREVIEW_SIZE:
+            reduce = MAX_PREVIEW_SIZE // level
+            img = full.reduce(reduce) if min(full.size) >= reduce * 16 else full
+        else:
+            # 디코딩된 이미지보다 큰 단계는 디코딩된 이미지 그대로 (확대하지 않음)
+            size = fit_size(*source.size, level)
+            if size[0] <= full.width:
+                img = full
+            elif size == source.size:
+                img = source
+            else:
+                img = source.resize(size, Image.Resampling.LANCZOS)
+        levels[level] = img
+        return img
+
+    def render(self, options: dict, tier: str = TIER_FULL, level: int = MAX_PREVIEW_SIZE) -> Image.Image:
+        return self.render_scaled(options, tier, level)[0]
+
+    def render_scaled(
+        self, options: dict, tier: str = TIER_FULL, level: int = MAX_PREVIEW_SIZE
+    ) -> tuple[Image.Image, float]:
+        """기준 좌표 옵션으로 level 단계 렌더 → (결과, 결과 픽셀 / 기준 좌표 배율)
+
+        배율은 QPixmap devicePixelRatio로 써서 결과를 기준 좌표 크기로 표시
+        """
+        pyramid = self._pyramid
+        if pyramid is None:
+            raise ValueError("No image loaded")
+        full = pyramid.full
+
+        level = self._resolve_level(tier, level)
+        source = self._level_image(pyramid, level)
+        scale = source.width / full.width
+        resample = Image.Resampling.BICUBIC
+        if source is not full:
+            options = _scale_options(options, scale)
+            if tier == TIER_DRAFT:
+                resample = Image.Resampling.BILINEAR
+        return self._render_stages(pyramid.generation, source, options, (tier, level), resample), scale
+
+    def has_geometry(self, options: dict, tier: str = TIER_FULL, level: int = MAX_PREVIEW_SIZE) -> bool:
+        """이 옵션의 기하 단계 결과가 남아 있는지 (색상만 바뀐 렌더는 저해상도 단계가 필요 없음)"""
+        pyramid = self._pyramid
+        cached = self._stages.get("geometry")
+        if pyramid is None or cached is None:
+            return False
+        key = (
+            pyramid.generation,
+            (tier, self._resolve_level(tier, level)),
+            options_fingerprint(options, GEOMETRY_KEYS),
+        )
+        return cached[0] == key
+
+    def _stage(self, name: str, key: tuple, compute):
+        cached = self._stages.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        value = compute()
+        self._stages[name] = (key, value)
+        return value
+
+    def _render_stages(
+        self, generation: int, source: Image.Image, options: dict, variant: tuple, resample
+    ) -> Image.Image:
+        brightness = options.get("brightness", 0)
+        contrast = options.get("contrast", 0)
+        saturation = options.get("saturation", 0)
+
+        key = (generation, variant, options_fingerprint(options, GEOMETRY_KEYS))
+        result = self._stage(
+            "geometry",
+            key,
+            lambda: apply_geometry(
+                source,
+                rotation=options.get("rotation", 0),
+                perspective_corners=options.get("perspective_corners"),
+                crop=options.get("crop"),
+                resample=resample,
+            ),
+        )
+
+        if brightness != 0 or contrast != 0:
+            geometry = result
+            mean = 0
+            if contrast != 0:
+                # 대비 기준값은 밝기 적용 후 평균 → 밝기가 같으면 재사용
+                mean = self._stage(
+                    "tone_mean",
+                    key + (brightness,),
+                    lambda: luminance_mean(apply_tone_lut(geometry, tone_lut(brightness, 0))),
+                )
+            key += (brightness, contrast)
+            result = self._stage(
+                "tone", key, lambda: apply_tone_lut(geometry, tone_lut(brightness, contrast, mean))
+            )
+
+        if saturation != 0:
+            toned = result
+            key += (saturation,)
+            result = self._stage("saturation", key, lambda: adjust_saturation(toned, saturation))
+        return result
 
 
 class PreviewWorker(QObject):
-    finished = Signal(QPixmap)
+    finished = Signal(QPixmap, str, object)  # pixmap, 품질 단계, RenderTiming
     error = Signal(str)
 
-    def __init__(self):
+    def __init__(self, renderer: Optional[PreviewRenderer] = None):
         super().__init__()
-        self._img: Optional[Image.Image] = None
+        self.renderer = renderer or PreviewRenderer()
         self._options: dict = {}
+        self._tier = TIER_FULL
+        self._level = MAX_PREVIEW_SIZE
 
-    def set_source(self, img: Image.Image):
-        self._img = create_thumbnail(img)
+    def set_source(self, img: Image.Image, original_size: Optional[tuple[int, int]] = None):
+        self.renderer.set_source(img, original_size)
 
-    def set_options(self, options: dict):
+    def set_options(self, options: dict, tier: str = TIER_FULL, level: int = MAX_PREVIEW_SIZE):
         self._options = options.copy()
+        self._tier = tier
+        self._level = level
 
     def process(self):
-        if self._img is None:
+        if not self.renderer.has_source:
             self.error.emit("No image loaded")
             return
 
         try:
-            perspective_corners = self._options.get("perspective_corners")
-            crop = self._options.get("crop")
-
-            result = apply_transforms(
-                self._img,
-                rotation=self._options.get("rotation", 0),
-                brightness=self._options.get("brightness", 0),
-                contrast=self._options.get("contrast", 0),
-                saturation=self._options.get("saturation", 0),
-                noise=self._options.get("noise", 0),
-                perspective_corners=perspective_corners,
-                crop=crop,
-            )
-
+            start = perf_counter()
+            result, scale = self.renderer.render_scaled(self._options, self._tier, self._level)
+            rendered = perf_counter()
             pixmap = pil_to_qpixmap(result)
-            self.finished.emit(pixmap)
+            # 기준 좌표(512px) 크기로 그려지도록 - 핸들/크롭 좌표는 단계와 무관
+            pixmap.setDevicePixelRatio(scale)
+            self.finished.emit(pixmap, self._tier, RenderTiming(start, rendered, perf_counter()))
 
         except Exception as e:
             self.error.emit(str(e))
 
 
 class PreviewThread(QThread):
-    preview_ready = Signal(QPixmap)
+    """미리보기 렌더 스레드 (재사용 - 끝난 뒤 set_options 후 다시 start)"""
+
+    preview_ready = Signal(QPixmap, str, object)  # pixmap, 품질 단계 (TIER_DRAFT/TIER_FULL), RenderTiming
     preview_error = Signal(str)
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, renderer: Optional[PreviewRenderer] = None):
         super().__init__(parent)
-        self._worker = PreviewWorker()
+        self._worker = PreviewWorker(renderer)
         self._worker.finished.connect(self.preview_ready)
         self._worker.error.connect(self.preview_error)
 
-    def set_source(self, img: Image.Image):
-        self._worker.set_source(img)
+    @property
+    def renderer(self) -> PreviewRenderer:
+        return self._worker.renderer
+
+    def set_source(self, img: Image.Image, original_size: Optional[tuple[int, int]] = None):
+        self._worker.set_source(img, original_size)
 
-    def set_options(self, options: dict):
-        self._worker.set_options(options)
+    def set_options(self, options: dict, tier: str = TIER_FULL, level: int = MAX_PREVIEW_SIZE):
+        self._worker.set_options(options, tier, level)
 
     def run(self):
         self._worker.process()
@@ -0,0 +1,119 @@
+"""미리보기 LRU 캐시
+
+- 렌더된 프레임: 설정을 바꿨다 되돌리거나 두 파일을 오가며 비교할 때 같은 프레임을 다시
+  렌더하지 않도록 (원본 파일, 옵션 지문) → QPixmap
+- 디코딩된 썸네일: 목록 이웃 파일을 미리 디코딩해 두고 경로 → DecodedPreview
+둘 다 바이트 크기 상한 안에서 보관.
+"""
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+from PIL import Image
+from PySide6.QtGui import QPixmap
+
+DEFAULT_PREVIEW_CACHE_MB = 128  # 512px 프레임 약 1MB → 100장 정도
+DEFAULT_DECODE_CACHE_MB = 64  # 512px RGB 썸네일 약 0.75MB
+
+# PreviewRenderer.render가 읽는 옵션 (출력 형식/EXIF 등 나머지는 미리보기 픽셀과 무관)
+RENDER_KEYS = (
+    "rotation",
+    "brightness",
+    "contrast",
+    "saturation",
+    "noise",
+    "crop",
+    "perspective_corners",
+)
+
+
+def file_identity(path: str) -> tuple:
+    """파일이 바뀌면 달라지는 식별자 (경로, 크기, 수정 시각)"""
+    try:
+        stat = os.stat(path)
+        return (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    except OSError:
+        return (os.path.abspath(path), 0, 0)
+
+
+def _canonical(value):
+    # 슬라이더 값의 부동소수점 오차, 튜플/리스트 차이를 없앰
+    if isinstance(value, float):
+        value = round(value, 6)
+        return int(value) if value.is_integer() else value
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return value
+
+
+def options_fingerprint(options: dict, keys: tuple[str, ...] = RENDER_KEYS) -> str:
+    """keys(기본: 미리보기에 영향을 주는 옵션)만 정규화한 해시 (기본값과 같은 값은 생략)"""
+    relevant = {key: _canonical(options[key]) for key in keys if options.get(key)}
+    payload = json.dumps(relevant, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def pixmap_nbytes(pixmap: QPixmap) -> int:
+    return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+def decoded_nbytes(decoded) -> int:
+    """DecodedPreview 썸네일 버퍼 크기 (Pillow는 밴드 3개도 픽셀당 4바이트로 저장)"""
+    img: Image.Image = decoded.thumbnail
+    bands = len(img.getbands())
+    return img.width * img.height * (4 if bands == 3 else bands)
+
+
+class PreviewCache:
+    """바이트 크기 기준 LRU (가장 오래 안 쓴 항목부터 제거)
+
+    sizeof: 항목 바이트 크기 (기본 QPixmap)
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_PREVIEW_CACHE_MB * 1024 * 1024,
+        sizeof: Callable[[Any], int] = pixmap_nbytes,
+    ):
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any):
+        nbytes = self._sizeof(value)
+        if nbytes > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.nbytes -= old[1]
+        self._entries[key] = (value, nbytes)
+        self.nbytes += nbytes
+        while self.nbytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.nbytes -= evicted
+
+    def clear(self):
+        self._entries.clear()
+        self.nbytes = 0
@@ -0,0 +1,167 @@
+"""미리보기 지연 계측 (옵션 변경 → 화면 표시)
+
+프레임 1장의 구간 (perf_counter 기준):
+- wait: 옵션 변경(슬라이더/핸들) ~ 렌더 시작 (렌더 스레드가 바쁘면 이전 렌더가 끝날 때까지)
+- render: 렌더 시작 ~ 파이프라인 결과 (PreviewRenderer)
+- convert: 결과 ~ QPixmap 변환 완료
+- paint: QPixmap 변환 ~ 뷰 paintEvent 완료 (큐잉 시그널 전달 + set_image + 그리기)
+- total: 옵션 변경 ~ 그리기 완료
+캐시 프레임은 render/convert가 0.
+
+최근 WINDOW개 프레임의 p50/p95를 디버그 오버레이에 표시하고, 켜져 있으면 프레임마다
+JSON Lines 로그 1줄 기록 (config "preview_debug").
+"""
+import json
+import math
+import time
+from collections import deque
+from pathlib import Path
+from time import perf_counter
+from typing import NamedTuple, Optional
+
+from .config import CONFIG_FILE
+
+LATENCY_STAGES = ("wait", "render", "convert", "paint", "total")
+WINDOW = 200  # p50/p95 계산에 쓰는 최근 프레임 수
+LATENCY_LOG_FILE = CONFIG_FILE.parent / "preview_latency.jsonl"
+
+
+class RenderTiming(NamedTuple):
+    """렌더 스레드에서 찍은 시각 (PreviewWorker → preview_ready로 전달)"""
+    start: float
+    rendered: float
+    converted: float
+
+
+class FrameTiming(NamedTuple):
+    """화면에 넘긴 프레임 1장의 시각 (그리기 완료 전)"""
+    tier: str
+    cached: bool
+    input: float
+    render: RenderTiming
+
+
+class LatencySample(NamedTuple):
+    tier: str
+    cached: bool
+    durations: dict[str, float]  # 구간 → 초
+
+
+def percentile(values: list[float], q: float) -> float:
+    """q 백분위 (nearest-rank, 정렬된 값)"""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, max(0, math.ceil(len(values) * q / 100) - 1))]
+
+
+class PreviewLatency:
+    """GUI 스레드 전용 - 입력 시각 → 프레임 표시 → 그리기 완료를 이어 샘플로 기록
+
+    사용법:
+        latency.mark_input()              # 옵션이 바뀔 때
+        started = latency.take_input()    # 렌더 요청(또는 캐시 표시) 시
+        latency.frame_shown(FrameTiming(tier, cached, started, render_timing))
+        latency.painted()                 # 뷰 paintEvent 후
+    """
+
+    def __init__(self, window: int = WINDOW):
+        self._samples: deque[LatencySample] = deque(maxlen=window)
+        self._pending_input: Optional[float] = None
+        self._shown: Optional[FrameTiming] = None
+        self._log = None
+        self.frames = 0
+        self.superseded = 0  # 그려지기 전에 다음 프레임으로 바뀐 프레임 수
+
+    def mark_input(self):
+        """옵션 변경 시각 (다음 프레임이 나가기 전 변경은 처음 것 기준)"""
+        if self._pending_input is None:
+            self._pending_input = perf_counter()
+
+    def take_input(self) -> float:
+        """이번 프레임의 입력 시각 (입력 없이 요청된 렌더는 요청 시각)"""
+        started = self._pending_input if self._pending_input is not None else perf_counter()
+        self._pending_input = None
+        return started
+
+    def frame_shown(self, timing: FrameTiming):
+        if self._shown is not None:
+            self.superseded += 1
+        self._shown = timing
+
+    def painted(self) -> Optional[LatencySample]:
+        """표시한 프레임이 그려짐 → 샘플 확정 (표시한 프레임이 없으면 None)"""
+        shown, self._shown = self._shown, None
+        if shown is None:
+            return None
+        now = perf_counter()
+        render = shown.render
+        durations = {
+            "wait": max(0.0, render.start - shown.input),
+            "render": render.rendered - render.start,
+            "convert": render.converted - render.rendered,
+            "paint": now - render.converted,
+            "total": now - shown.input,
+        }
+        sample = LatencySample(shown.tier, shown.cached, durations)
+        self._samples.append(sample)
+        self.frames += 1
+        if self._log is not None:
+            self._write(sample)
+        return sample
+
+    def reset(self):
+        self._samples.clear()
+        self._pending_input = None
+        self._shown = None
+        self.frames = 0
+        self.superseded = 0
+
+    @property
+    def samples(self) -> list[LatencySample]:
+        return list(self._samples)
+
+    def summary(self) -> dict:
+        """최근 프레임 구간별 p50/p95 (ms)"""
+        stages = {}
+        for name in LATENCY_STAGES:
+            values = sorted(s.durations[name] for s in self._samples)
+            stages[name] = {
+                "p50_ms": round(percentile(values, 50) * 1000, 3),
+                "p95_ms": round(percentile(values, 95) * 1000, 3),
+            }
+        return {"frames": len(self._samples), "superseded": self.superseded, "stages": stages}
+
+    def overlay_lines(self) -> list[str]:
+        """디버그 오버레이 문구"""
+        if not self._samples:
+            return ["미리보기 지연: 측정 전"]
+        summary = self.summary()
+        lines = [f"미리보기 지연 (최근 {summary['frames']}프레임, ms)"]
+        for name in LATENCY_STAGES:
+            stage = summary["stages"][name]
+            lines.append(f"{name:<8} p50 {stage['p50_ms']:7.1f}  p95 {stage['p95_ms']:7.1f}")
+        return lines
+
+    def open_log(self, path: Path = LATENCY_LOG_FILE):
+        """프레임마다 로그 1줄 추가 (줄 버퍼링)"""
+        self.close_log()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._log = open(path, "a", encoding="utf-8", buffering=1)
+
+    def close_log(self):
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def _write(self, sample: LatencySample):
+        record = {
+            "time": round(time.time(), 3),
+            "tier": sample.tier,
+            "cached": sample.cached,
+            **{f"{name}_ms": round(seconds * 1000, 3) for name, seconds in sample.durations.items()},
+        }
+        try:
+            self._log.write(json.dumps(record) + "\n")
+        except OSError:
+            self.close_log()
@@ -0,0 +1,126 @@
+"""배치 CPU 프로파일 수집 (옵트인, cProfile)
+
+- 워커는 작업 N개마다 1개를 cProfile로 계측해 작업별 작은 .prof 파일로 저장 (profile_every로 오버헤드 조절)
+  누적 통계를 매번 다시 쓰지 않으므로 작업당 저장 비용은 그 작업의 계측량에만 비례
+- 배치 종료 시 코디네이터가 워커별 파일을 출력 폴더의 profile.prof 하나로 합치고
+  profile.txt(사람용 표)와 로그 요약(자체 시간 상위 함수)을 만든다
+- profile.prof는 `python -m pstats`, snakeviz 등으로 열 수 있다
+"""
+import cProfile
+import io
+import os
+import pstats
+import shutil
+import threading
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Optional
+
+PARTS_DIRNAME = ".profile_parts"
+MERGED_FILENAME = "profile.prof"
+SUMMARY_FILENAME = "profile.txt"
+DEFAULT_PROFILE_EVERY = 1
+HOT_FUNCTIONS = 10
+
+# 같은 프로세스에서 동시에 프로파일러 1개만 실행 (스레드 워커용)
+_lock = threading.Lock()
+_dump_count = 0  # 프로세스 안 작업별 파일 번호 (_lock 안에서만 증가)
+
+
+def should_profile(index: int, every: int) -> bool:
+    """index번째 작업을 계측할지 (every개마다 1개)"""
+    return index % max(1, every) == 0
+
+
+def parts_dir_for(output_dir: Path) -> Path:
+    return Path(output_dir) / PARTS_DIRNAME
+
+
+def _dump(profiler: cProfile.Profile, parts_dir: str):
+    """작업 1개의 통계를 새 파일로 저장 (병합은 merge_profiles가 배치 종료 시 1번)"""
+    global _dump_count
+    _dump_count += 1
+    os.makedirs(parts_dir, exist_ok=True)
+    profiler.dump_stats(os.path.join(parts_dir, f"worker_{os.getpid()}_{_dump_count}.prof"))
+
+
+@contextmanager
+def _profiled(parts_dir: str):
+    # 다른 스레드가 계측 중이면 이 작업은 건너뜀
+    if not _lock.acquire(blocking=False):
+        yield
+        return
+    try:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            try:
+                _dump(profiler, parts_dir)
+            except OSError:
+                pass
+    finally:
+        _lock.release()
+
+
+def profile_task(parts_dir: Optional[str]):
+    """작업 1개 계측 컨텍스트 (parts_dir이 없으면 no-op)"""
+    if not parts_dir:
+        return nullcontext()
+    return _profiled(parts_dir)
+
+
+def merge_profiles(output_dir: Path) -> Optional[pstats.Stats]:
+    """작업별 .prof를 출력 폴더의 profile.prof/profile.txt로 병합, 작업별 파일은 삭제"""
+    output_dir = Path(output_dir)
+    parts_dir = parts_dir_for(output_dir)
+    files = sorted(parts_dir.glob("*.prof"))
+    if not files:
+        shutil.rmtree(parts_dir, ignore_errors=True)
+        return None
+
+    stats = pstats.Stats(*(str(f) for f in files))
+    stats.dump_stats(str(output_dir / MERGED_FILENAME))
+
+    stream = io.StringIO()
+    stats.stream = stream
+    workers = len({f.stem.rsplit("_", 1)[0] for f in files})
+    stream.write(f"워커 {workers}개, 계측 작업 {len(files)}개 병합\n\n[자체 시간 순]\n")
+    stats.sort_stats("tottime").print_stats(40)
+    stream.write("\n[누적 시간 순]\n")
+    stats.sort_stats("cumulative").print_stats(40)
+    (output_dir / SUMMARY_FILENAME).write_text(stream.getvalue(), encoding="utf-8")
+
+    shutil.rmtree(parts_dir, ignore_errors=True)
+    return stats
+
+
+def hot_functions(stats: pstats.Stats, limit: int = HOT_FUNCTIONS) -> list[dict]:
+    """자체 시간(tottime) 상위 함수"""
+    rows = []
+    for (filename, line, name), (_, calls, tottime, cumtime, _) in stats.stats.items():
+        rows.append(
+            {
+                "function": name,
+                # 내장 함수는 파일 위치 없음 ("~", 0)
+                "location": f"{Path(filename).name}:{line}" if line else "",
+                "calls": calls,
+                "tottime": round(tottime, 6),
+                "cumtime": round(cumtime, 6),
+            }
+        )
+    rows.sort(key=lambda r: r["tottime"], reverse=True)
+    return rows[:limit]
+
+
+def summary_lines(stats: pstats.Stats, limit: int = HOT_FUNCTIONS) -> list[str]:
+    total = stats.total_tt or 1.0
+    lines = [f"CPU 프로파일 (자체 시간 상위 {limit}개, 계측 합계 {stats.total_tt:.2f}s)"]
+    for row in hot_functions(stats, limit):
+        lines.append(
+            f"  {row['tottime'] / total * 100:5.1f}% {row['tottime']:7.3f}s "
+            f"(누적 {row['cumtime']:7.3f}s, {row['calls']}회) {row['function']} {row['location']}".rstrip()
+        )
+    return lines
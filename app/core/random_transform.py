@@ -3,6 +3,8 @@ import platform
 import random
 from datetime import datetime, timedelta
 
+from .constants import MAX_PREVIEW_SIZE
+from .image_ops import fit_size
 from .random_config import (
     CROP_RANGE,
     ROTATION_RANGE,
@@ -124,6 +126,23 @@ def generate_random_options(
     return options
 
 
+def generate_random_task_options(
+    config: RandomTransformConfig,
+    image_width: int,
+    image_height: int,
+) -> dict:
+    """파일 1개용 랜덤 옵션 - 미리보기(썸네일) 좌표 기준 + thumb_w/thumb_h 포함"""
+    thumb_w, thumb_h = fit_size(image_width, image_height, MAX_PREVIEW_SIZE)
+    options = generate_random_options(
+        config, thumb_w, thumb_h,
+        include_perspective=True,
+        include_date=True,
+    )
+    options["thumb_w"] = thumb_w
+    options["thumb_h"] = thumb_h
+    return options
+
+
 def format_random_log(filename: str, options: dict) -> str:
     """랜덤 변형 로그 포맷 (Windows는 영어, 기타는 한글)"""
     crop = options.get("crop", {}).get("top", 0)
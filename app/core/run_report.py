@@ -0,0 +1,160 @@
+"""배치 실행 리포트 - 처리량/지연 시간 백분위/워커 활용률/실패 분류
+
+GUI(배치/랜덤)와 CLI가 작업 결과를 add()로 넘기고, 종료 시 finish()로 리포트를 만든다.
+리포트는 로그에 요약하고 출력 폴더 안에 실행마다 새 JSON으로 저장한다 (용량 계획/소스별 속도 비교용).
+"""
+import json
+import math
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+SLOWEST_FILES = 5
+REPORT_PREFIX = "report"
+RUN_STAMP_FORMAT = "%Y%m%d-%H%M%S"
+
+
+def percentile(values: list[float], q: float) -> float:
+    """최근접 순위 백분위 (values가 비어 있으면 0)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(len(ordered) * q / 100))
+    return ordered[rank - 1]
+
+
+def run_artifact_path(output_dir: Path, prefix: str, when: Optional[datetime] = None) -> Path:
+    """출력 폴더 안 실행별 JSON 경로 (예: out/report_20260101-093000.json)
+
+    같은 -o로 여러 번 실행해도 이전 실행 파일을 덮어쓰지 않도록 시작 시각을 붙이고,
+    같은 초에 이미 있으면 _1, _2 ...
+    """
+    output_dir = Path(output_dir)
+    stem = f"{prefix}_{(when or datetime.now()).strftime(RUN_STAMP_FORMAT)}"
+    path = output_dir / f"{stem}.json"
+    counter = 1
+    while path.exists():
+        path = output_dir / f"{stem}_{counter}.json"
+        counter += 1
+    return path
+
+
+def report_path_for(output_dir: Path, when: Optional[datetime] = None) -> Path:
+    """출력 폴더 안 실행별 리포트 경로 (profile.prof와 같은 위치)"""
+    return run_artifact_path(output_dir, REPORT_PREFIX, when)
+
+
+class RunReport:
+    """배치 1회 실행 기록
+
+    add()에 넘기는 결과 dict 키: filepath, success, result(오류 메시지),
+    error_type, elapsed(초), megapixels
+    """
+
+    def __init__(self, mode: str, workers: int, total: int):
+        self.mode = mode
+        self.workers = workers
+        self.total = total
+        self.started_at = datetime.now()
+        self._start = time.perf_counter()
+        self._end: Optional[float] = None
+        self.items: list[dict] = []
+
+    def add(self, result: dict):
+        if result.get("cancelled"):
+            return
+        self.items.append(
+            {
+                "file": result["filepath"],
+                "success": result["success"],
+                "elapsed": result.get("elapsed") or 0.0,
+                "megapixels": result.get("megapixels") or 0.0,
+                "error_type": result.get("error_type"),
+                "error": None if result["success"] else result.get("result"),
+            }
+        )
+
+    def finish(self, cancelled: bool = False, **sections) -> dict:
+        """리포트 dict 생성 (sections: stages/memory 등 추가 항목)"""
+        if self._end is None:
+            self._end = time.perf_counter()
+        wall = max(self._end - self._start, 1e-9)
+
+        succeeded = [i for i in self.items if i["success"]]
+        failed = [i for i in self.items if not i["success"]]
+        latencies = [i["elapsed"] for i in self.items]
+        busy = sum(latencies)
+        megapixels = sum(i["megapixels"] for i in succeeded)
+
+        failures: dict[str, dict] = {}
+        for item in failed:
+            key = item["error_type"] or "Error"
+            entry = failures.setdefault(key, {"count": 0, "example": item["error"], "files": []})
+            entry["count"] += 1
+            entry["files"].append(item["file"])
+
+        slowest = sorted(self.items, key=lambda i: i["elapsed"], reverse=True)[:SLOWEST_FILES]
+
+        report = {
+            "mode": self.mode,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "cancelled": cancelled,
+            "workers": self.workers,
+            "total": self.total,
+            "processed": len(self.items),
+            "succeeded": len(succeeded),
+            "failed": len(failed),
+            "wall_s": round(wall, 3),
+            "images_per_s": round(len(succeeded) / wall, 3),
+            "megapixels": round(megapixels, 2),
+            "megapixels_per_s": round(megapixels / wall, 3),
+            "latency_s": {
+                "mean": round(busy / len(latencies), 3) if latencies else 0.0,
+                "p50": round(percentile(latencies, 50), 3),
+                "p95": round(percentile(latencies, 95), 3),
+                "p99": round(percentile(latencies, 99), 3),
+                "max": round(max(latencies), 3) if latencies else 0.0,
+            },
+            # 워커가 이미지 처리에 쓴 시간 / (실행 시간 × 워커 수)
+            "worker_utilization": round(min(1.0, busy / (wall * self.workers)), 3) if self.workers else 0.0,
+            "failures": failures,
+            "slowest": [
+                {
+                    "file": i["file"],
+                    "elapsed_s": round(i["elapsed"], 3),
+                    "megapixels": round(i["megapixels"], 2),
+                }
+                for i in slowest
+            ],
+        }
+        report.update(sections)
+        return report
+
+
+def summary_lines(report: dict) -> list[str]:
+    """리포트 사람용 요약"""
+    latency = report["latency_s"]
+    lines = [
+        f"처리량: {report['images_per_s']:.2f}장/초, {report['megapixels_per_s']:.1f}MP/초 "
+        f"({report['succeeded']}장, {report['megapixels']:.0f}MP, {report['wall_s']:.1f}초)",
+        f"이미지당 처리 시간: p50 {latency['p50']:.2f}초, p95 {latency['p95']:.2f}초, "
+        f"p99 {latency['p99']:.2f}초, 최대 {latency['max']:.2f}초",
+        f"워커 활용률: {report['worker_utilization'] * 100:.0f}% (워커 {report['workers']}개)",
+    ]
+    for error_type, entry in report["failures"].items():
+        lines.append(f"실패 {error_type}: {entry['count']}개 (예: {entry['example']})")
+    if report["slowest"]:
+        lines.append(
+            "가장 느린 파일: "
+            + ", ".join(f"{Path(i['file']).name} {i['elapsed_s']:.2f}초" for i in report["slowest"])
+        )
+    return lines
+
+
+def write_report(report: dict, path: Path) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    return path
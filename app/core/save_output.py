@@ -1,10 +1,14 @@
+import os
+import threading
 from pathlib import Path
 from typing import Optional
 
 from PIL import Image
 
+from .cancellation import CancelEvent, check_cancelled
 from .image_ops import add_noise, crop_background, crop_transparent
 from .metadata import save_jpeg_with_metadata, save_webp_with_metadata
+from .stage_timing import stage
 
 
 def create_output_folder(base_dir: str, options: dict = None) -> Path:
@@ -69,12 +73,87 @@ def get_unique_filename(output_dir: Path, original_name: str, output_format: str
     return candidate
 
 
+# 작업(스레드)별로 선점했지만 아직 결과로 채우지 않은 경로 - 작업이 실패/취소되면 release_reservations로 삭제
+_reservations = threading.local()
+
+
+def _pending_reservations() -> set:
+    pending = getattr(_reservations, "paths", None)
+    if pending is None:
+        pending = _reservations.paths = set()
+    return pending
+
+
+def release_reservations() -> int:
+    """현재 스레드의 작업이 선점만 하고 채우지 못한 빈 결과 파일 삭제, 삭제 개수 반환
+
+    워커가 TaskCancelled/예외로 작업을 끝낼 때 호출 (저장 단계 밖에서 중단돼도 빈 파일이 남지 않도록)
+    """
+    pending = _pending_reservations()
+    removed = 0
+    for path in pending:
+        try:
+            if path.stat().st_size == 0:
+                path.unlink()
+                removed += 1
+        except OSError:
+            pass
+    pending.clear()
+    return removed
+
+
+def reserve_unique_filename(output_dir: Path, original_name: str, output_format: str = "jpeg") -> Path:
+    """get_unique_filename과 같은 이름 규칙으로 빈 파일을 만들어 이름을 선점
+
+    존재 확인과 생성이 O_EXCL로 한 번에 일어나므로 같은 이름의 파일을 동시에 저장하는
+    워커끼리도 서로 다른 이름(_1, _2 ...)을 받는다. 저장에 실패하면 호출 측이 지워야 함
+    """
+    stem = Path(original_name).stem
+    ext = ".webp" if output_format == "webp" else ".jpg"
+    counter = 0
+    while True:
+        candidate = output_dir / (f"{stem}_{counter}{ext}" if counter else f"{stem}{ext}")
+        try:
+            fd = os.open(candidate, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            counter += 1
+            continue
+        os.close(fd)
+        _pending_reservations().add(candidate)
+        return candidate
+
+
+PARTIAL_MARKER = ".partial"
+
+
+def get_partial_path(output_path: Path) -> Path:
+    """저장 중 임시 파일 경로 (숨김 파일, 완료 후 최종 경로로 교체)"""
+    return output_path.with_name(f".{output_path.stem}{PARTIAL_MARKER}{output_path.suffix}")
+
+
+def cleanup_partial_outputs(output_dir: Path) -> int:
+    """중단된 저장으로 남은 임시 파일과 그 파일이 선점해 둔 빈 결과 파일 삭제, 삭제 개수 반환"""
+    removed = 0
+    for path in Path(output_dir).glob(f".*{PARTIAL_MARKER}.*"):
+        reserved = path.with_name(path.name[1:].replace(PARTIAL_MARKER, "", 1))
+        try:
+            path.unlink()
+            removed += 1
+            if reserved.exists() and reserved.stat().st_size == 0:
+                reserved.unlink()
+        except OSError:
+            pass
+    return removed
+
+
 def save_transformed_image(
     img: Image.Image,
     output_dir: Path,
     original_name: str,
     metadata_overrides: Optional[dict] = None,
     output_format: str = "jpeg",
+    cancel_event: Optional[CancelEvent] = None,
+    quality: Optional[int] = None,
 ) -> Path:
     """이미지 저장
 
@@ -82,9 +161,11 @@ def save_transformed_image(
     2. 투명 영역 크롭 (RGBA 알파 채널 기반)
     3. JPEG: RGB 변환 + 배경 크롭
     4. 노이즈 적용 (크롭 후)
-    """
-    output_path = get_unique_filename(output_dir, original_name, output_format)
 
+    처리가 끝난 뒤 결과 파일명을 선점(reserve_unique_filename)하고 임시 파일에 쓴 다음
+    선점한 경로로 교체하므로, 중단돼도 불완전한 결과 파일이 남지 않고 같은 이름의 입력을
+    동시에 저장해도 서로 덮어쓰지 않음
+    """
     # info 값 추출 (crop 후 info 사라짐)
     noise_value = img.info.get("noise", 0)
     rotation_value = img.info.get("rotation", 0)
@@ -96,18 +177,21 @@ def save_transformed_image(
 
     # 2. 투명 영역 크롭 (RGBA인 경우, RGB 변환 전에 처리)
     if img.mode == "RGBA":
-        img = crop_transparent(img)
+        with stage("crop_transparent"):
+            img = crop_transparent(img)
 
     # 3. JPEG: RGB 변환 + 배경 크롭 (흰색/검정 자동 감지)
     if output_format == "jpeg":
-        if img.mode == "RGBA":
-            # 흰색 배경으로 변환 (블로그 업로드 시 자연스러움)
-            bg = Image.new("RGB", img.size, (255, 255, 255))
-            bg.paste(img, mask=img.split()[3])
-            img = bg
-        else:
-            img = img.convert("RGB")
-        img = crop_background(img)
+        with stage("flatten"):
+            if img.mode == "RGBA":
+                # 흰색 배경으로 변환 (블로그 업로드 시 자연스러움)
+                bg = Image.new("RGB", img.size, (255, 255, 255))
+                bg.paste(img, mask=img.split()[3])
+                img = bg
+            else:
+                img = img.convert("RGB")
+        with stage("crop_background"):
+            img = crop_background(img)
 
         # 회전된 이미지면 모서리 삼각형 제거 (회전 각도 비례 크롭)
         if rotation_value != 0:
@@ -120,14 +204,29 @@ def save_transformed_image(
             if margin > 0 and margin * 2 < min(w, h):
                 img = img.crop((margin, margin, w - margin, h - margin))
 
+    check_cancelled(cancel_event)
+
     # 3. 노이즈 적용 (크롭 후)
     if noise_value > 0:
-        img = add_noise(img, noise_value)
-
-    if output_format == "webp":
-        save_webp_with_metadata(img, str(output_path), metadata_overrides)
-    else:
-        save_jpeg_with_metadata(img, str(output_path), metadata_overrides)
+        with stage("noise"):
+            img = add_noise(img, noise_value)
+    check_cancelled(cancel_event)
+
+    output_path = reserve_unique_filename(output_dir, original_name, output_format)
+    partial_path = get_partial_path(output_path)
+    save_kwargs = {"quality": quality} if quality else {}
+    try:
+        if output_format == "webp":
+            save_webp_with_metadata(img, str(partial_path), metadata_overrides, **save_kwargs)
+        else:
+            save_jpeg_with_metadata(img, str(partial_path), metadata_overrides, **save_kwargs)
+        os.replace(partial_path, output_path)
+    except BaseException:
+        # 저장 실패/취소: 임시 파일과 선점한 빈 결과 파일 모두 제거
+        partial_path.unlink(missing_ok=True)
+        release_reservations()
+        raise
+    _pending_reservations().discard(output_path)
 
     return output_path
 
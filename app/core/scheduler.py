@@ -0,0 +1,294 @@
+"""배치 작업 스케줄링 - 메모리 예산 기반 작업 허용 제어 + 크기순 투입
+
+워커 수만큼 무조건 작업을 투입하면 대형 이미지(50MP 등)가 여러 개 겹칠 때
+RAM이 부족해 프로세스 풀이 죽는다. 파일 헤더의 해상도와 예정된 처리 단계로
+작업별 최대 메모리를 추정하고, 합계가 예산 이하일 때만 작업을 투입한다.
+
+같은 헤더 정보로 작업 비용(메가픽셀 × 단계 가중치)을 추정해 큰 작업부터 투입하면
+배치 끝에 대형 이미지 하나만 남아 코어가 노는 구간이 줄어든다.
+
+배치 중에도 미리보기 조작이 끊기지 않도록 미리보기를 우선한다:
+워커 프로세스는 낮은 OS 우선순위로 실행하고 (lower_process_priority),
+슬라이더/파일 선택 직후 잠깐은 새 작업 투입을 보류한다 (InteractionGate).
+"""
+import os
+import platform
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from PIL import Image
+
+# 가용 메모리 중 배치 처리에 할당할 비율 (나머지는 UI/OS 몫)
+DEFAULT_BUDGET_RATIO = 0.6
+
+# 파이프라인 내내 유지되는 메모리 (원본 + apply_transforms 복사본, 픽셀당 바이트)
+RESIDENT_BYTES_PER_PIXEL = 8
+
+# 단계별 추가 작업 메모리 (원본 픽셀당 바이트, 대략치)
+# - perspective: RGBA 변환 + 변형 결과
+# - rotate: expand 회전 결과 + 중앙 크롭
+# - color: ImageEnhance 중간 이미지 + 결과
+# - encode: crop_background numpy 배열 + 그레이/마스크 + JPEG 배경 합성
+# - noise: float32 배열 + float64 노이즈/합산 중간 배열
+STAGE_BYTES_PER_PIXEL = {
+    "decode": 4,
+    "crop": 4,
+    "perspective": 12,
+    "rotate": 10,
+    "color": 8,
+    "encode": 10,
+    "noise": 90,
+}
+
+# 단계별 상대 처리 비용 (메가픽셀당, decode = 1.0 기준 대략치)
+# - perspective: 변형 + 저장 시 투명 영역 크롭(crop_transparent) 포함
+# - encode: 배경 크롭 + JPEG/WebP 인코딩
+STAGE_COST_WEIGHTS = {
+    "decode": 1.0,
+    "crop": 0.2,
+    "perspective": 3.0,
+    "rotate": 1.5,
+    "color": 0.8,
+    "encode": 1.5,
+    "noise": 2.5,
+}
+
+# 헤더 읽기 스레드 수 (네트워크 드라이브 지연 숨김용)
+HEADER_READ_THREADS = 8
+
+# 미리보기 조작 후 새 배치 작업 투입을 보류하는 시간 (초)
+INTERACTION_HOLD_S = 0.5
+# 스레드 워커(랜덤 모드)가 작업 시작 전 보류를 기다리는 최대 시간 (계속 조작해도 배치는 진행)
+INTERACTION_MAX_WAIT_S = 2.0
+INTERACTION_POLL_S = 0.05
+# 배치 워커 프로세스 nice 값 (POSIX, 클수록 양보)
+WORKER_NICE = 10
+
+
+def read_image_size(filepath: str) -> Optional[tuple[int, int]]:
+    """헤더만 읽어 이미지 크기 반환 (픽셀 디코딩 없음)"""
+    try:
+        with Image.open(filepath) as img:
+            return img.size
+    except Exception:
+        return None
+
+
+def read_oriented_size(filepath: str) -> Optional[tuple[int, int]]:
+    """EXIF Orientation(90/270도 회전)을 반영한 크기 - exif_transpose 결과와 동일, 디코딩 없음"""
+    try:
+        with Image.open(filepath) as img:
+            w, h = img.size
+            orientation = img.getexif().get(0x0112, 1)
+    except Exception:
+        return None
+    if orientation in (5, 6, 7, 8):
+        return h, w
+    return w, h
+
+
+def read_image_sizes(filepaths: list[str]) -> list[Optional[tuple[int, int]]]:
+    """여러 파일 헤더를 스레드로 병렬 읽기 (입력 순서 유지)"""
+    if len(filepaths) <= 1:
+        return [read_image_size(f) for f in filepaths]
+    with ThreadPoolExecutor(max_workers=HEADER_READ_THREADS) as executor:
+        return list(executor.map(read_image_size, filepaths))
+
+
+def planned_stages(options: dict) -> list[str]:
+    """옵션 기준으로 실제 실행될 처리 단계 목록"""
+    stages = ["decode"]
+
+    crop = options.get("crop") or {}
+    if any(crop.get(k, 0) for k in ("top", "bottom", "left", "right")):
+        stages.append("crop")
+    if options.get("perspective_corners"):
+        stages.append("perspective")
+    if options.get("rotation", 0):
+        stages.append("rotate")
+    if any(options.get(k, 0) for k in ("brightness", "contrast", "saturation")):
+        stages.append("color")
+
+    stages.append("encode")
+
+    if options.get("noise", 0) > 0:
+        stages.append("noise")
+
+    return stages
+
+
+def estimate_task_memory(width: int, height: int, options: dict) -> int:
+    """작업 1건의 최대 메모리 사용량 추정 (바이트)
+
+    단계 출력은 이전 결과를 대체하므로 최대 단계 하나만 상주분에 더한다.
+    """
+    pixels = width * height
+    peak_stage = max(STAGE_BYTES_PER_PIXEL[s] for s in planned_stages(options))
+    return pixels * (RESIDENT_BYTES_PER_PIXEL + peak_stage)
+
+
+def estimate_task_cost(width: int, height: int, options: dict) -> float:
+    """작업 1건의 상대 처리 비용 (메가픽셀 × 단계 가중치 합)"""
+    megapixels = width * height / 1_000_000
+    return megapixels * sum(STAGE_COST_WEIGHTS[s] for s in planned_stages(options))
+
+
+def order_largest_first(tasks: list[dict]) -> list[dict]:
+    """추정 비용이 큰 작업부터 정렬 (비용이 같으면 원래 순서 유지)"""
+    return sorted(tasks, key=lambda t: t.get("cost_estimate", 0.0), reverse=True)
+
+
+def get_available_memory() -> Optional[int]:
+    """현재 가용 물리 메모리 (바이트). 알 수 없으면 None"""
+    try:
+        import psutil
+
+        return int(psutil.virtual_memory().available)
+    except ImportError:
+        pass
+
+    system = platform.system()
+
+    if system == "Linux":
+        try:
+            with open("/proc/meminfo", "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith("MemAvailable:"):
+                        return int(line.split()[1]) * 1024
+        except OSError:
+            pass
+
+    if system == "Windows":
+        try:
+            import ctypes
+
+            class MEMORYSTATUSEX(ctypes.Structure):
+                _fields_ = [
+                    ("dwLength", ctypes.c_ulong),
+                    ("dwMemoryLoad", ctypes.c_ulong),
+                    ("ullTotalPhys", ctypes.c_ulonglong),
+                    ("ullAvailPhys", ctypes.c_ulonglong),
+                    ("ullTotalPageFile", ctypes.c_ulonglong),
+                    ("ullAvailPageFile", ctypes.c_ulonglong),
+                    ("ullTotalVirtual", ctypes.c_ulonglong),
+                    ("ullAvailVirtual", ctypes.c_ulonglong),
+                    ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+                ]
+
+            status = MEMORYSTATUSEX()
+            status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+            if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+                return int(status.ullAvailPhys)
+        except Exception:
+            pass
+        return None
+
+    # macOS 등: 가용 메모리 API가 없으면 전체 물리 메모리로 대체
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def resolve_memory_budget(budget_mb: int = 0) -> Optional[int]:
+    """설정값(MB)으로 예산 바이트 결정. 0이면 가용 메모리 기준 자동, 알 수 없으면 None(무제한)"""
+    if budget_mb and budget_mb > 0:
+        return budget_mb * 1024 * 1024
+
+    available = get_available_memory()
+    if available is None:
+        return None
+    return int(available * DEFAULT_BUDGET_RATIO)
+
+
+def format_mb(num_bytes: int) -> str:
+    return f"{num_bytes / (1024 * 1024):.0f}MB"
+
+
+class MemoryBudget:
+    """작업 허용 제어
+
+    - 진행 중 작업의 추정 메모리 합계가 예산 이하일 때만 새 작업 허용
+    - 진행 중 작업이 없으면 예산보다 큰 작업도 단독으로 허용 (진행 보장)
+    """
+
+    def __init__(self, budget_bytes: Optional[int]):
+        self.budget_bytes = budget_bytes
+        self.in_use = 0
+        self.in_flight = 0
+
+    def try_acquire(self, cost: int) -> bool:
+        if (
+            self.budget_bytes is not None
+            and self.in_flight > 0
+            and self.in_use + cost > self.budget_bytes
+        ):
+            return False
+        self.in_use += cost
+        self.in_flight += 1
+        return True
+
+    def release(self, cost: int):
+        self.in_use = max(0, self.in_use - cost)
+        self.in_flight = max(0, self.in_flight - 1)
+
+    def describe_throttle(self, filename: str, cost: int, running: int, max_workers: int) -> str:
+        """대기 사유 메시지"""
+        return (
+            f"메모리 예산 대기: [{filename}] 예상 {format_mb(cost)}, "
+            f"사용 중 {format_mb(self.in_use)}/{format_mb(self.budget_bytes or 0)} "
+            f"(워커 {running}/{max_workers} 사용)"
+        )
+
+
+def lower_process_priority():
+    """현재 프로세스 CPU 우선순위를 낮춤 (배치 워커용, 실패해도 무시)
+
+    POSIX: nice +WORKER_NICE, Windows: BELOW_NORMAL_PRIORITY_CLASS
+    """
+    try:
+        if platform.system() == "Windows":
+            import ctypes
+
+            below_normal = 0x4000
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetPriorityClass(kernel32.GetCurrentProcess(), below_normal)
+        else:
+            os.nice(WORKER_NICE)
+    except Exception:
+        pass
+
+
+class InteractionGate:
+    """미리보기 조작 중 배치 작업 투입 보류
+
+    - GUI 스레드가 조작마다 touch() → 그 뒤 hold초 동안 active
+    - 배치 쪽은 투입 전 allows(running)로 확인: 진행 중 작업이 없으면 항상 허용 (진행 보장)
+    - 이미 시작한 작업은 멈추지 않음 (낮은 OS 우선순위로 미리보기에 양보)
+    """
+
+    def __init__(self, hold: float = INTERACTION_HOLD_S):
+        self.hold = hold
+        self._until = 0.0  # float 대입은 원자적이라 잠금 없이 스레드 간 공유
+        self.holds = 0  # 조작으로 보류를 시작한 횟수
+
+    def touch(self):
+        if not self.active:
+            self.holds += 1
+        self._until = time.monotonic() + self.hold
+
+    @property
+    def active(self) -> bool:
+        return time.monotonic() < self._until
+
+    def allows(self, running: int) -> bool:
+        return running == 0 or not self.active
+
+    def wait_idle(self, cancel_event=None, timeout: float = INTERACTION_MAX_WAIT_S):
+        """조작이 멈출 때까지 최대 timeout초 대기 (스레드 워커가 작업 시작 전 호출)"""
+        deadline = time.monotonic() + timeout
+        while self.active and time.monotonic() < deadline:
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            time.sleep(INTERACTION_POLL_S)
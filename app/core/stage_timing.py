@@ -0,0 +1,180 @@
+"""파이프라인 단계별 소요 시간 계측
+
+- 처리 코드는 `with stage("crop"):` 으로 단계를 감싼다
+- 활성 StageTimer가 없으면 아무것도 하지 않음 (계측 비용 ≈ ContextVar 조회 1회)
+- 워커는 이미지별 단계 시간(dict)을 결과와 함께 보내고,
+  코디네이터(GUI/CLI)가 StageStats 히스토그램으로 모아 배치 종료 시 요약한다
+"""
+import math
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Optional
+
+# 요약 출력 순서 (파이프라인 실행 순서)
+STAGE_ORDER = (
+    "decode",
+    "exif_transpose",
+    "crop",
+    "perspective",
+    "rotate",
+    "color",
+    "exif_strip",
+    "crop_transparent",
+    "flatten",
+    "crop_background",
+    "noise",
+    "encode",
+    "write",
+    "set_file_times",
+)
+
+# 히스토그램 버킷 상한 (ms): 0.25ms ~ 약 131초, 2배 간격
+HISTOGRAM_BOUNDS_MS = tuple(0.25 * 2**i for i in range(20))
+
+_active_timer: ContextVar[Optional["StageTimer"]] = ContextVar("stage_timer", default=None)
+_NOOP = nullcontext()
+
+
+class StageTimer:
+    """이미지 1장의 단계별 소요 시간 (초, 같은 단계가 여러 번이면 합산)
+
+    spans가 리스트면 단계마다 (이름, 시작, 끝) perf_counter 구간도 기록 (타임라인 추적용)
+    """
+
+    def __init__(self):
+        self.durations: dict[str, float] = {}
+        self.spans: Optional[list[tuple[str, float, float]]] = None
+
+    def add(self, name: str, seconds: float, start: Optional[float] = None):
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+        if self.spans is not None and start is not None:
+            self.spans.append((name, start, start + seconds))
+
+    def measure(self, name: str):
+        """단계 1개 계측 컨텍스트 (하위 클래스에서 계측 항목 추가)"""
+        return _timed(self, name)
+
+    @contextmanager
+    def activate(self):
+        """현재 스레드(컨텍스트)의 stage() 호출을 이 타이머에 기록"""
+        token = _active_timer.set(self)
+        try:
+            yield self
+        finally:
+            _active_timer.reset(token)
+
+
+@contextmanager
+def _timed(timer: StageTimer, name: str):
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        timer.add(name, perf_counter() - start, start)
+
+
+def stage(name: str):
+    """단계 계측 컨텍스트 (활성 타이머가 없으면 no-op)"""
+    timer = _active_timer.get()
+    if timer is None:
+        return _NOOP
+    return timer.measure(name)
+
+
+class StageHistogram:
+    """단계 1개의 소요 시간 분포 (로그 스케일 버킷)"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.buckets = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+        ms = seconds * 1000
+        index = len(HISTOGRAM_BOUNDS_MS)
+        for i, bound in enumerate(HISTOGRAM_BOUNDS_MS):
+            if ms <= bound:
+                index = i
+                break
+        self.buckets[index] += 1
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """q 백분위 근사값 (초) - 해당 버킷 상한, 실측 최대값을 넘지 않음"""
+        if not self.count:
+            return 0.0
+        target = math.ceil(self.count * q / 100)
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target:
+                if i < len(HISTOGRAM_BOUNDS_MS):
+                    return min(HISTOGRAM_BOUNDS_MS[i] / 1000, self.max)
+                return self.max
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_s": round(self.total, 6),
+            "mean_ms": round(self.mean * 1000, 3),
+            "min_ms": round(self.min * 1000, 3) if self.count else 0.0,
+            "max_ms": round(self.max * 1000, 3),
+            "p50_ms": round(self.percentile(50) * 1000, 3),
+            "p95_ms": round(self.percentile(95) * 1000, 3),
+            "buckets": self.buckets,
+        }
+
+
+class StageStats:
+    """배치 전체의 단계별 히스토그램"""
+
+    def __init__(self):
+        self.images = 0
+        self.histograms: dict[str, StageHistogram] = {}
+
+    def add(self, durations: Optional[dict]):
+        """이미지 1장의 단계 시간 추가 (None/빈 dict는 무시)"""
+        if not durations:
+            return
+        self.images += 1
+        for name, seconds in durations.items():
+            self.histograms.setdefault(name, StageHistogram()).add(seconds)
+
+    def _ordered(self) -> list[tuple[str, StageHistogram]]:
+        order = {name: i for i, name in enumerate(STAGE_ORDER)}
+        return sorted(
+            self.histograms.items(),
+            key=lambda item: (order.get(item[0], len(order)), item[0]),
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "images": self.images,
+            "bounds_ms": list(HISTOGRAM_BOUNDS_MS),
+            "stages": {name: hist.to_dict() for name, hist in self._ordered()},
+        }
+
+    def summary_lines(self) -> list[str]:
+        """사람용 요약 (단계별 합계/평균/p95/비중)"""
+        if not self.images:
+            return []
+        grand_total = sum(h.total for h in self.histograms.values()) or 1.0
+        lines = [f"단계별 소요 시간 ({self.images}장, 워커 합산)"]
+        for name, hist in self._ordered():
+            lines.append(
+                f"  {name:<16} 합계 {hist.total:7.2f}s  평균 {hist.mean * 1000:8.1f}ms  "
+                f"p95 {hist.percentile(95) * 1000:8.1f}ms  {hist.total / grand_total * 100:5.1f}%"
+            )
+        return lines
@@ -0,0 +1,28 @@
+"""GUI 시작 시간 관리
+
+- 창 표시 전에 필요 없는 무거운 모듈(numpy, cv2)은 사용하는 함수 안에서 import
+- 창을 띄운 뒤 백그라운드 스레드에서 미리 로드해 첫 미리보기/저장 지연을 없앤다
+- 측정/예산 확인: python -m benchmarks startup
+"""
+import importlib
+import threading
+from typing import Iterable
+
+# 창 표시 전에는 로드되지 않아야 하는 모듈 (benchmarks startup이 확인)
+DEFERRED_MODULES = ("numpy", "cv2")
+
+
+def _preload(modules: Iterable[str]):
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            # 실제 사용 시점에 다시 import하며 오류를 보고
+            pass
+
+
+def preload_heavy_modules(modules: Iterable[str] = DEFERRED_MODULES) -> threading.Thread:
+    """무거운 모듈을 백그라운드 스레드에서 로드 (창 표시 후 호출)"""
+    thread = threading.Thread(target=_preload, args=(tuple(modules),), name="preload", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,193 @@
+"""배치 실행 타임라인 기록 (Trace Event Format JSON)
+
+chrome://tracing, Perfetto(ui.perfetto.dev), speedscope 등에서 열 수 있다.
+
+- 워커 프로세스마다 레인 1개: 작업(파일) 구간 아래에 단계(decode/rotate/encode...) 구간이 겹쳐 표시
+- 코디네이터 프로세스 레인 (dispatch/result/qt_delivery는 작업끼리 겹치므로 async 이벤트)
+  - dispatch: 작업 투입 ~ 워커가 처리 시작 (큐 대기 + 작업 전달 IPC)
+  - result: 워커 처리 끝 ~ 코디네이터 결과 수신 (결과 전달 IPC + 코디네이터 지연)
+  - coordinator: 결과 처리(on_result 콜백) 구간, 메모리 예산 보류 표시
+  - qt_delivery: GUI에서 결과 보고 ~ Qt 시그널 수신 (UI 스레드 지연)
+- queue 카운터: 대기/실행 중 작업 수 변화
+
+시간은 perf_counter 기준 (Windows/Linux/macOS 모두 프로세스 간 공유되는 단조 시계).
+"""
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Optional
+
+from .run_report import run_artifact_path
+
+TRACE_PREFIX = "trace"
+
+# 코디네이터 프로세스의 레인 (tid)
+LANE_COORDINATOR = 1
+LANE_DISPATCH = 2
+LANE_RESULT = 3
+LANE_QT = 4
+_LANE_NAMES = {
+    LANE_COORDINATOR: "coordinator",
+    LANE_DISPATCH: "dispatch (queue + IPC)",
+    LANE_RESULT: "result (IPC + coordinator)",
+    LANE_QT: "qt_delivery",
+}
+
+
+def trace_path_for(output_dir: Path, when: Optional[datetime] = None) -> Path:
+    """출력 폴더 안 실행별 트레이스 경로 (예: out/trace_20260101-093000.json, 리포트/프로파일과 같은 위치)"""
+    return run_artifact_path(output_dir, TRACE_PREFIX, when)
+
+
+def worker_trace(start: float, end: float, spans: Optional[list]) -> dict:
+    """워커가 결과와 함께 보내는 작업 1개의 구간 정보"""
+    return {"pid": os.getpid(), "start": start, "end": end, "spans": spans or []}
+
+
+class TraceRecorder:
+    """코디네이터 측 트레이스 이벤트 수집 (스레드 안전)"""
+
+    def __init__(self):
+        self.origin = perf_counter()
+        self.pid = os.getpid()
+        self.events: list[dict] = []
+        self._lock = threading.Lock()
+        self._submitted: dict[int, float] = {}
+        self._next_id = 0
+        self._workers: set[int] = set()
+        self._meta(self.pid, None, "process_name", "coordinator")
+        for tid, name in _LANE_NAMES.items():
+            self._meta(self.pid, tid, "thread_name", name)
+            self._meta(self.pid, tid, "thread_sort_index", tid)
+
+    def _us(self, t: float) -> float:
+        return round((t - self.origin) * 1_000_000, 1)
+
+    def _append(self, event: dict):
+        with self._lock:
+            self.events.append(event)
+
+    def _meta(self, pid: int, tid: Optional[int], name: str, value):
+        key = "sort_index" if name.endswith("sort_index") else "name"
+        event = {"ph": "M", "pid": pid, "name": name, "args": {key: value}}
+        if tid is not None:
+            event["tid"] = tid
+        self.events.append(event)
+
+    def _span(self, name: str, pid: int, tid: int, start: float, end: float, **args):
+        event = {
+            "ph": "X",
+            "name": name,
+            "pid": pid,
+            "tid": tid,
+            "ts": self._us(start),
+            "dur": round(max(end - start, 0.0) * 1_000_000, 1),
+        }
+        if args:
+            event["args"] = args
+        self._append(event)
+
+    def _async(self, name: str, tid: int, start: float, end: float, **args):
+        """겹칠 수 있는 구간 (뷰어가 행을 나눠 표시)"""
+        with self._lock:
+            self._next_id += 1
+            event_id = self._next_id
+        common = {
+            "cat": _LANE_NAMES[tid].split()[0],
+            "id": event_id,
+            "name": name,
+            "pid": self.pid,
+            "tid": tid,
+        }
+        begin = {"ph": "b", **common, "ts": self._us(start)}
+        if args:
+            begin["args"] = args
+        self._append(begin)
+        self._append({"ph": "e", **common, "ts": self._us(max(start, end))})
+
+    def counter(self, name: str, **values):
+        self._append(
+            {"ph": "C", "name": name, "pid": self.pid, "ts": self._us(perf_counter()), "args": values}
+        )
+
+    def instant(self, name: str, tid: int = LANE_COORDINATOR, **args):
+        event = {"ph": "i", "s": "t", "name": name, "pid": self.pid, "tid": tid, "ts": self._us(perf_counter())}
+        if args:
+            event["args"] = args
+        self._append(event)
+
+    @contextmanager
+    def span(self, name: str, tid: int = LANE_COORDINATOR, **args):
+        """코디네이터 레인 구간"""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self._span(name, self.pid, tid, start, perf_counter(), **args)
+
+    def submitted(self, task: dict, pending: int, running: int):
+        self._submitted[id(task)] = perf_counter()
+        self.counter("queue", pending=pending, running=running)
+
+    def completed(self, task: dict, result: dict, pending: int, running: int):
+        """작업 결과 수신: 워커 레인(작업+단계) + 전달 구간 기록"""
+        received = perf_counter()
+        submitted = self._submitted.pop(id(task), None)
+        self.counter("queue", pending=pending, running=running)
+
+        trace = result.get("trace")
+        if not trace:
+            return
+        name = Path(result["filepath"]).name
+        pid = trace["pid"]
+        if pid not in self._workers:
+            self._workers.add(pid)
+            label = "worker (sequential)" if pid == self.pid else f"worker {pid}"
+            with self._lock:
+                self._meta(pid, pid, "thread_name", label)
+                if pid != self.pid:
+                    self._meta(pid, None, "process_name", label)
+
+        self._span(
+            name,
+            pid,
+            pid,
+            trace["start"],
+            trace["end"],
+            file=result["filepath"],
+            success=result["success"],
+            megapixels=round(result.get("megapixels") or 0.0, 2),
+        )
+        for stage_name, start, end in trace["spans"]:
+            self._span(stage_name, pid, pid, start, end)
+
+        if submitted is not None:
+            self._async(name, LANE_DISPATCH, submitted, trace["start"], worker=pid)
+        self._async(name, LANE_RESULT, trace["end"], received, worker=pid)
+
+    def reported(self, result: dict):
+        """결과를 on_result로 넘기는 시점 (Qt 시그널 전달 지연 측정 기준)"""
+        if result.get("trace"):
+            result["trace"]["reported"] = perf_counter()
+
+    def delivered(self, result: dict):
+        """GUI 스레드가 결과 시그널을 받은 시점"""
+        trace = result.get("trace")
+        if trace and "reported" in trace:
+            self._async(Path(result["filepath"]).name, LANE_QT, trace["reported"], perf_counter())
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            events = list(self.events)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        return path
@@ -0,0 +1,353 @@
+"""폴더 감시 모드 - 새 이미지를 한 번씩 자동 변환
+
+- Linux: inotify (ctypes), 그 외/실패 시: 주기적 스캔(polling)으로 폴백
+- 파일 크기/수정 시각이 settle 초 동안 변하지 않아야 처리 (복사/동기화 중 파일 제외)
+- 처리 결과를 출력 폴더의 기록 파일(JSON Lines)에 남겨 재시작 시 다시 처리하지 않음
+- BatchEngine의 feed 모드로 워커 풀을 계속 유지 → 새 파일당 지연 = 파이프라인 1회
+"""
+import ctypes
+import ctypes.util
+import json
+import os
+import platform
+import select
+import struct
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+from .constants import IMAGE_EXTENSIONS
+
+LEDGER_FILENAME = ".setakgi_watch.jsonl"
+
+DEFAULT_SETTLE_SECONDS = 2.0
+DEFAULT_POLL_INTERVAL = 2.0
+
+# inotify 이벤트 마스크 (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+def is_watchable_image(path: Path) -> bool:
+    """감시 대상 이미지 (숨김/임시 저장 파일 제외)"""
+    return not path.name.startswith(".") and path.suffix.lower() in IMAGE_EXTENSIONS
+
+
+def file_signature(path: str) -> Optional[tuple[int, int]]:
+    """(크기, 수정 시각 ns) - 파일이 없으면 None"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def scan_images(root: Path, recursive: bool, exclude: Optional[Path] = None) -> list[str]:
+    """폴더 내 이미지 파일 (os.scandir 기반)"""
+    found = []
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = list(os.scandir(current))
+        except OSError:
+            continue
+        for entry in entries:
+            path = Path(entry.path)
+            if entry.is_dir(follow_symlinks=False):
+                if recursive and not entry.name.startswith(".") and path != exclude:
+                    stack.append(path)
+            elif entry.is_file() and is_watchable_image(path):
+                found.append(entry.path)
+    return found
+
+
+class PollingBackend:
+    """주기적 스캔으로 변경 감지 (모든 플랫폼)"""
+
+    name = "polling"
+
+    def __init__(self, roots: list[Path], recursive: bool, exclude: Optional[Path], interval: float):
+        self.roots = roots
+        self.recursive = recursive
+        self.exclude = exclude
+        self.interval = interval
+        self._snapshot: dict[str, tuple[int, int]] = {}
+        self._last_scan = 0.0
+
+    def changes(self) -> set[str]:
+        now = time.monotonic()
+        if now - self._last_scan < self.interval:
+            return set()
+        self._last_scan = now
+
+        changed = set()
+        snapshot = {}
+        for root in self.roots:
+            for path in scan_images(root, self.recursive, self.exclude):
+                sig = file_signature(path)
+                if sig is None:
+                    continue
+                snapshot[path] = sig
+                if self._snapshot.get(path) != sig:
+                    changed.add(path)
+        self._snapshot = snapshot
+        return changed
+
+    def close(self):
+        pass
+
+
+class InotifyBackend:
+    """Linux inotify 기반 변경 감지 (ctypes, 외부 의존성 없음)"""
+
+    name = "inotify"
+
+    def __init__(self, roots: list[Path], recursive: bool, exclude: Optional[Path]):
+        libc_name = ctypes.util.find_library("c")
+        if platform.system() != "Linux" or not libc_name:
+            raise OSError("inotify 미지원 플랫폼")
+
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 실패")
+
+        self.recursive = recursive
+        self.exclude = exclude
+        self._watches: dict[int, Path] = {}
+        self._rescan: set[Path] = set()
+        for root in roots:
+            self._add_tree(root)
+
+    def _add_watch(self, directory: Path):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch 실패: {directory}")
+        self._watches[wd] = directory
+
+    def _add_tree(self, root: Path):
+        self._add_watch(root)
+        if not self.recursive:
+            return
+        for dirpath, dirnames, _ in os.walk(root):
+            dirnames[:] = [
+                d for d in dirnames
+                if not d.startswith(".") and Path(dirpath, d) != self.exclude
+            ]
+            for d in dirnames:
+                self._add_watch(Path(dirpath, d))
+
+    def changes(self) -> set[str]:
+        changed = set()
+        # 새로 생긴 하위 폴더: 감시 등록 전에 들어온 파일까지 스캔
+        for directory in self._rescan:
+            changed.update(scan_images(directory, self.recursive, self.exclude))
+        self._rescan.clear()
+
+        while True:
+            readable, _, _ = select.select([self._fd], [], [], 0)
+            if not readable:
+                break
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, name_len = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + name_len].rstrip(b"\0")
+                offset += name_len
+
+                if mask & IN_Q_OVERFLOW:
+                    # 이벤트 유실 → 전체 다시 스캔
+                    self._rescan.update(self._watches.values())
+                    continue
+
+                directory = self._watches.get(wd)
+                if directory is None or not name:
+                    continue
+                path = directory / os.fsdecode(name)
+
+                if mask & IN_ISDIR:
+                    if self.recursive and (mask & (IN_CREATE | IN_MOVED_TO)) and path != self.exclude:
+                        try:
+                            self._add_tree(path)
+                            self._rescan.add(path)
+                        except OSError:
+                            pass
+                elif is_watchable_image(path):
+                    changed.add(str(path))
+
+        return changed
+
+    def close(self):
+        os.close(self._fd)
+
+
+class FolderWatcher:
+    """감시 백엔드 + 파일 안정화 대기
+
+    poll()은 settle 초 동안 크기/수정 시각이 변하지 않은 파일 경로를 돌려준다.
+    """
+
+    def __init__(
+        self,
+        roots: list[str],
+        recursive: bool = False,
+        exclude: Optional[str] = None,
+        settle_seconds: float = DEFAULT_SETTLE_SECONDS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        force_polling: bool = False,
+    ):
+        self.roots = [Path(r).resolve() for r in roots]
+        self.recursive = recursive
+        self.exclude = Path(exclude).resolve() if exclude else None
+        self.settle_seconds = settle_seconds
+        # path → (signature, 마지막 변경 감지 시각)
+        self._settling: dict[str, tuple[tuple[int, int], float]] = {}
+
+        self.backend = None
+        if not force_polling:
+            try:
+                self.backend = InotifyBackend(self.roots, recursive, self.exclude)
+            except (OSError, AttributeError):
+                self.backend = None
+        if self.backend is None:
+            self.backend = PollingBackend(self.roots, recursive, self.exclude, poll_interval)
+
+    def initial_files(self) -> list[str]:
+        """시작 시점에 이미 있는 이미지 (기록에 없는 것은 처리 대상)"""
+        files = []
+        for root in self.roots:
+            files.extend(scan_images(root, self.recursive, self.exclude))
+        return sorted(files)
+
+    def track(self, paths):
+        """안정화 대기 목록에 추가"""
+        now = time.monotonic()
+        for path in paths:
+            sig = file_signature(path)
+            if sig is not None:
+                self._settling[path] = (sig, now)
+
+    def poll(self) -> list[str]:
+        self.track(self.backend.changes())
+
+        now = time.monotonic()
+        ready = []
+        for path, (sig, since) in list(self._settling.items()):
+            current = file_signature(path)
+            if current is None:
+                del self._settling[path]
+            elif current != sig:
+                self._settling[path] = (current, now)
+            elif now - since >= self.settle_seconds:
+                del self._settling[path]
+                ready.append(path)
+        return sorted(ready)
+
+    def close(self):
+        self.backend.close()
+
+
+class CompletionLedger:
+    """처리 완료 기록 (출력 폴더의 JSON Lines 파일)
+
+    (경로, 크기, 수정 시각)이 같으면 이미 처리된 것으로 본다 → 파일이 바뀌면 다시 처리.
+    실패도 기록해 같은 파일을 재시작 때마다 재시도하지 않는다.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._done: set[tuple[str, int, int]] = set()
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    self._done.add((entry["file"], entry["size"], entry["mtime_ns"]))
+                except (json.JSONDecodeError, KeyError):
+                    continue  # 중단된 쓰기로 깨진 줄 무시
+
+    def _key(self, filepath: str, signature: tuple[int, int]) -> tuple[str, int, int]:
+        return filepath, signature[0], signature[1]
+
+    def is_done(self, filepath: str, signature: Optional[tuple[int, int]] = None) -> bool:
+        signature = signature or file_signature(filepath)
+        return signature is not None and self._key(filepath, signature) in self._done
+
+    def record(self, filepath: str, signature: tuple[int, int], success: bool, result: str):
+        entry = {
+            "file": filepath,
+            "size": signature[0],
+            "mtime_ns": signature[1],
+            "success": success,
+            "result": result,
+            "time": datetime.now().isoformat(timespec="seconds"),
+        }
+        with self._lock:
+            self._done.add(self._key(filepath, signature))
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+class WatchService:
+    """FolderWatcher + CompletionLedger를 BatchEngine feed로 연결
+
+    make_task(filepath) → 작업 dict (None이면 건너뜀)
+    """
+
+    def __init__(
+        self,
+        watcher: FolderWatcher,
+        ledger: CompletionLedger,
+        make_task: Callable[[str], Optional[dict]],
+    ):
+        self.watcher = watcher
+        self.ledger = ledger
+        self.make_task = make_task
+        # 작업 투입 시점의 파일 서명 (완료 기록용)
+        self._in_flight: dict[str, tuple[int, int]] = {}
+
+    def start(self) -> int:
+        """기존 파일 중 미처리분을 안정화 대기에 등록, 등록 개수 반환"""
+        pending = [f for f in self.watcher.initial_files() if not self.ledger.is_done(f)]
+        self.watcher.track(pending)
+        return len(pending)
+
+    def feed(self) -> list[dict]:
+        tasks = []
+        for path in self.watcher.poll():
+            sig = file_signature(path)
+            if sig is None or path in self._in_flight or self.ledger.is_done(path, sig):
+                continue
+            task = self.make_task(path)
+            if task is None:
+                continue
+            self._in_flight[path] = sig
+            tasks.append(task)
+        return tasks
+
+    def on_result(self, result: dict):
+        sig = self._in_flight.pop(result["filepath"], None)
+        if sig is not None:
+            self.ledger.record(result["filepath"], sig, result["success"], result["result"])
@@ -1,9 +1,10 @@
 import sys
 from pathlib import Path
 from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QIcon
 
+from app.core.startup import preload_heavy_modules
 from app.ui.main_window import MainWindow
 
 
@@ -22,10 +23,11 @@ def get_icon_path() -> Path:
     return dev_path  # 없어도 일단 경로 반환
 
 
-def main():
+def create_application(argv: list) -> QApplication:
+    """QApplication 생성 + 앱 정보/아이콘 설정"""
     QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
 
-    app = QApplication(sys.argv)
+    app = QApplication(argv)
     app.setApplicationName("Image Setakgi")
     app.setApplicationVersion("1.0.0")
 
@@ -33,10 +35,18 @@ def main():
     icon_path = get_icon_path()
     if icon_path.exists():
         app.setWindowIcon(QIcon(str(icon_path)))
+    return app
+
+
+def main():
+    app = create_application(sys.argv)
 
     window = MainWindow()
     window.show()
 
+    # 창이 그려진 뒤 numpy/cv2 등을 백그라운드에서 로드
+    QTimer.singleShot(0, preload_heavy_modules)
+
     sys.exit(app.exec())
 
 
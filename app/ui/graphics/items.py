@@ -1,6 +1,9 @@
 """그래픽스 아이템 컴포넌트"""
+from typing import Optional
+
 from PySide6.QtWidgets import QGraphicsPixmapItem
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import QRectF
+from PySide6.QtGui import QPixmap, QTransform
 
 
 class TransformableImageItem(QGraphicsPixmapItem):
@@ -9,3 +12,32 @@ class TransformableImageItem(QGraphicsPixmapItem):
     def __init__(self, pixmap: QPixmap, parent=None):
         super().__init__(pixmap, parent)
         self.setFlag(QGraphicsPixmapItem.GraphicsItemFlag.ItemIsMovable, False)
+        self._proxy_clip: Optional[QRectF] = None
+
+    def set_proxy(self, transform: QTransform, size: tuple[int, int]) -> None:
+        """다시 렌더하기 전까지 표시 중인 pixmap을 변형해 새 기하를 보여줌 (새 프레임 크기 밖은 잘라냄)"""
+        self.prepareGeometryChange()
+        if transform.isIdentity():
+            self._proxy_clip = None
+        else:
+            self._proxy_clip = QRectF(0, 0, size[0], size[1])
+        self.setTransform(transform)
+
+    def frame_rect(self) -> QRectF:
+        """화면에 보이는 프레임 영역 (프록시 중이면 새 프레임 크기)"""
+        return self._proxy_clip if self._proxy_clip is not None else self.boundingRect()
+
+    def paint(self, painter, option, widget=None) -> None:
+        if self._proxy_clip is None:
+            super().paint(painter, option, widget)
+            return
+
+        # 클립은 변형 전(부모) 좌표계에서 지정
+        painter.save()
+        device = painter.transform()
+        inverted, _ = self.transform().inverted()
+        painter.setTransform(inverted * device)
+        painter.setClipRect(self._proxy_clip)
+        painter.setTransform(device)
+        super().paint(painter, option, widget)
+        painter.restore()
@@ -4,7 +4,7 @@ from typing import Optional
 
 from PySide6.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsRectItem, QGraphicsPathItem
 from PySide6.QtCore import Qt, Signal, QRectF, QPointF
-from PySide6.QtGui import QPixmap, QPen, QColor, QPainter, QPainterPath
+from PySide6.QtGui import QPixmap, QPen, QColor, QPainter, QPainterPath, QTransform
 
 from .handles import ResizeHandle
 from .items import TransformableImageItem
@@ -22,6 +22,8 @@ class PreviewGraphicsView(QGraphicsView):
     transform_started = Signal()
     transform_ended = Signal()
     perspective_changed = Signal(list)
+    viewport_resized = Signal()
+    frame_painted = Signal()  # set_image로 넣은 프레임이 처음 그려진 뒤 (지연 계측)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -56,6 +58,7 @@ class PreviewGraphicsView(QGraphicsView):
 
         self._rotation_angle = 0.0
         self._original_size: tuple[int, int] = (0, 0)
+        self._frame_pending = False
 
     def set_keep_ratio(self, keep: bool) -> None:
         """비율 유지 여부 설정"""
@@ -94,10 +97,13 @@ class PreviewGraphicsView(QGraphicsView):
 
         self._image_item = TransformableImageItem(pixmap)
         self._scene.addItem(self._image_item)
+        self._frame_pending = True
 
-        self._current_width = pixmap.width()
-        self._current_height = pixmap.height()
-        self._original_aspect = pixmap.width() / pixmap.height() if pixmap.height() > 0 else 1
+        # 고해상도 단계 렌더는 devicePixelRatio로 기준 좌표 크기를 가짐
+        size = pixmap.deviceIndependentSize()
+        self._current_width = round(size.width())
+        self._current_height = round(size.height())
+        self._original_aspect = size.width() / size.height() if size.height() > 0 else 1
 
         if self._free_transform_mode:
             rect = self._image_item.boundingRect()
@@ -114,8 +120,45 @@ class PreviewGraphicsView(QGraphicsView):
         self._create_border()
         self._create_handles()
         self._update_handles_position()
-
-        rect = self._scene.itemsBoundingRect()
+        self._fit_to_rect(self._scene.itemsBoundingRect())
+
+    def required_preview_pixels(self, frame_size: Optional[tuple[int, int]] = None) -> float:
+        """frame_size(기준 좌표) 프레임을 지금 뷰에 맞춰 그릴 때 긴 변의 디바이스 픽셀 수
+
+        frame_size가 없으면 (비율을 모르는 새 파일) 뷰 긴 변 기준 상한
+        """
+        viewport = self.viewport().size()
+        pad = 1 + 2 * PADDING_RATIO
+        dpr = self.devicePixelRatioF()
+        if not frame_size or min(frame_size) <= 0:
+            return max(viewport.width(), viewport.height()) / pad * dpr
+        w, h = frame_size
+        scale = min(viewport.width() / (w * pad), viewport.height() / (h * pad))
+        return max(w, h) * scale * dpr
+
+    def paintEvent(self, event) -> None:
+        super().paintEvent(event)
+        if self._frame_pending:
+            self._frame_pending = False
+            self.frame_painted.emit()
+
+    def resizeEvent(self, event) -> None:
+        """뷰 크기가 바뀌면 다시 맞추고 알림 (필요한 렌더 해상도가 달라질 수 있음)"""
+        super().resizeEvent(event)
+        if self._image_item is not None and not self._dragging:
+            self._fit_to_rect(self._content_rect())
+        self.viewport_resized.emit()
+
+    def _content_rect(self) -> QRectF:
+        """프레임과 테두리/핸들을 모두 포함하는 영역"""
+        rect = self._image_item.frame_rect()
+        for item in [self._border_rect, *self._handles.values()]:
+            if item is not None:
+                rect = rect.united(item.sceneBoundingRect())
+        return rect
+
+    def _fit_to_rect(self, rect: QRectF) -> None:
+        """여백을 두고 rect가 뷰에 꽉 차도록 맞춤"""
         padding_x = rect.width() * PADDING_RATIO
         padding_y = rect.height() * PADDING_RATIO
         padded_rect = rect.adjusted(-padding_x, -padding_y, padding_x, padding_y)
@@ -216,7 +259,7 @@ class PreviewGraphicsView(QGraphicsView):
         if self._rotation_angle != 0 and self._original_size[0] > 0:
             self._update_rotated_border()
         else:
-            rect = self._image_item.boundingRect()
+            rect = self._image_item.frame_rect()
             self._update_border_rect(rect)
 
     def _update_rotated_border(self) -> None:
@@ -228,7 +271,7 @@ class PreviewGraphicsView(QGraphicsView):
         if orig_w <= 0 or orig_h <= 0:
             return
 
-        rect = self._image_item.boundingRect()
+        rect = self._image_item.frame_rect()
         cx = rect.center().x()
         cy = rect.center().y()
 
@@ -404,6 +447,18 @@ class PreviewGraphicsView(QGraphicsView):
         if self._image_item and not self._free_transform_mode:
             self._update_rotated_border()
 
+    def set_proxy_transform(self, transform: QTransform, size: tuple[int, int]) -> None:
+        """표시 중인 이미지를 다시 렌더하지 않고 변형해서 표시 (드래그 중 기하 변경 미리보기)"""
+        if self._image_item is None:
+            return
+        self._image_item.set_proxy(transform, size)
+        if not self._free_transform_mode:
+            self._update_border_only()
+
+        # 핸들 드래그 중에는 배율을 바꾸지 않음 (마우스 아래 좌표 유지)
+        if not self._dragging:
+            self._fit_to_rect(self._content_rect())
+
     def reset_corner_offsets(self) -> None:
         """코너 위치 초기화"""
         if self._image_item and self._free_transform_mode:
@@ -1,13 +1,81 @@
-"""변환 로그 위젯"""
+"""변환 로그 위젯
+
+- 메시지는 용량이 정해진 링 버퍼(LogBuffer)에 저장 → 긴 랜덤 변환에서도 메모리 일정
+- 화면은 QPlainTextEdit에 최근 VIEW_MAX_BLOCKS줄만 유지 (오래된 줄은 Qt가 잘라냄)
+- add_log는 버퍼에 쌓기만 하고 FLUSH_INTERVAL_MS마다 모아서 한 번에 그림 (초당 최대 약 20회)
+- 버퍼 전체는 "로그 저장"으로 파일로 내보냄
+"""
+import time
+from collections import deque
+from typing import NamedTuple
+
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
-    QTextEdit,
+    QPlainTextEdit,
     QLabel,
     QPushButton,
     QHBoxLayout,
+    QFileDialog,
+    QMessageBox,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QColor, QTextCharFormat, QTextCursor
+
+LOG_CAPACITY = 100_000  # 버퍼에 보관하는 최대 메시지 수 (내보내기 범위)
+VIEW_MAX_BLOCKS = 5_000  # 화면에 남기는 최대 줄 수
+FLUSH_INTERVAL_MS = 50
+
+COLOR_MAP = {
+    "info": "#00ff00",
+    "success": "#4caf50",
+    "error": "#ff5252",
+    "warning": "#ffc107",
+    "separator": "#666666",
+}
+SEPARATOR = "─" * 40
+
+
+class LogEntry(NamedTuple):
+    timestamp: float
+    log_type: str
+    message: str
+
+
+class LogBuffer:
+    """용량 고정 링 버퍼 (가득 차면 가장 오래된 메시지부터 버림)"""
+
+    def __init__(self, capacity: int = LOG_CAPACITY):
+        self._entries: deque[LogEntry] = deque(maxlen=capacity)
+        self.total = 0  # 지금까지 추가된 메시지 수 (버려진 것 포함)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def dropped(self) -> int:
+        return self.total - len(self._entries)
+
+    def append(self, entry: LogEntry):
+        self._entries.append(entry)
+        self.total += 1
+
+    def clear(self):
+        self._entries.clear()
+        self.total = 0
+
+    def lines(self) -> list[str]:
+        return [
+            f"{time.strftime('%H:%M:%S', time.localtime(e.timestamp))} [{e.log_type}] {e.message}"
+            for e in self._entries
+        ]
+
+    def export(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            if self.dropped:
+                f.write(f"# 앞선 {self.dropped}개 메시지는 버퍼 용량({self._entries.maxlen}) 초과로 생략\n")
+            for line in self.lines():
+                f.write(line + "\n")
 
 
 class LogWidget(QWidget):
@@ -15,6 +83,18 @@ class LogWidget(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._buffer = LogBuffer()
+        self._pending: list[LogEntry] = []
+        self._formats: dict[str, QTextCharFormat] = {}
+        for log_type, color in COLOR_MAP.items():
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            self._formats[log_type] = fmt
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -26,6 +106,11 @@ class LogWidget(QWidget):
         title.setStyleSheet("font-weight: bold; color: #fff;")
         header_layout.addWidget(title)
 
+        self._export_btn = QPushButton("로그 저장")
+        self._export_btn.setFixedWidth(80)
+        self._export_btn.clicked.connect(self._export_dialog)
+        header_layout.addWidget(self._export_btn)
+
         self._clear_btn = QPushButton("로그 지우기")
         self._clear_btn.setFixedWidth(80)
         self._clear_btn.clicked.connect(self.clear)
@@ -33,10 +118,12 @@ class LogWidget(QWidget):
 
         layout.addLayout(header_layout)
 
-        self._log_text = QTextEdit()
+        self._log_text = QPlainTextEdit()
         self._log_text.setReadOnly(True)
+        self._log_text.setUndoRedoEnabled(False)
+        self._log_text.setMaximumBlockCount(VIEW_MAX_BLOCKS)
         self._log_text.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #1e1e1e;
                 color: #00ff00;
                 font-family: 'Courier New', monospace;
@@ -49,24 +136,64 @@ class LogWidget(QWidget):
         self._log_text.setMaximumHeight(200)
         layout.addWidget(self._log_text)
 
+    @property
+    def buffer(self) -> LogBuffer:
+        return self._buffer
+
     def add_log(self, message: str, log_type: str = "info"):
-        """로그 메시지 추가"""
-        color_map = {
-            "info": "#00ff00",
-            "success": "#4caf50",
-            "error": "#ff5252",
-            "warning": "#ffc107",
-        }
-        color = color_map.get(log_type, "#00ff00")
-        self._log_text.append(f'<span style="color: {color}">{message}</span>')
-        self._log_text.verticalScrollBar().setValue(
-            self._log_text.verticalScrollBar().maximum()
-        )
+        """로그 메시지 추가 (화면에는 다음 flush 때 표시)"""
+        entry = LogEntry(time.time(), log_type, message)
+        self._buffer.append(entry)
+        self._pending.append(entry)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def add_separator(self):
+        """구분선 추가"""
+        self.add_log(SEPARATOR, "separator")
 
     def clear(self):
         """로그 지우기"""
+        self._flush_timer.stop()
+        self._pending = []
+        self._buffer.clear()
         self._log_text.clear()
 
-    def add_separator(self):
-        """구분선 추가"""
-        self._log_text.append('<span style="color: #666">─' * 40 + "</span>")
+    def _flush(self):
+        """쌓인 메시지를 한 번의 편집으로 추가"""
+        # 화면 줄 수 제한을 넘는 앞부분은 어차피 잘리므로 그리지 않음
+        pending = self._pending[-VIEW_MAX_BLOCKS:]
+        self._pending = []
+        if not pending:
+            return
+
+        scrollbar = self._log_text.verticalScrollBar()
+        # 사용자가 위로 스크롤해 읽는 중이면 위치 유지
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 2
+
+        document = self._log_text.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        first = document.isEmpty()
+        default_format = self._formats["info"]
+        for entry in pending:
+            if not first:
+                cursor.insertBlock()
+            first = False
+            cursor.insertText(entry.message, self._formats.get(entry.log_type, default_format))
+        cursor.endEditBlock()
+
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def _export_dialog(self):
+        path, _ = QFileDialog.getSaveFileName(
+            self, "로그 저장", f"log_{time.strftime('%Y%m%d_%H%M%S')}.txt", "Text (*.txt)"
+        )
+        if not path:
+            return
+        try:
+            self._buffer.export(path)
+        except OSError as e:
+            QMessageBox.warning(self, "경고", f"로그 저장 실패: {e}")
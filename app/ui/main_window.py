@@ -4,39 +4,82 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QVBoxLayout,
     QSplitter,
-    QListWidget,
-    QListWidgetItem,
     QPushButton,
+    QCheckBox,
     QFileDialog,
     QProgressBar,
     QLabel,
     QMessageBox,
     QApplication,
 )
-from PySide6.QtCore import Qt, Signal, QThreadPool, QRunnable, QObject, QEvent
+import threading
+from time import perf_counter
+
+from PySide6.QtCore import Qt, Signal, QThreadPool, QRunnable, QObject, QEvent, QTimer
 from PySide6.QtGui import QDragEnterEvent, QDragLeaveEvent, QDropEvent, QPixmap, QIcon
-from PIL import Image, ImageOps
+from PIL import Image
 from pathlib import Path
 from typing import Optional
 
 from .preview_widget import PreviewWidget
 from .options_panel import OptionsPanel
 from .log_widget import LogWidget
-from .workers import TransformWorker, WorkerSignals
+from .workers import DecodeWorker, FolderScanWorker, ResultBatcher, TransformWorker, WorkerSignals
 from .workers.batch_worker import BatchTransformWorker
 from .widgets import FileListWidget, BusyOverlay
-from app.core.preview import PreviewThread, pil_to_qpixmap, create_thumbnail, MAX_PREVIEW_SIZE
+from app.core.preview import (
+    PREVIEW_IDLE_MS,
+    TIER_DRAFT,
+    TIER_FULL,
+    PreviewThread,
+    pil_to_qpixmap,
+    preview_level_for,
+    proxy_transform,
+)
+from app.core.constants import MAX_PREVIEW_SIZE
+from app.core.preview_latency import FrameTiming, PreviewLatency, RenderTiming
 from app.core.image_ops import apply_transforms
 from app.core.metadata import remove_exif
 from app.core.transform_history import record_transform
-from app.core.save_output import OutputManager
+from app.core.save_output import OutputManager, cleanup_partial_outputs
 from app.core.config import load_config, save_config
+from app.core.file_scan import DEFAULT_MAX_DEPTH
+from app.core.preview_cache import (
+    DEFAULT_DECODE_CACHE_MB,
+    DEFAULT_PREVIEW_CACHE_MB,
+    PreviewCache,
+    decoded_nbytes,
+    options_fingerprint,
+)
+from app.core.batch_engine import default_worker_count
+from app.core.scheduler import InteractionGate, read_oriented_size, resolve_memory_budget
+from app.core.memory_profile import MemoryStats
+from app.core.profiling import (
+    DEFAULT_PROFILE_EVERY,
+    MERGED_FILENAME,
+    hot_functions,
+    merge_profiles,
+    parts_dir_for,
+    should_profile,
+)
+from app.core.profiling import summary_lines as profile_summary_lines
+from app.core.run_report import RunReport, report_path_for, summary_lines, write_report
+from app.core.stage_timing import StageStats
+from app.core.trace import trace_path_for
 from app.core.random_transform import (
     RandomTransformConfig,
-    generate_random_options,
+    generate_random_task_options,
     format_random_log,
 )
 
+# 취소 후 이 시간 안에 끝나지 않으면 강제 종료 여부 확인
+CANCEL_ESCALATION_MS = 5000
+# 미리보기 디코딩 스레드 수 (선택한 파일 1 + 이웃 미리 디코딩)
+DECODE_THREADS = 2
+DEFAULT_PREFETCH_NEIGHBORS = 2
+# 미리보기 지연 오버레이 갱신 간격
+LATENCY_OVERLAY_MS = 250
+
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -51,20 +94,86 @@ class MainWindow(QMainWindow):
         # Windows 드래그앤 드랍 지원 - MainWindow 레벨
         self.setAcceptDrops(True)
 
-        self._files: list[str] = []
         self._current_file: Optional[str] = None
         self._current_image: Optional[Image.Image] = None
         self._thread_pool = QThreadPool()
-        self._preview_thread: Optional[PreviewThread] = None
+        # 미리보기 렌더 스레드 (재사용) + 조작이 멈춘 뒤 고품질 렌더 타이머
+        self._preview_thread = PreviewThread(self)
+        self._pending_preview_tier: Optional[str] = None
+        self._preview_idle_timer = QTimer(self)
+        self._preview_idle_timer.setSingleShot(True)
+        self._preview_idle_timer.setInterval(PREVIEW_IDLE_MS)
+        self._preview_idle_timer.timeout.connect(self._update_preview)
+        # 렌더 중인/표시 중인 프레임의 옵션 (드래그 중 QTransform 프록시 기준)
+        self._rendering_options: Optional[dict] = None
+        self._displayed_options: Optional[dict] = None
 
         self._config = load_config()
+        # 배치 중 미리보기 우선: 워커는 낮은 우선순위 + 조작 직후 새 작업 투입 보류,
+        # 랜덤 모드 스레드는 코어 1개를 GUI/미리보기 몫으로 남김 (배치 프로세스 워커 수와 같음)
+        self._preview_priority = self._config.get("preview_priority", True)
+        self._interaction_gate = InteractionGate()
+        if self._preview_priority:
+            self._thread_pool.setMaxThreadCount(default_worker_count())
+        # 고품질 프레임 캐시 - 같은 파일/옵션으로 돌아오면 렌더 없이 바로 표시
+        self._preview_cache = PreviewCache(
+            self._config.get("preview_cache_mb", DEFAULT_PREVIEW_CACHE_MB) * 1024 * 1024
+        )
+        self._source_identity: Optional[tuple] = None
+        self._rendering_key: Optional[tuple] = None
+        # 렌더 중인/표시 중인 프레임의 해상도 단계 (뷰 크기가 바뀌면 비교)
+        self._rendering_level = MAX_PREVIEW_SIZE
+        self._displayed_level: Optional[int] = None
+        # 렌더 중에 캐시 프레임을 표시했거나 파일이 바뀌면 도착한 렌더 결과는 캐시에만 저장
+        self._stale_render = False
+        # 미리보기 해상도 디코딩 (선택한 파일 + 앞뒤 이웃 미리 디코딩), 경로 → DecodedPreview
+        self._decode_pool = QThreadPool(self)
+        self._decode_pool.setMaxThreadCount(DECODE_THREADS)
+        self._decode_jobs: dict[str, DecodeWorker] = {}
+        self._decode_cache = PreviewCache(
+            self._config.get("decode_cache_mb", DEFAULT_DECODE_CACHE_MB) * 1024 * 1024,
+            sizeof=decoded_nbytes,
+        )
+        # 옵션 변경 → 화면 표시 지연 (디버그 오버레이/로그는 config "preview_debug")
+        self._preview_latency = PreviewLatency()
+        self._rendering_input = 0.0
+        self._latency_overlay_timer = QTimer(self)
+        self._latency_overlay_timer.setInterval(LATENCY_OVERLAY_MS)
+        self._latency_overlay_timer.timeout.connect(self._update_latency_overlay)
         self._perspective_corners: Optional[list] = None
         self._loading_new_image = False
         self._completed = 0
         self._failed: list = []
+        self._stage_stats = StageStats()
+        self._memory_stats = MemoryStats()
+        self._run_report: Optional[RunReport] = None
+        self._profile_dir: Optional[Path] = None
+        self._tracing = False
         self._output_manager: Optional[OutputManager] = None
         self._workers: list = []
         self._random_mode = False
+        # 실행 시작 시점의 작업 수 (실행 중에도 파일 목록은 편집 가능)
+        self._run_total = 0
+        self._batch_worker: Optional[BatchTransformWorker] = None
+        # 워커 결과를 모아 화면 갱신 주기로 전달 (결과마다 시그널/진행률/로그 갱신하지 않음)
+        self._result_batcher = ResultBatcher(self)
+        # 진행 중인 폴더 검색 (취소/교체된 이전 검색은 끝나면 스스로 정리)
+        self._scan_worker: Optional[FolderScanWorker] = None
+        self._scan_output_dir = ""
+        self._scan_started = False
+        self._cancel_event = threading.Event()
+        self._processing = False
+        self._cancelling = False
+
+        self._cancel_timer = QTimer(self)
+        self._cancel_timer.setSingleShot(True)
+        self._cancel_timer.setInterval(CANCEL_ESCALATION_MS)
+        self._cancel_timer.timeout.connect(self._on_cancel_timeout)
+
+        # 랜덤 모드 취소 시 스레드 풀이 비었는지 확인
+        self._random_cancel_poll = QTimer(self)
+        self._random_cancel_poll.setInterval(100)
+        self._random_cancel_poll.timeout.connect(self._check_random_cancel_done)
 
         self._setup_ui()
         self._connect_signals()
@@ -73,6 +182,8 @@ class MainWindow(QMainWindow):
 
         # 자유변형 모드 초기화 (신호 연결 후 활성화)
         self._preview.set_free_transform_mode(True)
+        if self._config.get("preview_debug", False):
+            self.set_preview_debug(True)
 
     def _setup_ui(self):
         central = QWidget()
@@ -90,8 +201,20 @@ class MainWindow(QMainWindow):
         left_layout.addWidget(file_label)
 
         self._file_list = FileListWidget()
+        self._file_model = self._file_list.file_model
         left_layout.addWidget(self._file_list)
 
+        self._scan_bar = QWidget()
+        scan_layout = QHBoxLayout(self._scan_bar)
+        scan_layout.setContentsMargins(0, 0, 0, 0)
+        self._scan_label = QLabel("")
+        self._scan_label.setStyleSheet("color: #90caf9;")
+        self._scan_cancel_btn = QPushButton("검색 취소")
+        scan_layout.addWidget(self._scan_label, 1)
+        scan_layout.addWidget(self._scan_cancel_btn)
+        self._scan_bar.setVisible(False)
+        left_layout.addWidget(self._scan_bar)
+
         btn_layout1 = QHBoxLayout()
         self._add_btn = QPushButton("파일 추가")
         self._add_folder_btn = QPushButton("폴더 추가")
@@ -154,6 +277,13 @@ class MainWindow(QMainWindow):
         )
         right_layout.addWidget(self._random_btn)
 
+        self._profile_check = QCheckBox("다음 실행 CPU 프로파일링")
+        self._profile_check.setToolTip(
+            f"다음 변환 1회를 cProfile로 계측해 출력 폴더에 {MERGED_FILENAME}/profile.txt 저장, "
+            "상위 함수는 로그에 요약 (설정 profile_every로 계측 비율 조절)"
+        )
+        right_layout.addWidget(self._profile_check)
+
         self._output_path_label = QLabel("출력 폴더: 미선택")
         right_layout.addWidget(self._output_path_label)
 
@@ -164,23 +294,32 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(splitter)
 
     def _connect_signals(self):
-        self._file_list.files_dropped.connect(self._add_files)
-        self._file_list.currentRowChanged.connect(self._on_file_selected)
+        self._file_list.paths_dropped.connect(self._scan_paths)
+        self._file_list.current_row_changed.connect(self._on_file_selected)
 
         self._add_btn.clicked.connect(self._open_file_dialog)
         self._add_folder_btn.clicked.connect(self._open_folder_dialog)
         self._remove_btn.clicked.connect(self._remove_selected)
         self._clear_btn.clicked.connect(self._clear_files)
+        self._scan_cancel_btn.clicked.connect(self._on_scan_cancel_clicked)
 
         self._options.options_changed.connect(self._on_options_changed)
         self._options.free_transform_toggled.connect(self._on_free_transform_toggle)
         self._options.reset_requested.connect(self._on_reset_requested)
         self._options.perspective_offset_changed.connect(self._on_perspective_offset_changed)
         self._preview.perspective_changed.connect(self._on_perspective_changed)
+        self._preview.transform_ended.connect(self._on_transform_ended)
+        self._preview.viewport_resized.connect(self._on_preview_viewport_resized)
+        self._preview.frame_painted.connect(self._preview_latency.painted)
+        self._preview_thread.preview_ready.connect(self._on_preview_ready)
+        self._preview_thread.preview_error.connect(self._on_preview_error)
+        self._preview_thread.finished.connect(self._on_preview_thread_finished)
 
         self._output_btn.clicked.connect(self._select_output_folder)
         self._convert_btn.clicked.connect(self._start_conversion)
         self._random_btn.clicked.connect(self._start_random_conversion)
+        self._overlay.cancel_requested.connect(self._on_cancel_requested)
+        self._result_batcher.results_ready.connect(self._on_results_ready)
 
     def _apply_styles(self):
         self.setStyleSheet(
@@ -192,15 +331,15 @@ class MainWindow(QMainWindow):
                 background-color: #2d2d2d;
                 color: #ffffff;
             }
-            QListWidget {
+            QListView {
                 background-color: #3d3d3d;
                 border: 1px solid #555;
                 border-radius: 4px;
             }
-            QListWidget::item {
+            QListView::item {
                 padding: 8px;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #4285f4;
             }
             QPushButton {
@@ -272,6 +411,18 @@ class MainWindow(QMainWindow):
         )
 
     def _finalize_processing(self, label: str):
+        if not self._processing:
+            return
+        # 아직 전달되지 않은 마지막 결과를 요약 전에 반영 (랜덤 모드는 그 안에서 완료 처리될 수 있음)
+        self._result_batcher.flush()
+        if not self._processing:
+            return
+        self._processing = False
+        self._cancel_timer.stop()
+        self._random_cancel_poll.stop()
+        if self._cancelling:
+            label = f"{label} (취소됨)"
+
         self._overlay.hide_overlay()
         self._progress.setVisible(False)
         self._random_btn.setEnabled(True)
@@ -282,33 +433,106 @@ class MainWindow(QMainWindow):
             f"{label}: 성공 {self._completed}개, 실패 {len(self._failed)}개",
             "info",
         )
+        self._write_run_report()
+        self._save_trace()
+
+    def _save_trace(self):
+        """배치 타임라인을 출력 폴더 안 JSON으로 저장 (설정 trace)"""
+        if not self._tracing:
+            return
+        self._tracing = False
+        trace = self._batch_worker.trace if self._batch_worker else None
+        if trace is None or self._output_manager is None:
+            return
+        try:
+            path = trace.save(trace_path_for(self._output_manager.get_output_dir()))
+            self._log_widget.add_log(f"타임라인 저장: {path} (chrome://tracing, ui.perfetto.dev)", "info")
+        except OSError as e:
+            self._log_widget.add_log(f"타임라인 저장 실패: {e}", "warning")
+
+    def _write_run_report(self):
+        """실행 리포트 로그 요약 + 출력 폴더 안 JSON 저장"""
+        if self._run_report is None:
+            return
+        sections = {}
+        if self._stage_stats.images:
+            sections["stages"] = self._stage_stats.to_dict()
+        if self._memory_stats.images:
+            sections["memory"] = self._memory_stats.to_dict()
+        profile_stats = self._collect_profile(self._run_report.mode)
+        if profile_stats is not None:
+            sections["profile"] = hot_functions(profile_stats)
+        started_at = self._run_report.started_at
+        report = self._run_report.finish(cancelled=self._cancelling, **sections)
+        self._run_report = None
+
+        for line in summary_lines(report):
+            self._log_widget.add_log(line, "info")
+        for line in self._stage_stats.summary_lines():
+            self._log_widget.add_log(line, "info")
+        for line in self._memory_stats.summary_lines():
+            self._log_widget.add_log(line, "info")
+        if profile_stats is not None:
+            for line in profile_summary_lines(profile_stats):
+                self._log_widget.add_log(line, "info")
+
+        if self._output_manager is None:
+            return
+        try:
+            path = write_report(report, report_path_for(self._output_manager.get_output_dir(), started_at))
+            self._log_widget.add_log(f"실행 리포트 저장: {path}", "info")
+        except OSError as e:
+            self._log_widget.add_log(f"실행 리포트 저장 실패: {e}", "warning")
+
+    def _take_profile_request(self, output_dir: Path) -> Optional[Path]:
+        """CPU 프로파일링 체크 시 이번 실행의 프로파일 폴더 반환 (1회용, 체크 해제)"""
+        if not self._profile_check.isChecked():
+            self._profile_dir = None
+            return None
+        self._profile_check.setChecked(False)
+        self._profile_dir = Path(output_dir)
+        self._log_widget.add_log("CPU 프로파일링 활성화 (이번 실행만)", "info")
+        return self._profile_dir
+
+    def _collect_profile(self, mode: str):
+        """이번 실행의 CPU 프로파일 (배치: 엔진이 병합, 랜덤: 스레드 워커 파일을 여기서 병합)"""
+        profile_dir, self._profile_dir = self._profile_dir, None
+        if profile_dir is None:
+            return None
+        if mode == "batch":
+            return self._batch_worker.profile_stats if self._batch_worker else None
+        try:
+            return merge_profiles(profile_dir)
+        except OSError as e:
+            self._log_widget.add_log(f"CPU 프로파일 병합 실패: {e}", "warning")
+            return None
+
+    def _on_task_metrics(self, metrics: dict):
+        """작업 1개의 처리 시간/단계별 시간/메모리 집계"""
+        self._stage_stats.add(metrics.get("timings"))
+        self._memory_stats.add(metrics["filepath"], metrics.get("memory"))
+        if self._run_report is not None:
+            self._run_report.add(metrics)
+        if self._tracing and self._batch_worker is not None and self._batch_worker.trace is not None:
+            self._batch_worker.trace.delivered(metrics)
 
     def eventFilter(self, obj, event):
         if obj == self._center_panel and event.type() == QEvent.Resize:
             self._overlay.setGeometry(self._center_panel.rect())
         return super().eventFilter(obj, event)
 
-    def _add_files(self, files: list[str]):
-        # 기존 파일 모두 제거
-        self._file_list.clear()
-        self._files.clear()
+    def _add_files(self, files: list[str], output_dir: str = ""):
+        # 기존 파일 모두 제거 후 새 목록으로 교체 (중복 제거)
         self._current_file = None
         self._current_image = None
+        self._file_model.set_files(files)
 
-        # 새 파일만 추가
-        for f in files:
-            if f not in self._files:
-                self._files.append(f)
-                item = QListWidgetItem(Path(f).name)
-                item.setData(Qt.ItemDataRole.UserRole, f)
-                self._file_list.addItem(item)
+        if self._file_model.paths:
+            self._file_list.set_current_row(0)
 
-        if self._files:
-            self._file_list.setCurrentRow(0)
-
-        # 새로 추가된 파일의 디렉토리를 출력 폴더로 자동 설정
+        # 새로 추가된 파일의 디렉토리(폴더 검색이면 선택한 폴더)를 출력 폴더로 자동 설정
         if files:
-            output_dir = str(Path(files[0]).parent)
+            output_dir = output_dir or str(Path(files[0]).parent)
             self._config["last_output_dir"] = output_dir
             save_config(self._config)
             self._output_path_label.setText(f"출력 폴더: {output_dir}")
@@ -323,10 +547,11 @@ class MainWindow(QMainWindow):
         if files:
             self._config["last_input_dir"] = str(Path(files[0]).parent)
             save_config(self._config)
+            self._cancel_scan()
             self._add_files(files)
 
     def _open_folder_dialog(self):
-        """폴더 선택 → 내부 이미지 파일 자동 추가"""
+        """폴더 선택 → 하위 폴더까지 이미지 파일 검색 (백그라운드)"""
         folder = QFileDialog.getExistingDirectory(
             self,
             "이미지 폴더 선택",
@@ -335,34 +560,106 @@ class MainWindow(QMainWindow):
         if folder:
             self._config["last_input_dir"] = folder
             save_config(self._config)
+            self._scan_paths([folder])
+
+    def _scan_paths(self, paths: list[str]):
+        """파일/폴더 경로를 백그라운드에서 검색해 찾는 대로 목록에 추가
+
+        첫 묶음이 도착하면 기존 목록을 교체하고, 이후 묶음은 목록 끝에 추가.
+        아무것도 찾지 못하면 기존 목록 유지.
+        """
+        self._cancel_scan()
+        worker = FolderScanWorker(
+            paths,
+            max_depth=self._config.get("scan_max_depth", DEFAULT_MAX_DEPTH),
+            include=self._config.get("scan_include") or None,
+            exclude=self._config.get("scan_exclude") or None,
+            parent=self,
+        )
+        worker.signals.files_found.connect(
+            self._on_scan_files_found, Qt.ConnectionType.QueuedConnection
+        )
+        worker.signals.progress.connect(
+            self._on_scan_progress, Qt.ConnectionType.QueuedConnection
+        )
+        worker.signals.done.connect(
+            self._on_scan_done, Qt.ConnectionType.QueuedConnection
+        )
+        worker.finished.connect(worker.deleteLater)
+
+        first = Path(paths[0])
+        self._scan_output_dir = str(first if first.is_dir() else first.parent)
+        self._scan_started = False
+        self._scan_worker = worker
+        self._scan_label.setText("폴더 검색 중...")
+        self._scan_bar.setVisible(True)
+        worker.start()
+
+    def _cancel_scan(self):
+        """진행 중인 검색 중단 (결과는 더 반영하지 않음)"""
+        if self._scan_worker is None:
+            return
+        self._scan_worker.cancel()
+        self._scan_worker = None
+        self._scan_bar.setVisible(False)
 
-            # 폴더 내 이미지 파일 검색
-            image_extensions = {".png", ".jpg", ".jpeg", ".webp", ".bmp"}
-            folder_path = Path(folder)
-            files = [
-                str(f) for f in folder_path.iterdir()
-                if f.is_file() and f.suffix.lower() in image_extensions
-            ]
-
-            if files:
-                files.sort()  # 파일명 순 정렬
-                self._add_files(files)
-            else:
-                QMessageBox.information(self, "알림", "폴더에 이미지 파일이 없습니다.")
+    def _is_current_scan(self) -> bool:
+        # 취소/교체된 이전 검색이 큐에 남긴 시그널은 무시
+        return self._scan_worker is not None and self.sender() is self._scan_worker.signals
+
+    def _on_scan_files_found(self, files: list):
+        if not self._is_current_scan():
+            return
+        if not self._scan_started:
+            self._scan_started = True
+            self._add_files(files, self._scan_output_dir)
+        else:
+            self._file_model.add_files(files)
+
+    def _on_scan_progress(self, found: int, dirs: int):
+        if not self._is_current_scan():
+            return
+        self._scan_label.setText(f"폴더 검색 중... 이미지 {found}개 (폴더 {dirs}개)")
+
+    def _on_scan_cancel_clicked(self):
+        # 결과는 done 시그널에서 정리
+        if self._scan_worker is not None:
+            self._scan_worker.cancel()
+            self._scan_label.setText("검색 취소 중...")
+
+    def _on_scan_done(self, found: int, cancelled: bool):
+        if not self._is_current_scan():
+            return
+        self._scan_worker = None
+        self._scan_bar.setVisible(False)
+        count = len(self._file_model.paths) if self._scan_started else 0
+        if cancelled:
+            self._set_status_message(f"폴더 검색 취소: {count}개 추가됨", "#ffc107")
+        elif not self._scan_started:
+            QMessageBox.information(self, "알림", "폴더에 이미지 파일이 없습니다.")
+        else:
+            self._set_status_message(f"폴더 검색 완료: {count}개", "#4caf50")
 
     def _remove_selected(self):
-        row = self._file_list.currentRow()
-        if row >= 0:
-            self._file_list.takeItem(row)
-            del self._files[row]
-            if not self._files:
+        rows = self._file_list.selected_rows()
+        if not rows and self._file_list.current_row() >= 0:
+            rows = [self._file_list.current_row()]
+        if rows:
+            self._file_model.remove_rows(rows)
+            if self._file_model.paths and self._file_list.current_row() < 0:
+                # 많은 행을 제거하면 목록을 교체하므로 현재 행을 다시 지정
+                self._file_list.set_current_row(min(min(rows), len(self._file_model.paths) - 1))
+            if not self._file_model.paths:
                 self._current_file = None
                 self._current_image = None
+                self._preview.set_loading(False)
                 self._preview.set_image(QPixmap())
 
     def _clear_files(self):
-        self._file_list.clear()
-        self._files.clear()
+        self._cancel_scan()
+        self._cancel_decodes()
+        self._preview.set_loading(False)
+        self._file_model.clear()
         self._current_file = None
         self._current_image = None
         self._perspective_corners = None
@@ -370,67 +667,247 @@ class MainWindow(QMainWindow):
         self._preview.set_image(QPixmap())
 
     def _on_file_selected(self, row: int):
-        if row < 0 or row >= len(self._files):
+        if row < 0 or row >= len(self._file_model.paths):
             return
 
-        self._current_file = self._files[row]
-        self._load_image(self._current_file)
+        filepath = self._file_model.path_at(row)
+        if filepath == self._current_file and self._current_image is not None:
+            # 앞쪽 행이 제거되어 행 번호만 바뀐 경우
+            return
+        self._current_file = filepath
+        self._interaction_gate.touch()
+        self._load_image(filepath)
+        self._prefetch_neighbors(row)
 
     def _load_image(self, filepath: str):
-        try:
-            self._loading_new_image = True
-            img = Image.open(filepath)
-            self._current_image = ImageOps.exif_transpose(img) if img else img
-            w, h = self._current_image.size
+        """디코딩된 썸네일이 있으면 바로 표시, 없으면 백그라운드 디코딩 후 _on_decoded에서 표시"""
+        decoded = self._decode_cache.get(filepath)
+        if decoded is not None:
+            self._preview.set_loading(False)
+            self._apply_decoded(decoded)
+            return
 
-            self._options.set_original_size(w, h)
-            self._preview.set_keep_ratio(True)
-            self._perspective_corners = None
-            self._preview.reset_corner_offsets()
+        # 디코딩이 끝날 때까지 이전 이미지로 렌더하지 않음
+        self._current_image = None
+        self._preview_idle_timer.stop()
+        self._preview.set_loading(True)
+        self._request_decode(filepath, priority=1)
+
+    def _apply_decoded(self, decoded):
+        self._loading_new_image = True
+        # 미리보기 해상도 썸네일 (원본 크기는 original_size)
+        self._current_image = decoded.thumbnail
+        w, h = decoded.original_size
+        self._preview_idle_timer.stop()
+        self._preview_thread.renderer.set_source(decoded.thumbnail, decoded.original_size)
+        self._source_identity = decoded.identity
+        self._stale_render = self._preview_thread.isRunning()
+        self._displayed_options = None
+        self._displayed_level = None
+
+        self._options.set_original_size(w, h)
+        self._preview.set_keep_ratio(True)
+        self._perspective_corners = None
+        self._preview.reset_corner_offsets()
 
-            self._update_preview()
+        self._update_preview()
+
+    def _upgrade_source(self, decoded):
+        """같은 파일을 더 큰 해상도로 디코딩한 이미지로 교체 (옵션/코너는 기준 좌표라 그대로)"""
+        self._current_image = decoded.thumbnail
+        self._preview_thread.renderer.set_source(decoded.thumbnail, decoded.original_size)
+        self._stale_render = self._stale_render or self._preview_thread.isRunning()
+        self._update_preview()
 
-        except Exception as e:
+    def _decode_size(self) -> int:
+        """새 파일을 디코딩할 긴 변 - 지금 뷰에 필요한 렌더 단계 (좌표 기준 해상도 이상)"""
+        return max(MAX_PREVIEW_SIZE, preview_level_for(self._preview.required_preview_pixels()))
+
+    def _preview_level(self) -> int:
+        """뷰 크기 x 화면 배율에 맞는 미리보기 렌더 단계"""
+        renderer = self._preview_thread.renderer
+        return renderer.level_for(self._preview.required_preview_pixels(renderer.thumb_size))
+
+    @staticmethod
+    def _decoded_covers(decoded, max_size: int) -> bool:
+        return max(decoded.thumbnail.size) >= min(max_size, max(decoded.original_size))
+
+    def _request_decode(self, filepath: str, priority: int = 0, max_size: Optional[int] = None):
+        max_size = max_size or self._decode_size()
+        job = self._decode_jobs.get(filepath)
+        if job is not None:
+            # 대기 중인 미리 디코딩이면 우선순위/크기를 올려 다시 넣음 (이미 실행 중이면 그대로)
+            if (priority > 0 or job.max_size < max_size) and self._decode_pool.tryTake(job):
+                job.max_size = max(job.max_size, max_size)
+                self._decode_pool.start(job, priority)
+            return
+        cached = self._decode_cache.get(filepath)
+        if cached is not None and self._decoded_covers(cached, max_size):
+            return
+        job = DecodeWorker(filepath, max_size)
+        job.setAutoDelete(False)
+        job.signals.decoded.connect(self._on_decoded, Qt.ConnectionType.QueuedConnection)
+        job.signals.failed.connect(self._on_decode_failed, Qt.ConnectionType.QueuedConnection)
+        self._decode_jobs[filepath] = job
+        self._decode_pool.start(job, priority)
+
+    def _cancel_decodes(self, keep: set[str] = frozenset()):
+        """대기 중인 디코딩 취소 (실행 중인 작업은 끝나면 캐시에 저장)"""
+        for filepath, job in list(self._decode_jobs.items()):
+            if filepath not in keep and self._decode_pool.tryTake(job):
+                del self._decode_jobs[filepath]
+
+    def _prefetch_neighbors(self, row: int):
+        """선택한 파일 앞뒤 N개를 가까운 순서로 미리 디코딩 (방향키 이동 시 바로 표시)"""
+        count = self._config.get("prefetch_neighbors", DEFAULT_PREFETCH_NEIGHBORS)
+        paths = self._file_model.paths
+        neighbors = [
+            paths[r]
+            for distance in range(1, count + 1)
+            for r in (row + distance, row - distance)
+            if 0 <= r < len(paths)
+        ]
+        # 빠르게 넘길 때 지나간 파일의 대기 작업은 취소
+        self._cancel_decodes(keep={self._current_file, *neighbors})
+        for filepath in neighbors:
+            self._request_decode(filepath)
+
+    def _on_decoded(self, filepath: str, decoded):
+        self._decode_jobs.pop(filepath, None)
+        self._decode_cache.put(filepath, decoded)
+        if filepath != self._current_file:
+            return
+        if self._current_image is None:
+            self._preview.set_loading(False)
+            self._apply_decoded(decoded)
+        elif decoded.identity == self._source_identity and max(decoded.thumbnail.size) > max(self._current_image.size):
+            self._upgrade_source(decoded)
+
+    def _on_decode_failed(self, filepath: str, error: str):
+        self._decode_jobs.pop(filepath, None)
+        if filepath == self._current_file and self._current_image is None:
+            self._preview.set_loading(False)
             self._loading_new_image = False
-            QMessageBox.warning(self, "오류", f"이미지 로드 실패: {e}")
+            QMessageBox.warning(self, "오류", f"이미지 로드 실패: {error}")
 
-    def _update_preview(self):
+    def _update_preview(self, tier: str = TIER_FULL):
+        """미리보기 렌더 요청 - 렌더 중이면 끝난 뒤 최신 옵션으로 1번 더 렌더 (UI 스레드 대기 없음)"""
         if self._current_image is None:
             return
+        if tier == TIER_FULL:
+            self._preview_idle_timer.stop()
+
+        options = self._preview_options()
+        level = self._preview_level()
+        key = (self._source_identity, options_fingerprint(options), level)
+        cached = self._preview_cache.get(key)
+        if cached is not None:
+            # 저해상도 요청이어도 캐시된 고품질 프레임 사용
+            self._pending_preview_tier = None
+            self._stale_render = self._stale_render or self._preview_thread.isRunning()
+            now = perf_counter()
+            self._preview_latency.frame_shown(
+                FrameTiming(tier, True, self._preview_latency.take_input(), RenderTiming(now, now, now))
+            )
+            self._show_preview(cached, options, level)
+            return
 
-        if self._preview_thread and self._preview_thread.isRunning():
-            self._preview_thread.quit()
-            self._preview_thread.wait()
+        renderer = self._preview_thread.renderer
+        if renderer.needs_larger_source(level):
+            # 뷰가 디코딩된 해상도보다 크면 더 크게 디코딩 (도착하면 _upgrade_source), 그동안은
+            # 있는 해상도로 렌더하고 캐시하지 않음
+            key = None
+            self._request_decode(self._current_file, priority=1, max_size=level)
 
-        self._preview_thread = PreviewThread(self)
-        self._preview_thread.set_source(self._current_image)
+        if self._preview_thread.isRunning():
+            self._pending_preview_tier = tier
+            return
+        self._pending_preview_tier = None
+
+        self._stale_render = False
+        self._rendering_options = options
+        self._rendering_key = key
+        self._rendering_level = level
+        self._rendering_input = self._preview_latency.take_input()
+        self._preview_thread.set_options(options, tier, level)
+        self._preview_thread.start()
 
+    def _preview_options(self) -> dict:
         options = self._options.get_options()
         if self._perspective_corners:
             options["perspective_corners"] = self._perspective_corners
+        return options
+
+    def _update_preview_interactive(self):
+        """슬라이더/핸들 조작 중: 크롭/원근/회전만 바뀌었으면 표시 중인 프레임을 QTransform으로 변형,
+        그 외에는 저해상도로 바로 렌더. 조작이 멈추면(또는 핸들을 놓으면) 고품질 렌더"""
+        self._interaction_gate.touch()
+        if not self._apply_preview_proxy():
+            if self._current_image is not None:
+                self._preview_latency.mark_input()
+            # 기하가 그대로면(색상 슬라이더) 고품질도 LUT 몇 번이라 바로 렌더
+            renderer = self._preview_thread.renderer
+            has_geometry = renderer.has_geometry(self._preview_options(), TIER_FULL, self._preview_level())
+            self._update_preview(TIER_FULL if has_geometry else TIER_DRAFT)
+        self._preview_idle_timer.start()
+
+    def _apply_preview_proxy(self) -> bool:
+        """표시 중인 프레임과 현재 옵션의 기하 차이를 적용 (다시 렌더해야 하면 False)"""
+        if self._current_image is None or self._displayed_options is None:
+            return False
+        proxy = proxy_transform(
+            self._displayed_options, self._preview_options(), self._preview_thread.renderer.thumb_size
+        )
+        if proxy is None:
+            return False
+        self._preview.set_proxy_transform(*proxy)
+        self._update_rotation_border()
+        return True
+
+    def _on_transform_ended(self):
+        if self._preview_idle_timer.isActive():
+            self._update_preview()
 
-        self._preview_thread.set_options(options)
-        self._preview_thread.preview_ready.connect(self._on_preview_ready)
-        self._preview_thread.preview_error.connect(self._on_preview_error)
-        self._preview_thread.start()
+    def _on_preview_viewport_resized(self):
+        """창/분할 크기가 바뀌어 필요한 렌더 단계가 달라지면 크기 조절이 멈춘 뒤 다시 렌더"""
+        if self._current_image is None or self._displayed_level is None:
+            return
+        if self._preview_level() != self._displayed_level:
+            self._preview_idle_timer.start()
+
+    def _on_preview_thread_finished(self):
+        if self._pending_preview_tier is not None:
+            self._update_preview(self._pending_preview_tier)
+
+    def _on_preview_ready(self, pixmap: QPixmap, tier: str, timing: RenderTiming):
+        if tier == TIER_FULL and self._rendering_key is not None:
+            self._preview_cache.put(self._rendering_key, pixmap)
+        if self._current_image is None or self._stale_render:
+            # 렌더 중에 파일 목록이 비워졌거나 다른 프레임이 이미 표시됨
+            return
+        self._preview_latency.frame_shown(FrameTiming(tier, False, self._rendering_input, timing))
+        self._show_preview(pixmap, self._rendering_options, self._rendering_level)
 
-    def _on_preview_ready(self, pixmap: QPixmap):
+    def _show_preview(self, pixmap: QPixmap, options: dict, level: int):
         reset = self._loading_new_image or self._perspective_corners is None
         self._loading_new_image = False
         self._preview.set_image(pixmap, reset_transform=reset)
+        self._displayed_options = options
+        self._displayed_level = level
         opts = self._options.get_options()
         self._preview.update_info(opts.get("width", 0), opts.get("height", 0))
+        # 렌더 중에 바뀐 기하는 새 프레임에도 이어서 적용
+        if not self._apply_preview_proxy():
+            self._update_rotation_border()
 
+    def _update_rotation_border(self):
+        opts = self._options.get_options()
         if self._current_image:
             rotation = opts.get("rotation", 0)
             crop = opts.get("crop", {})
             crop_amount = crop.get("top", 0)
 
-            orig_w, orig_h = self._current_image.size
-            max_size = 512
-            ratio = min(max_size / orig_w, max_size / orig_h, 1.0)
-            thumb_w = int(orig_w * ratio)
-            thumb_h = int(orig_h * ratio)
+            thumb_w, thumb_h = self._preview_thread.renderer.thumb_size
 
             if crop_amount < 0:
                 pre_rot_w = thumb_w + abs(crop_amount) * 2
@@ -441,11 +918,25 @@ class MainWindow(QMainWindow):
 
             self._preview.set_rotation(rotation, (pre_rot_w, pre_rot_h))
 
+    def set_preview_debug(self, enabled: bool):
+        """미리보기 지연 오버레이 + 로그 (LATENCY_LOG_FILE) 켜기/끄기"""
+        if enabled:
+            self._preview_latency.open_log()
+            self._latency_overlay_timer.start()
+            self._update_latency_overlay()
+        else:
+            self._preview_latency.close_log()
+            self._latency_overlay_timer.stop()
+            self._preview.set_debug_text("")
+
+    def _update_latency_overlay(self):
+        self._preview.set_debug_text("\n".join(self._preview_latency.overlay_lines()))
+
     def _on_preview_error(self, error: str):
         self._status_label.setText(f"미리보기 오류: {error}")
 
     def _on_options_changed(self, options: dict):
-        self._update_preview()
+        self._update_preview_interactive()
 
     def _on_free_transform_toggle(self, enabled: bool):
         self._preview.set_free_transform_mode(enabled)
@@ -455,7 +946,7 @@ class MainWindow(QMainWindow):
 
     def _on_perspective_changed(self, corners: list):
         self._perspective_corners = corners
-        self._update_preview()
+        self._update_preview_interactive()
 
     def _on_perspective_offset_changed(self, offset: float):
         """수동 perspective offset 변경 시 호출"""
@@ -489,24 +980,35 @@ class MainWindow(QMainWindow):
             self._output_path_label.setText(f"출력 폴더: {folder}")
 
     def _start_conversion(self):
-        if not self._files:
+        if not self._file_model.paths:
             QMessageBox.warning(self, "경고", "변환할 파일이 없습니다.")
             return
 
+        if self._scan_worker is not None:
+            QMessageBox.warning(self, "경고", "폴더 검색이 끝난 뒤 실행하세요.")
+            return
+
         output_dir = self._config.get("last_output_dir", "")
         if not output_dir:
             QMessageBox.warning(self, "경고", "출력 폴더를 선택하세요.")
             return
 
+        paths = list(self._file_model.paths)
+        self._run_total = len(paths)
         self._progress.setVisible(True)
-        self._progress.setMaximum(len(self._files))
+        self._progress.setMaximum(self._run_total)
         self._progress.setValue(0)
         self._random_btn.setEnabled(False)
         self._set_status_message("변환 중...", "#90caf9")
-        self._overlay.show_message("변환 중")
+        self._overlay.show_message("변환 중", cancellable=True)
+        self._processing = True
+        self._cancelling = False
 
+        self._result_batcher.discard()
         self._completed = 0
         self._failed = []
+        self._stage_stats = StageStats()
+        self._memory_stats = MemoryStats()
 
         options = self._options.get_options()
         output_manager = OutputManager(output_dir, options)
@@ -515,43 +1017,108 @@ class MainWindow(QMainWindow):
             options["perspective_corners"] = self._perspective_corners
             # 썸네일 크기 저장 (원근 변형 스케일링용)
             if self._current_image:
-                thumb = create_thumbnail(self._current_image, MAX_PREVIEW_SIZE)
-                options["thumb_w"] = thumb.size[0]
-                options["thumb_h"] = thumb.size[1]
+                options["thumb_w"], options["thumb_h"] = self._preview_thread.renderer.thumb_size
 
         # 병렬 배치 처리 (멀티프로세스)
+        profile_dir = self._take_profile_request(output_manager.get_output_dir())
         self._batch_worker = BatchTransformWorker(
-            self._files,
+            paths,
             options,
             output_manager.get_output_dir(),
             options.get("output_format", "jpeg"),
+            memory_budget=resolve_memory_budget(self._config.get("memory_budget_mb", 0)),
+            profile_memory=self._config.get("profile_memory", False),
+            profile_dir=str(profile_dir) if profile_dir else None,
+            profile_every=self._config.get("profile_every", DEFAULT_PROFILE_EVERY),
+            trace=self._config.get("trace", False),
+            on_result=self._result_batcher.add,
+            low_priority=self._preview_priority,
+            interaction_gate=self._interaction_gate if self._preview_priority else None,
         )
-        self._batch_worker.signals.finished.connect(
-            self._on_worker_finished, Qt.ConnectionType.QueuedConnection
+        self._tracing = self._config.get("trace", False)
+        self._batch_worker.signals.throttled.connect(
+            self._on_batch_throttled, Qt.ConnectionType.QueuedConnection
         )
         self._batch_worker.signals.all_done.connect(
             self._on_batch_done, Qt.ConnectionType.QueuedConnection
         )
+        self._run_report = RunReport("batch", self._batch_worker.max_workers, self._run_total)
         self._batch_worker.start()
 
         self._output_manager = output_manager
 
-    def _on_worker_finished(self, filepath: str, success: bool, result: str, applied_options: dict):
-        filename = Path(filepath).name
-        if success:
-            self._completed += 1
-            if self._random_mode and applied_options:
-                log_msg = format_random_log(filename, applied_options)
-                self._log_widget.add_log(log_msg, "success")
-        else:
-            self._failed.append((filepath, result))
-            self._log_widget.add_log(f"[{filename}] 오류: {result}", "error")
+    def _on_results_ready(self, results: list, succeeded: int, failed: int):
+        """워커 결과 묶음 반영 - 진행률은 묶음당 1번 갱신"""
+        if not self._processing:
+            return
+        for result in results:
+            self._on_task_metrics(result)
+            filename = Path(result["filepath"]).name
+            if result["success"]:
+                if self._random_mode and result["options"]:
+                    log_msg = format_random_log(filename, result["options"])
+                    self._log_widget.add_log(log_msg, "success")
+            else:
+                self._failed.append((result["filepath"], result["result"]))
+                self._log_widget.add_log(f"[{filename}] 오류: {result['result']}", "error")
+        self._completed += succeeded
 
         total_done = self._completed + len(self._failed)
         self._progress.setValue(total_done)
-        if self._random_mode and total_done >= len(self._files):
+        if self._random_mode and total_done >= self._run_total:
             self._on_random_done()
 
+    def _on_cancel_requested(self):
+        """취소 요청 - 대기 작업 폐기 + 진행 중 작업에 취소 전파"""
+        if not self._processing or self._cancelling:
+            return
+
+        self._cancelling = True
+        self._overlay.set_title("취소 중...")
+        self._overlay.set_cancel_enabled(False)
+        self._set_status_message("취소 중...", "#ffc107")
+        self._log_widget.add_log("취소 요청됨 - 진행 중인 작업을 중단합니다", "warning")
+
+        if self._random_mode:
+            self._cancel_event.set()
+            self._thread_pool.clear()
+            self._random_cancel_poll.start()
+        elif self._batch_worker is not None:
+            self._batch_worker.cancel()
+
+        self._cancel_timer.start()
+
+    def _check_random_cancel_done(self):
+        if self._thread_pool.activeThreadCount() == 0:
+            cleanup_partial_outputs(self._output_manager.get_output_dir())
+            self._on_random_done()
+
+    def _on_cancel_timeout(self):
+        """취소가 지연되면 강제 종료 여부 확인"""
+        if not self._processing:
+            return
+
+        answer = QMessageBox.question(
+            self,
+            "취소 지연",
+            "작업이 아직 종료되지 않았습니다.\n강제 종료하시겠습니까?",
+        )
+        if not self._processing:
+            return
+        if answer != QMessageBox.StandardButton.Yes:
+            self._cancel_timer.start()
+            return
+
+        self._log_widget.add_log("작업 강제 종료", "warning")
+        if self._random_mode:
+            # 스레드는 강제 종료할 수 없음 - 다음 단계 경계에서 스스로 종료됨
+            self._on_random_done()
+        elif self._batch_worker is not None:
+            self._batch_worker.terminate_workers()
+
+    def _on_batch_throttled(self, message: str):
+        self._log_widget.add_log(message, "warning")
+
     def _on_batch_done(self):
         """배치 처리 완료"""
         self._finalize_processing("변환 완료")
@@ -562,10 +1129,14 @@ class MainWindow(QMainWindow):
 
     def _start_random_conversion(self):
         """랜덤 변형 실행 - 각 이미지에 다른 랜덤 값 적용"""
-        if not self._files:
+        if not self._file_model.paths:
             QMessageBox.warning(self, "경고", "변환할 파일이 없습니다.")
             return
 
+        if self._scan_worker is not None:
+            QMessageBox.warning(self, "경고", "폴더 검색이 끝난 뒤 실행하세요.")
+            return
+
         output_dir = self._config.get("last_output_dir", "")
         if not output_dir:
             QMessageBox.warning(self, "경고", "출력 폴더를 선택하세요.")
@@ -576,15 +1147,24 @@ class MainWindow(QMainWindow):
         self._log_widget.add_log("랜덤 변환 시작", "info")
         self._log_widget.add_separator()
 
+        paths = list(self._file_model.paths)
+        self._run_total = len(paths)
         self._progress.setVisible(True)
-        self._progress.setMaximum(len(self._files))
+        self._progress.setMaximum(self._run_total)
         self._progress.setValue(0)
         self._random_btn.setEnabled(False)
         self._set_status_message("랜덤 변형 중...", "#90caf9")
-        self._overlay.show_message("랜덤 변형 중")
+        self._overlay.show_message("랜덤 변형 중", cancellable=True)
+        self._processing = True
+        self._cancelling = False
+        self._cancel_event = threading.Event()
 
+        self._result_batcher.discard()
         self._completed = 0
         self._failed = []
+        self._stage_stats = StageStats()
+        self._memory_stats = MemoryStats()
+        self._run_report = RunReport("random", self._thread_pool.maxThreadCount(), self._run_total)
         self._workers = []
 
         # 랜덤 모드용 폴더명 + UI에서 선택한 출력 포맷
@@ -605,42 +1185,46 @@ class MainWindow(QMainWindow):
             date_days_back=random_cfg.get("date_days_back", 7),
         )
 
-        for filepath in self._files:
-            try:
-                img = Image.open(filepath)
-                img = ImageOps.exif_transpose(img) if img else img
-                orig_w, orig_h = img.size
-                img.close()
+        profile_dir = self._take_profile_request(output_manager.get_output_dir())
+        profile_every = self._config.get("profile_every", DEFAULT_PROFILE_EVERY)
 
-                # thumbnail 크기 계산 (MAX_PREVIEW_SIZE 기준)
-                ratio = min(MAX_PREVIEW_SIZE / orig_w, MAX_PREVIEW_SIZE / orig_h, 1.0)
-                thumb_w = int(orig_w * ratio)
-                thumb_h = int(orig_h * ratio)
+        for index, filepath in enumerate(paths):
+            try:
+                size = read_oriented_size(filepath)
+                if size is None:
+                    raise OSError("이미지 헤더를 읽을 수 없습니다")
 
                 # 각 이미지별로 새로운 랜덤 옵션 생성 (thumbnail 좌표 기준)
-                random_options = generate_random_options(
-                    random_config, thumb_w, thumb_h,
-                    include_perspective=True,
-                    include_date=True,
+                random_options = generate_random_task_options(random_config, *size)
+
+                worker = TransformWorker(
+                    filepath,
+                    random_options,
+                    output_manager,
+                    self._cancel_event,
+                    megapixels=size[0] * size[1] / 1_000_000,
+                    profile_parts=(
+                        str(parts_dir_for(profile_dir))
+                        if profile_dir and should_profile(index, profile_every)
+                        else None
+                    ),
+                    on_result=self._result_batcher.add,
+                    interaction_gate=self._interaction_gate if self._preview_priority else None,
                 )
-                random_options["thumb_w"] = thumb_w
-                random_options["thumb_h"] = thumb_h
-
-                worker = TransformWorker(filepath, random_options, output_manager)
                 worker.setAutoDelete(False)
-                worker.signals.finished.connect(
-                    self._on_worker_finished, Qt.ConnectionType.QueuedConnection
-                )
                 self._workers.append(worker)
                 self._thread_pool.start(worker)
 
             except Exception as e:
                 self._log_widget.add_log(f"[{Path(filepath).name}] 파일 열기 실패: {e}", "error")
                 self._failed.append((filepath, str(e)))
+                self._run_report.add(
+                    {"filepath": filepath, "success": False, "result": str(e), "error_type": type(e).__name__}
+                )
 
         self._output_manager = output_manager
         total_done = self._completed + len(self._failed)
-        if total_done >= len(self._files):
+        if total_done >= self._run_total:
             self._on_random_done()
 
     def dragEnterEvent(self, event: QDragEnterEvent):
@@ -664,29 +1248,12 @@ class MainWindow(QMainWindow):
             event.ignore()
 
     def dropEvent(self, event: QDropEvent):
-        """드롭 이벤트 처리 - 파일/폴더 모두 지원"""
+        """드롭 이벤트 처리 - 파일/폴더 모두 지원 (폴더는 백그라운드 검색)"""
         self._file_list.setStyleSheet(self._file_list.STYLE_NORMAL)
-        files = []
-        image_extensions = {".png", ".jpg", ".jpeg", ".webp", ".bmp"}
-
-        for url in event.mimeData().urls():
-            path = url.toLocalFile()
-            if not path:
-                continue
-
-            p = Path(path)
-            # 폴더인 경우 내부 이미지 파일 추가
-            if p.is_dir():
-                for f in p.iterdir():
-                    if f.is_file() and f.suffix.lower() in image_extensions:
-                        files.append(str(f))
-            # 이미지 파일인 경우
-            elif p.suffix.lower() in image_extensions:
-                files.append(path)
+        paths = [url.toLocalFile() for url in event.mimeData().urls() if url.toLocalFile()]
 
-        if files:
-            files.sort()
-            self._add_files(files)
+        if paths:
+            self._scan_paths(paths)
             event.setDropAction(Qt.DropAction.CopyAction)
             event.accept()
         else:
@@ -694,5 +1261,24 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         save_config(self._config)
+        self._cancel_event.set()
+        self._thread_pool.clear()
+        if self._batch_worker is not None and self._batch_worker.isRunning():
+            self._batch_worker.cancel()
+            if not self._batch_worker.wait(CANCEL_ESCALATION_MS):
+                self._batch_worker.terminate_workers()
+                self._batch_worker.wait()
         self._thread_pool.waitForDone()
+        self._cancel_decodes()
+        self._decode_pool.waitForDone()
+        # 취소/교체된 이전 검색도 self가 부모라 함께 종료 대기
+        self._scan_worker = None
+        for worker in self.findChildren(FolderScanWorker):
+            worker.cancel()
+            worker.wait()
+        self._preview_idle_timer.stop()
+        self._pending_preview_tier = None
+        self._preview_thread.wait()
+        self._latency_overlay_timer.stop()
+        self._preview_latency.close_log()
         super().closeEvent(event)
@@ -1,14 +1,18 @@
 """프리뷰 위젯 - 이미지 미리보기 및 크기 정보 표시"""
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QPixmap
+from PySide6.QtGui import QPixmap, QTransform
 
 from .graphics.view import PreviewGraphicsView
+from .widgets.busy_overlay import SpinnerWidget
 
 
 class PreviewWidget(QWidget):
     size_changed = Signal(int, int)
     perspective_changed = Signal(list)
+    transform_ended = Signal()
+    viewport_resized = Signal()
+    frame_painted = Signal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -18,15 +22,34 @@ class PreviewWidget(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
+        title_layout = QHBoxLayout()
         self._title = QLabel("미리보기")
         self._title.setStyleSheet("font-weight: bold; color: #fff; padding: 5px;")
-        layout.addWidget(self._title)
+        title_layout.addWidget(self._title)
+        # 파일 디코딩 중 표시
+        self._spinner = SpinnerWidget(self, size=24)
+        self._spinner.hide()
+        title_layout.addWidget(self._spinner)
+        title_layout.addStretch()
+        layout.addLayout(title_layout)
 
         self._view = PreviewGraphicsView()
         self._view.size_changed.connect(self.size_changed)
         self._view.perspective_changed.connect(self.perspective_changed)
+        self._view.transform_ended.connect(self.transform_ended)
+        self._view.viewport_resized.connect(self.viewport_resized)
+        self._view.frame_painted.connect(self.frame_painted)
         layout.addWidget(self._view)
 
+        # 미리보기 지연 디버그 오버레이 (뷰 왼쪽 위, config "preview_debug")
+        self._debug_label = QLabel(self._view)
+        self._debug_label.setStyleSheet(
+            "background-color: rgba(0, 0, 0, 160); color: #0f0; padding: 4px;"
+            "font-family: 'Courier New', monospace; font-size: 11px;"
+        )
+        self._debug_label.move(6, 6)
+        self._debug_label.hide()
+
         self._info_label = QLabel("이미지를 드래그하여 추가하세요")
         self._info_label.setStyleSheet("color: #888; padding: 5px;")
         self._info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -39,6 +62,24 @@ class PreviewWidget(QWidget):
         else:
             self._info_label.setText("이미지를 드래그하여 추가하세요")
 
+    def required_preview_pixels(self, frame_size=None) -> float:
+        """미리보기 렌더에 필요한 긴 변 픽셀 수 (뷰 크기 x 화면 배율)"""
+        return self._view.required_preview_pixels(frame_size)
+
+    def set_debug_text(self, text: str):
+        """디버그 오버레이 문구 (빈 문자열이면 숨김)"""
+        self._debug_label.setText(text)
+        self._debug_label.adjustSize()
+        self._debug_label.setVisible(bool(text))
+
+    def set_loading(self, loading: bool):
+        self._spinner.setVisible(loading)
+        if loading:
+            self._spinner.start()
+            self._info_label.setText("불러오는 중...")
+        else:
+            self._spinner.stop()
+
     def set_keep_ratio(self, keep: bool):
         self._view.set_keep_ratio(keep)
 
@@ -55,6 +96,9 @@ class PreviewWidget(QWidget):
     def set_rotation(self, angle: float, original_size: tuple[int, int]):
         self._view.set_rotation(angle, original_size)
 
+    def set_proxy_transform(self, transform: QTransform, size: tuple[int, int]):
+        self._view.set_proxy_transform(transform, size)
+
     def reset_corner_offsets(self):
         self._view.reset_corner_offsets()
 
@@ -1,6 +1,7 @@
 """UI widget classes"""
 
+from .file_list_model import FileListModel
 from .file_list_widget import FileListWidget
 from .busy_overlay import BusyOverlay
 
-__all__ = ["FileListWidget", "BusyOverlay"]
+__all__ = ["FileListModel", "FileListWidget", "BusyOverlay"]
@@ -1,5 +1,5 @@
-from PySide6.QtCore import Qt, QTimer, QRectF
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
+from PySide6.QtCore import Qt, QTimer, QRectF, Signal
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton
 from PySide6.QtGui import QPainter, QPen, QColor
 
 
@@ -44,6 +44,8 @@ class SpinnerWidget(QWidget):
 class BusyOverlay(QWidget):
     """풀스크린 로딩 오버레이"""
 
+    cancel_requested = Signal()
+
     def __init__(self, parent: QWidget):
         super().__init__(parent)
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
@@ -63,14 +65,28 @@ class BusyOverlay(QWidget):
         )
         layout.addWidget(self._title)
 
+        self._cancel_btn = QPushButton("취소")
+        self._cancel_btn.setFixedWidth(100)
+        self._cancel_btn.clicked.connect(self.cancel_requested)
+        self._cancel_btn.hide()
+        layout.addWidget(self._cancel_btn, alignment=Qt.AlignmentFlag.AlignCenter)
+
         self.hide()
 
-    def show_message(self, title: str, subtitle: str = ""):
+    def show_message(self, title: str, subtitle: str = "", cancellable: bool = False):
         self._title.setText(title)
+        self._cancel_btn.setEnabled(True)
+        self._cancel_btn.setVisible(cancellable)
         self._spinner.start()
         self.raise_()
         self.show()
 
+    def set_title(self, title: str):
+        self._title.setText(title)
+
+    def set_cancel_enabled(self, enabled: bool):
+        self._cancel_btn.setEnabled(enabled)
+
     def hide_overlay(self):
         self._spinner.stop()
         self.hide()
@@ -0,0 +1,87 @@
+"""파일 목록 모델 - 수만 개 파일도 UI가 멈추지 않도록 뷰가 보이는 행만 요청"""
+import os
+from typing import Iterable
+
+from PySide6.QtCore import QModelIndex, QStringListModel, Qt
+
+# 연속 구간이 이보다 많으면 구간별 제거 대신 목록 교체 (뷰 갱신 1번)
+MAX_REMOVE_RANGES = 32
+# QStringListModel.insertRows는 한 번에 넣는 행 수에 대해 제곱 시간이라 나눠서 추가
+INSERT_CHUNK = 1000
+
+
+class FileListModel(QStringListModel):
+    """파일 경로 목록
+
+    뷰는 레이아웃할 때 행마다 index()/rowCount()를 부르는데, Python 모델이면 10만 행에서
+    호출만 수백 ms가 걸린다. 행 관리는 C++ QStringListModel에 맡기고(문자열은 빈 자리표시자),
+    실제 경로는 paths 리스트에, 표시 이름은 보이는 행에 대해서만 data()에서 만든다.
+    중복 확인은 set.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._paths: list[str] = []
+        self._known: set[str] = set()
+
+    @property
+    def paths(self) -> list[str]:
+        return self._paths
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._paths):
+            return None
+        path = self._paths[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return os.path.basename(path)
+        if role in (Qt.ItemDataRole.ToolTipRole, Qt.ItemDataRole.UserRole):
+            return path
+        return None
+
+    def path_at(self, row: int) -> str:
+        return self._paths[row]
+
+    def set_files(self, paths: Iterable[str]):
+        """목록 전체 교체 (순서 유지, 중복 제거)"""
+        self._paths = list(dict.fromkeys(paths))
+        self._known = set(self._paths)
+        self.setStringList([""] * len(self._paths))
+
+    def add_files(self, paths: Iterable[str]) -> int:
+        """목록 끝에 한 번에 추가, 추가된 개수 반환 (이미 있는 경로는 건너뜀)"""
+        new = [p for p in dict.fromkeys(paths) if p not in self._known]
+        if not new:
+            return 0
+        start = len(self._paths)
+        self._paths.extend(new)
+        self._known.update(new)
+        for offset in range(0, len(new), INSERT_CHUNK):
+            self.insertRows(start + offset, min(INSERT_CHUNK, len(new) - offset))
+        return len(new)
+
+    def remove_rows(self, rows: Iterable[int]):
+        """여러 행 제거 - 연속 구간별로 뒤에서부터, 구간이 많으면 목록 교체 1번"""
+        rows = sorted({r for r in rows if 0 <= r < len(self._paths)})
+        if not rows:
+            return
+
+        ranges = []
+        for row in rows:
+            if ranges and ranges[-1][1] == row - 1:
+                ranges[-1][1] = row
+            else:
+                ranges.append([row, row])
+
+        if len(ranges) > MAX_REMOVE_RANGES:
+            removed = set(rows)
+            self.set_files(p for i, p in enumerate(self._paths) if i not in removed)
+            return
+
+        for first, last in reversed(ranges):
+            # 현재 행이 제거되면 뷰는 제거 전 행 번호로 현재 행 변경을 알리므로 paths는 나중에 갱신
+            self.removeRows(first, last - first + 1)
+            self._known.difference_update(self._paths[first:last + 1])
+            del self._paths[first:last + 1]
+
+    def clear(self):
+        self.set_files([])
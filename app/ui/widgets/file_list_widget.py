@@ -1,22 +1,25 @@
-from pathlib import Path
-
-from PySide6.QtWidgets import QListWidget
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import QAbstractItemView, QListView
+from PySide6.QtCore import Qt, Signal, QModelIndex
 from PySide6.QtGui import QDragEnterEvent, QDragLeaveEvent, QDropEvent
 
+from .file_list_model import FileListModel
+
+
+class FileListWidget(QListView):
+    """파일 목록 뷰 (FileListModel, 보이는 행만 그림, 여러 행 선택 후 한 번에 제거)"""
 
-class FileListWidget(QListWidget):
-    files_dropped = Signal(list)
+    paths_dropped = Signal(list)  # 드롭한 파일/폴더 경로 (검색 전)
+    current_row_changed = Signal(int)
 
     STYLE_NORMAL = """
-        QListWidget {
+        QListView {
             background-color: #3d3d3d;
             border: 2px solid #555;
             border-radius: 4px;
         }
     """
     STYLE_DRAG_OVER = """
-        QListWidget {
+        QListView {
             background-color: #3d4d5d;
             border: 2px dashed #4285f4;
             border-radius: 4px;
@@ -27,11 +30,34 @@ class FileListWidget(QListWidget):
         super().__init__(parent)
         self.setAcceptDrops(True)
         self.setDragEnabled(False)
-        self.setDragDropMode(QListWidget.DragDropMode.DropOnly)
+        self.setDragDropMode(QAbstractItemView.DragDropMode.DropOnly)
         self.setDefaultDropAction(Qt.DropAction.CopyAction)
-        self.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        # 행 높이를 한 번만 계산 (행 수와 무관하게 스크롤/레이아웃 비용 일정)
+        self.setUniformItemSizes(True)
         self.setStyleSheet(self.STYLE_NORMAL)
 
+        self._model = FileListModel(self)
+        self.setModel(self._model)
+        self.selectionModel().currentRowChanged.connect(self._on_current_row_changed)
+
+    @property
+    def file_model(self) -> FileListModel:
+        return self._model
+
+    def _on_current_row_changed(self, current: QModelIndex, previous: QModelIndex):
+        self.current_row_changed.emit(current.row())
+
+    def current_row(self) -> int:
+        return self.currentIndex().row()
+
+    def set_current_row(self, row: int):
+        self.setCurrentIndex(self._model.index(row, 0))
+
+    def selected_rows(self) -> list[int]:
+        return [index.row() for index in self.selectionModel().selectedRows()]
+
     def dragEnterEvent(self, event: QDragEnterEvent):
         if event.mimeData().hasUrls():
             self.setStyleSheet(self.STYLE_DRAG_OVER)
@@ -52,28 +78,12 @@ class FileListWidget(QListWidget):
             event.ignore()
 
     def dropEvent(self, event: QDropEvent):
+        # 폴더 검색은 오래 걸릴 수 있으므로 경로만 넘기고 검색은 백그라운드에서
         self.setStyleSheet(self.STYLE_NORMAL)
-        files = []
-        image_extensions = {".png", ".jpg", ".jpeg", ".webp", ".bmp"}
-
-        for url in event.mimeData().urls():
-            path = url.toLocalFile()
-            if not path:
-                continue
-
-            p = Path(path)
-            # 폴더인 경우 내부 이미지 파일 추가
-            if p.is_dir():
-                for f in p.iterdir():
-                    if f.is_file() and f.suffix.lower() in image_extensions:
-                        files.append(str(f))
-            # 이미지 파일인 경우
-            elif p.suffix.lower() in image_extensions:
-                files.append(path)
-
-        if files:
-            files.sort()
-            self.files_dropped.emit(files)
+        paths = [url.toLocalFile() for url in event.mimeData().urls() if url.toLocalFile()]
+
+        if paths:
+            self.paths_dropped.emit(paths)
             event.setDropAction(Qt.DropAction.CopyAction)
             event.accept()
         else:
@@ -1,5 +1,16 @@
 """Worker classes for background processing"""
 
+from .decode_worker import DecodeWorker, DecodeWorkerSignals
+from .result_batcher import ResultBatcher
+from .scan_worker import FolderScanWorker, ScanWorkerSignals
 from .transform_worker import TransformWorker, WorkerSignals
 
-__all__ = ["TransformWorker", "WorkerSignals"]
+__all__ = [
+    "DecodeWorker",
+    "DecodeWorkerSignals",
+    "FolderScanWorker",
+    "ResultBatcher",
+    "ScanWorkerSignals",
+    "TransformWorker",
+    "WorkerSignals",
+]
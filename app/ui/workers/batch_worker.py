@@ -1,126 +1,39 @@
 """병렬 배치 처리 워커
 
-ProcessPoolExecutor를 사용해 이미지 처리를 병렬화
+app.core.batch_engine.BatchEngine을 QThread에서 실행하고 결과를 Qt 시그널로 전달
 """
-from pathlib import Path
-from concurrent.futures import ProcessPoolExecutor, as_completed
-try:
-    from concurrent.futures.process import BrokenProcessPool
-except ImportError:  # Python 일부 버전 호환
-    class BrokenProcessPool(RuntimeError):  # type: ignore
-        """ProcessPoolExecutor가 비정상 종료됐을 때 사용되는 예외"""
-import multiprocessing as mp
+from typing import Callable, Optional
 
 from PySide6.QtCore import QObject, QThread, Signal
-from PIL import Image, ImageOps
-
-from app.core.image_ops import apply_transforms
-from app.core.metadata import remove_exif
-from app.core.save_output import save_transformed_image
-
-
-def _init_worker():
-    """멀티프로세스 워커 초기화: OpenCV 내부 스레드 완전 비활성화"""
-    import os
-    os.environ["OMP_NUM_THREADS"] = "1"
-    os.environ["OPENBLAS_NUM_THREADS"] = "1"
-    os.environ["MKL_NUM_THREADS"] = "1"
-    os.environ["VECLIB_MAXIMUM_THREADS"] = "1"
-    os.environ["NUMEXPR_NUM_THREADS"] = "1"
-
-    try:
-        import cv2
-        cv2.setNumThreads(0)
-    except Exception:
-        pass
-
-
-def _process_single_image(args: dict) -> dict:
-    """단일 이미지 처리 (멀티프로세스용 - 모듈 레벨 함수)"""
-    filepath = args["filepath"]
-    options = args["options"]
-    output_dir = Path(args["output_dir"])
-    output_format = args.get("output_format", "jpeg")
-
-    try:
-        img = Image.open(filepath)
-        img = ImageOps.exif_transpose(img) if img else img
-
-        # 원근 변형 좌표 스케일링
-        perspective_corners = None
-        if options.get("perspective_corners"):
-            orig_w, orig_h = img.size
-            thumb_w = options.get("thumb_w", orig_w)
-            thumb_h = options.get("thumb_h", orig_h)
-            scale_x = orig_w / thumb_w
-            scale_y = orig_h / thumb_h
-            perspective_corners = [
-                (x * scale_x, y * scale_y)
-                for x, y in options["perspective_corners"]
-            ]
-
-        result = apply_transforms(
-            img,
-            rotation=options.get("rotation", 0),
-            brightness=options.get("brightness", 0),
-            contrast=options.get("contrast", 0),
-            saturation=options.get("saturation", 0),
-            noise=options.get("noise", 0),
-            perspective_corners=perspective_corners,
-            crop=options.get("crop"),
-        )
-
-        # EXIF 처리
-        exif_opts = options.get("exif", {})
-        metadata_overrides = None
-
-        if exif_opts.get("remove_all"):
-            result = remove_exif(result)
-        elif exif_opts.get("override"):
-            from datetime import datetime as dt
-            datetime_val = exif_opts.get("datetime", "")
-            if not datetime_val:
-                datetime_val = dt.now().strftime("%Y:%m:%d %H:%M:%S")
-            metadata_overrides = {"DateTimeOriginal": datetime_val}
-            result = remove_exif(result)
-
-        filename = Path(filepath).name
-        output_path = save_transformed_image(
-            result, output_dir, filename, metadata_overrides, output_format
-        )
 
-        return {
-            "filepath": filepath,
-            "success": True,
-            "result": str(output_path),
-            "options": options,
-        }
-
-    except Exception as e:
-        return {
-            "filepath": filepath,
-            "success": False,
-            "result": str(e),
-            "options": {},
-        }
+from app.core.batch_engine import BatchEngine, build_tasks
+from app.core.profiling import DEFAULT_PROFILE_EVERY
+from app.core.scheduler import InteractionGate
 
 
 class BatchWorkerSignals(QObject):
     """배치 워커 시그널"""
     progress = Signal(int, int)  # current, total
     finished = Signal(str, bool, str, dict)  # filepath, success, result, options
+    task_metrics = Signal(dict)  # 작업 1개의 결과 + 처리 시간/단계별 시간/메모리 (BatchEngine 결과 dict)
+    throttled = Signal(str)  # 메모리 예산으로 작업 투입을 보류한 사유
+    cancelled = Signal(int)  # 취소로 처리되지 않은 작업 수
     all_done = Signal()
 
 
 class BatchTransformWorker(QThread):
     """병렬 배치 처리 워커
 
+    투입 순서/메모리 예산/취소/미리보기 우선(low_priority, interaction_gate) 동작은 BatchEngine 참고.
+
     사용법:
         worker = BatchTransformWorker(files, options, output_dir, output_format)
         worker.signals.progress.connect(on_progress)
         worker.signals.finished.connect(on_finished)
         worker.signals.all_done.connect(on_all_done)
         worker.start()
+
+    결과가 많으면 on_result=ResultBatcher.add로 묶어서 받음 (progress/finished/task_metrics 대신).
     """
 
     def __init__(
@@ -130,84 +43,74 @@ class BatchTransformWorker(QThread):
         output_dir: str,
         output_format: str = "jpeg",
         max_workers: int = None,
+        memory_budget: Optional[int] = None,
+        profile_memory: bool = False,
+        profile_dir: Optional[str] = None,
+        profile_every: int = DEFAULT_PROFILE_EVERY,
+        trace: bool = False,
+        on_result: Optional[Callable[[dict], None]] = None,
+        low_priority: bool = False,
+        interaction_gate: Optional[InteractionGate] = None,
     ):
         super().__init__()
         self.files = files
         self.options = options
         self.output_dir = output_dir
         self.output_format = output_format
-        self.max_workers = max_workers or max(1, mp.cpu_count() - 1)
+        # 지정하면 결과마다 시그널 3개 대신 결과 dict만 넘김 (ResultBatcher.add)
+        self.on_result = on_result
         self.signals = BatchWorkerSignals()
-        self._cancelled = False
+        self._engine = BatchEngine(
+            max_workers=max_workers,
+            memory_budget=memory_budget,
+            on_result=self._emit_result,
+            on_throttle=self.signals.throttled.emit,
+            profile_memory=profile_memory,
+            profile_dir=profile_dir,
+            profile_every=profile_every,
+            trace=trace,
+            low_priority=low_priority,
+            interaction_gate=interaction_gate,
+        )
+        self.max_workers = self._engine.max_workers
+
+    @property
+    def profile_stats(self):
+        """병합된 CPU 프로파일 (pstats.Stats, 프로파일링하지 않았으면 None)"""
+        return self._engine.profile_stats
+
+    @property
+    def trace(self):
+        """실행 타임라인 (TraceRecorder, trace=False면 None)"""
+        return self._engine.trace
 
     def cancel(self):
-        """처리 취소"""
-        self._cancelled = True
+        """처리 취소 - 대기 작업 폐기 + 진행 중 작업에 취소 전파"""
+        self._engine.cancel()
+
+    def terminate_workers(self):
+        """취소에 응답하지 않는 워커 프로세스 강제 종료"""
+        self._engine.terminate_workers()
+
+    def _emit_result(self, result: dict, completed: int, total: int):
+        if self.on_result is not None:
+            self.on_result(result)
+            return
+        self.signals.progress.emit(completed, total)
+        self.signals.task_metrics.emit(result)
+        self.signals.finished.emit(
+            result["filepath"],
+            result["success"],
+            result["result"],
+            result["options"],
+        )
 
     def run(self):
-        """병렬 처리 실행 (실패 시 순차 처리로 폴백)"""
-        tasks = [
-            {
-                "filepath": f,
-                "options": self.options,
-                "output_dir": self.output_dir,
-                "output_format": self.output_format,
-            }
-            for f in self.files
-        ]
-
-        total = len(tasks)
+        tasks = build_tasks(self.files, self.options, self.output_dir, self.output_format)
         completed = 0
-
         try:
-            ctx = mp.get_context("spawn")
-            with ProcessPoolExecutor(
-                max_workers=self.max_workers,
-                initializer=_init_worker,
-                mp_context=ctx,
-            ) as executor:
-                futures = {executor.submit(_process_single_image, t): t for t in tasks}
-
-                for future in as_completed(futures):
-                    if self._cancelled:
-                        executor.shutdown(wait=False, cancel_futures=True)
-                        break
-
-                    try:
-                        result = future.result()
-                    except Exception as e:
-                        task = futures[future]
-                        result = {
-                            "filepath": task["filepath"],
-                            "success": False,
-                            "result": str(e),
-                            "options": {},
-                        }
-
-                    completed += 1
-                    self.signals.progress.emit(completed, total)
-                    self.signals.finished.emit(
-                        result["filepath"],
-                        result["success"],
-                        result["result"],
-                        result["options"],
-                    )
-
-        except (BrokenProcessPool, Exception):
-            # 멀티프로세싱 실패 시 순차 처리로 폴백
-            for task in tasks[completed:]:
-                if self._cancelled:
-                    break
-
-                result = _process_single_image(task)
-                completed += 1
-                self.signals.progress.emit(completed, total)
-                self.signals.finished.emit(
-                    result["filepath"],
-                    result["success"],
-                    result["result"],
-                    result["options"],
-                )
-
+            completed = self._engine.run(tasks)
         finally:
+            if self._engine.cancelled:
+                self.signals.cancelled.emit(len(tasks) - completed)
             self.signals.all_done.emit()
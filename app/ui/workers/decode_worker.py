@@ -0,0 +1,30 @@
+"""미리보기 디코딩 워커
+
+선택한 파일과 목록 이웃 파일을 미리보기 해상도로 디코딩 (UI 스레드에서 디코딩하지 않음).
+대기 중인 작업은 QThreadPool.tryTake로 취소하고, 이미 시작한 작업의 결과는 캐시에 남긴다.
+"""
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from app.core.constants import MAX_PREVIEW_SIZE
+from app.core.preview import decode_preview
+
+
+class DecodeWorkerSignals(QObject):
+    decoded = Signal(str, object)  # filepath, DecodedPreview
+    failed = Signal(str, str)  # filepath, 오류 메시지
+
+
+class DecodeWorker(QRunnable):
+    def __init__(self, filepath: str, max_size: int = MAX_PREVIEW_SIZE):
+        super().__init__()
+        self.filepath = filepath
+        self.max_size = max_size  # 긴 변 (뷰에 필요한 렌더 단계)
+        self.signals = DecodeWorkerSignals()
+
+    def run(self):
+        try:
+            decoded = decode_preview(self.filepath, self.max_size)
+        except Exception as e:
+            self.signals.failed.emit(self.filepath, str(e))
+            return
+        self.signals.decoded.emit(self.filepath, decoded)
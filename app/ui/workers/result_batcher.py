@@ -0,0 +1,70 @@
+"""작업 결과 묶음 전달
+
+작은 파일을 초당 100장 이상 처리하면 결과마다 큐잉 시그널을 보낼 때 이벤트 루프가 밀린다.
+워커 스레드는 add()로 결과를 쌓기만 하고 (비어 있다가 처음 쌓일 때만 깨우는 시그널 1번),
+GUI 스레드가 FLUSH_INTERVAL_MS 간격으로 모아서 results_ready 한 번으로 전달.
+"""
+import threading
+import time
+
+from PySide6.QtCore import QObject, QTimer, Qt, Signal
+
+FLUSH_INTERVAL_MS = 33  # 약 30fps
+
+
+class ResultBatcher(QObject):
+    """여러 스레드의 작업 결과를 모아 GUI 스레드에 묶음으로 전달
+
+    결과 dict는 BatchEngine 결과와 같은 키 (filepath, success, result, options, elapsed, timings, ...).
+
+    사용법:
+        batcher = ResultBatcher(parent)  # GUI 스레드에서 생성
+        batcher.results_ready.connect(on_results)
+        worker = BatchTransformWorker(..., on_result=batcher.add)
+    """
+
+    results_ready = Signal(list, int, int)  # 결과 목록, 성공 수, 실패 수
+    _wake = Signal()
+
+    def __init__(self, parent=None, interval_ms: int = FLUSH_INTERVAL_MS):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._pending: list[dict] = []
+        self._interval_ms = interval_ms
+        self._last_flush = 0.0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+        self._wake.connect(self._schedule, Qt.ConnectionType.QueuedConnection)
+
+    def add(self, result: dict):
+        """결과 1개 추가 (아무 스레드에서나 호출)"""
+        with self._lock:
+            self._pending.append(result)
+            first = len(self._pending) == 1
+        if first:
+            self._wake.emit()
+
+    def _schedule(self):
+        # 마지막 전달 후 간격이 지났으면 바로, 아니면 남은 시간 뒤에
+        if self._timer.isActive():
+            return
+        elapsed_ms = (time.monotonic() - self._last_flush) * 1000
+        self._timer.start(max(0, int(self._interval_ms - elapsed_ms)))
+
+    def flush(self):
+        """쌓인 결과를 바로 전달 (배치 종료 시 마지막 결과를 요약 전에 반영할 때도 사용)"""
+        self._timer.stop()
+        with self._lock:
+            batch, self._pending = self._pending, []
+        if not batch:
+            return
+        self._last_flush = time.monotonic()
+        succeeded = sum(1 for result in batch if result["success"])
+        self.results_ready.emit(batch, succeeded, len(batch) - succeeded)
+
+    def discard(self):
+        """전달하지 않은 결과 버림 (새 실행 시작 시 이전 실행의 늦은 결과 제거)"""
+        self._timer.stop()
+        with self._lock:
+            self._pending = []
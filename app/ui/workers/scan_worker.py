@@ -0,0 +1,86 @@
+"""폴더 검색 워커
+
+app.core.file_scan.scan_files를 QThread에서 실행하고 찾은 파일을 묶음 단위로 전달
+(네트워크 드라이브에서 수십 초 걸리는 검색 중에도 UI가 멈추지 않고 목록이 채워짐)
+"""
+import threading
+import time
+from typing import Optional
+
+from PySide6.QtCore import QObject, QThread, Signal
+
+from app.core.file_scan import DEFAULT_EXCLUDE, DEFAULT_INCLUDE, DEFAULT_MAX_DEPTH, scan_files
+
+# 이만큼 모이거나 마지막 전달 후 이 시간이 지나면 전달
+CHUNK_SIZE = 500
+CHUNK_INTERVAL = 0.2
+
+
+class ScanWorkerSignals(QObject):
+    """폴더 검색 시그널"""
+    files_found = Signal(list)  # 새로 찾은 파일 경로 묶음
+    progress = Signal(int, int)  # 지금까지 찾은 파일 수, 읽은 폴더 수
+    done = Signal(int, bool)  # 찾은 파일 수, 취소 여부
+
+
+class FolderScanWorker(QThread):
+    """폴더 검색 워커
+
+    사용법:
+        worker = FolderScanWorker(paths)
+        worker.signals.files_found.connect(on_files)
+        worker.signals.done.connect(on_done)
+        worker.start()
+    """
+
+    def __init__(
+        self,
+        paths: list[str],
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        include: Optional[list[str]] = None,
+        exclude: Optional[list[str]] = None,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.paths = paths
+        self.max_depth = max_depth
+        self.include = tuple(include or DEFAULT_INCLUDE)
+        # 설정의 제외 패턴은 기본 제외(숨김/출력 폴더)에 추가
+        self.exclude = DEFAULT_EXCLUDE + tuple(exclude or ())
+        self.signals = ScanWorkerSignals()
+        self._cancel_event = threading.Event()
+        self._dirs = 0
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def _on_dir(self, path: str):
+        self._dirs += 1
+
+    def run(self):
+        found = 0
+        chunk: list[str] = []
+        last_emit = time.monotonic()
+
+        for path in scan_files(
+            self.paths,
+            max_depth=self.max_depth,
+            include=self.include,
+            exclude=self.exclude,
+            cancel_event=self._cancel_event,
+            on_dir=self._on_dir,
+        ):
+            chunk.append(path)
+            now = time.monotonic()
+            if len(chunk) >= CHUNK_SIZE or now - last_emit >= CHUNK_INTERVAL:
+                found += len(chunk)
+                self.signals.files_found.emit(chunk)
+                self.signals.progress.emit(found, self._dirs)
+                chunk = []
+                last_emit = now
+
+        if chunk:
+            found += len(chunk)
+            self.signals.files_found.emit(chunk)
+        self.signals.progress.emit(found, self._dirs)
+        self.signals.done.emit(found, self._cancel_event.is_set())
@@ -1,19 +1,23 @@
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from PySide6.QtCore import QObject, QRunnable, Signal
-from PIL import Image, ImageOps
 
-from app.core.preview import create_thumbnail, MAX_PREVIEW_SIZE
-from app.core.image_ops import apply_transforms
-from app.core.metadata import remove_exif
+from app.core.cancellation import CancelEvent, TaskCancelled
+from app.core.pipeline import process_image_file
+from app.core.profiling import profile_task
 from app.core.transform_history import record_transform
-from app.core.save_output import OutputManager
+from app.core.save_output import OutputManager, release_reservations
+from app.core.scheduler import InteractionGate
+from app.core.stage_timing import StageTimer
 
 
 class WorkerSignals(QObject):
     progress = Signal(int, int)
     finished = Signal(str, bool, str, dict)  # filepath, success, result, applied_options
+    cancelled = Signal(str)  # filepath
+    task_metrics = Signal(dict)  # 처리 시간/단계별 시간 (BatchEngine 결과 dict와 같은 키)
     all_done = Signal()
 
 
@@ -23,69 +27,64 @@ class TransformWorker(QRunnable):
         filepath: str,
         options: dict,
         output_manager: OutputManager,
+        cancel_event: Optional[CancelEvent] = None,
+        megapixels: float = 0.0,
+        profile_parts: Optional[str] = None,
+        on_result: Optional[Callable[[dict], None]] = None,
+        interaction_gate: Optional[InteractionGate] = None,
     ):
         super().__init__()
         self.filepath = filepath
         self.options = options
         self.output_manager = output_manager
+        self.cancel_event = cancel_event
+        self.megapixels = megapixels
+        self.profile_parts = profile_parts  # CPU 프로파일 워커별 파일 폴더 (None이면 계측 안 함)
+        # 지정하면 시그널 대신 결과 dict를 넘김 (ResultBatcher.add - 여러 워커 결과를 묶어서 전달)
+        self.on_result = on_result
+        # 미리보기 조작 직후면 시작 전 잠깐 대기 (최대 INTERACTION_MAX_WAIT_S)
+        self.interaction_gate = interaction_gate
         self.signals = WorkerSignals()
 
+    def _make_result(
+        self, start: float, timer: StageTimer, result: str, error: Optional[Exception] = None
+    ) -> dict:
+        return {
+            "filepath": self.filepath,
+            "success": error is None,
+            "result": result,
+            "options": self.options if error is None else {},
+            "error_type": type(error).__name__ if error else None,
+            "elapsed": time.perf_counter() - start,
+            "megapixels": self.megapixels,
+            "timings": timer.durations,
+        }
+
+    def _deliver(self, result: dict):
+        if self.on_result is not None:
+            self.on_result(result)
+            return
+        self.signals.task_metrics.emit(result)
+        self.signals.finished.emit(result["filepath"], result["success"], result["result"], result["options"])
+
     def run(self):
+        if self.interaction_gate is not None:
+            self.interaction_gate.wait_idle(self.cancel_event)
+        timer = StageTimer()
+        start = time.perf_counter()
         try:
-            img = Image.open(self.filepath)
-
-            # EXIF Orientation 태그에 따라 이미지 자동 회전
-            img = ImageOps.exif_transpose(img) if img else img
-
-            perspective_corners: Optional[list] = None
-            if self.options.get("perspective_corners"):
-                orig_w, orig_h = img.size
-                thumb_w = self.options.get("thumb_w")
-                thumb_h = self.options.get("thumb_h")
-
-                if not thumb_w or not thumb_h:
-                    thumbnail = create_thumbnail(img, MAX_PREVIEW_SIZE)
-                    thumb_w, thumb_h = thumbnail.size
-
-                scale_x = orig_w / thumb_w
-                scale_y = orig_h / thumb_h
-
-                preview_corners = self.options.get("perspective_corners")
-                perspective_corners = [
-                    (x * scale_x, y * scale_y) for x, y in preview_corners
-                ]
-
-            result = apply_transforms(
-                img,
-                rotation=self.options.get("rotation", 0),
-                brightness=self.options.get("brightness", 0),
-                contrast=self.options.get("contrast", 0),
-                saturation=self.options.get("saturation", 0),
-                noise=self.options.get("noise", 0),
-                perspective_corners=perspective_corners,
-                crop=self.options.get("crop"),
-            )
+            with profile_task(self.profile_parts), timer.activate():
+                output_path = process_image_file(
+                    self.filepath,
+                    self.options,
+                    self.output_manager.get_output_dir(),
+                    self.output_manager.output_format,
+                    cancel_event=self.cancel_event,
+                )
+            result = self._make_result(start, timer, str(output_path))
+            self.output_manager.saved_files.append(output_path)
 
-            # JPEG EXIF 메타데이터 처리 (DateTimeOriginal = Windows 촬영날짜)
             exif_opts = self.options.get("exif", {})
-            metadata_overrides = None
-
-            if exif_opts.get("remove_all"):
-                result = remove_exif(result)
-            elif exif_opts.get("override"):
-                # datetime이 없으면 현재 시간 사용
-                from datetime import datetime as dt
-
-                datetime_val = exif_opts.get("datetime", "")
-                if not datetime_val:
-                    datetime_val = dt.now().strftime("%Y:%m:%d %H:%M:%S")
-
-                metadata_overrides = {"DateTimeOriginal": datetime_val}
-                result = remove_exif(result)
-
-            filename = Path(self.filepath).name
-            output_path = self.output_manager.save(result, filename, metadata_overrides)
-
             metadata_actions = []
             if exif_opts.get("remove_all"):
                 metadata_actions.append("remove_all")
@@ -94,7 +93,7 @@ class TransformWorker(QRunnable):
 
             crop = self.options.get("crop", {})
             record_transform(
-                filename=filename,
+                filename=Path(self.filepath).name,
                 crop=crop,
                 rotation=self.options.get("rotation", 0),
                 brightness=self.options.get("brightness", 0),
@@ -104,7 +103,12 @@ class TransformWorker(QRunnable):
                 metadata_actions=metadata_actions,
             )
 
-            self.signals.finished.emit(self.filepath, True, str(output_path), self.options)
+            self._deliver(result)
+
+        except TaskCancelled:
+            release_reservations()
+            self.signals.cancelled.emit(self.filepath)
 
         except Exception as e:
-            self.signals.finished.emit(self.filepath, False, str(e), {})
+            release_reservations()
+            self._deliver(self._make_result(start, timer, str(e), e))
@@ -0,0 +1,9 @@
+"""성능 벤치마크 스위트
+
+    python -m benchmarks run [-o results.json] [--quick] [--sizes 1024x768 ...] [-k ops]
+    python -m benchmarks compare base.json new.json [--threshold 10]
+    python -m benchmarks list
+    python -m benchmarks startup [--budget-ms 1500]
+
+합성 이미지(고정 시드)만 사용하므로 입력 파일 없이 어디서나 같은 조건으로 실행된다.
+"""
@@ -0,0 +1,138 @@
+"""벤치마크 명령행 진입점 (python -m benchmarks)"""
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from .cases import uncovered_image_ops
+from .compare import DEFAULT_MIN_DELTA_MS, DEFAULT_THRESHOLD_PCT, compare_results, format_comparison
+from .preview_sweep import DEFAULT_IMAGE_SIZE, DEFAULT_WINDOW_SIZE, SWEEPS, run_preview_sweep
+from .runner import load_results, run_suite, save_results, select_cases
+from .startup import DEFAULT_BUDGET_MS, run_startup
+from .synthetic import DEFAULT_SEED, DEFAULT_SIZES, QUICK_SIZES
+
+RESULTS_DIR = Path("bench_results")
+
+# 환경이 다르면 비교 결과를 신뢰하기 어려운 항목
+ENV_KEYS = ("machine", "cpu_count", "python", "pillow", "numpy", "opencv")
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    sizes = args.sizes or (QUICK_SIZES if args.quick else DEFAULT_SIZES)
+    repeat = args.repeat or (3 if args.quick else 5)
+    data = run_suite(
+        list(sizes),
+        filters=args.filter,
+        repeat=repeat,
+        warmup=args.warmup,
+        workers=args.workers,
+        seed=args.seed,
+    )
+    output = Path(args.output) if args.output else RESULTS_DIR / f"bench_{datetime.now():%Y%m%d_%H%M%S}.json"
+    save_results(data, output)
+    for skipped in data["skipped"]:
+        print(f"건너뜀: {skipped['key']} ({skipped['reason']})")
+    print(f"결과 저장: {output}")
+    return 0
+
+
+def cmd_compare(args: argparse.Namespace) -> int:
+    base = load_results(Path(args.base))
+    new = load_results(Path(args.new))
+
+    for key in ENV_KEYS:
+        if base["environment"].get(key) != new["environment"].get(key):
+            print(
+                f"주의: 실행 환경이 다릅니다 ({key}: "
+                f"{base['environment'].get(key)} → {new['environment'].get(key)})"
+            )
+
+    comparisons = compare_results(
+        base, new, metric=args.metric, threshold_pct=args.threshold, min_delta_ms=args.min_delta_ms
+    )
+    for line in format_comparison(comparisons, show_all=args.all):
+        print(line)
+    return 1 if any(c.status == "regression" for c in comparisons) else 0
+
+
+def cmd_list(args: argparse.Namespace) -> int:
+    for bench in select_cases(args.filter):
+        extra = f" (requires {', '.join(bench.requires)})" if bench.requires else ""
+        print(f"{bench.group:<9} {bench.name}{extra}")
+    missing = uncovered_image_ops()
+    if missing:
+        print(f"마이크로벤치마크 없는 image_ops 함수: {', '.join(missing)}")
+        return 1
+    return 0
+
+
+def cmd_startup(args: argparse.Namespace) -> int:
+    return run_startup(repeat=args.repeat, budget_ms=args.budget_ms, top=args.top)
+
+
+def cmd_sweep(args: argparse.Namespace) -> int:
+    output = Path(args.output) if args.output else None
+    return run_preview_sweep(args.image_size, args.window_size, args.sweeps, output)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Image Setakgi 성능 벤치마크")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="벤치마크 실행 후 JSON 저장")
+    run.add_argument("-o", "--output", help=f"결과 파일 (기본: {RESULTS_DIR}/bench_<시각>.json)")
+    run.add_argument("--sizes", nargs="+", help=f"해상도 목록 WxH (기본: {' '.join(DEFAULT_SIZES)})")
+    run.add_argument("--quick", action="store_true", help=f"작은 해상도({' '.join(QUICK_SIZES)}) + 3회 반복")
+    run.add_argument("-k", "--filter", nargs="+", help="케이스 이름 일부 또는 그룹(ops/pipeline/gui/batch)")
+    run.add_argument("--repeat", type=int, default=None, help="반복 횟수 (기본 5, --quick 3)")
+    run.add_argument("--warmup", type=int, default=1, help="측정 전 예열 실행 횟수")
+    run.add_argument("-j", "--workers", type=int, default=None, help="배치 케이스 워커 수 (기본: CPU-1)")
+    run.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    run.set_defaults(func=cmd_run)
+
+    compare = sub.add_parser("compare", help="두 결과 비교, 회귀가 있으면 종료 코드 1")
+    compare.add_argument("base", help="기준 결과 JSON")
+    compare.add_argument("new", help="비교 결과 JSON")
+    compare.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD_PCT,
+        help=f"회귀 판정 기준 %% (기본: {DEFAULT_THRESHOLD_PCT})",
+    )
+    compare.add_argument(
+        "--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS,
+        help=f"이보다 작은 차이는 무시 (기본: {DEFAULT_MIN_DELTA_MS}ms)",
+    )
+    compare.add_argument("--metric", choices=("median_ms", "min_ms", "mean_ms"), default="median_ms")
+    compare.add_argument("--all", action="store_true", help="변화 없는 케이스도 표시")
+    compare.set_defaults(func=cmd_compare)
+
+    list_cmd = sub.add_parser("list", help="케이스 목록")
+    list_cmd.add_argument("-k", "--filter", nargs="+")
+    list_cmd.set_defaults(func=cmd_list)
+
+    startup = sub.add_parser("startup", help="GUI 시작 시간 측정, 예산 초과 시 종료 코드 1")
+    startup.add_argument("--repeat", type=int, default=5, help="창 표시 측정 횟수 (중앙값 사용)")
+    startup.add_argument(
+        "--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+        help=f"창 표시까지 허용 시간 ms (기본: {DEFAULT_BUDGET_MS})",
+    )
+    startup.add_argument("--top", type=int, default=15, help="import 시간 상위 패키지 표시 개수")
+    startup.set_defaults(func=cmd_startup)
+
+    sweep = sub.add_parser("sweep", help="미리보기 슬라이더 스윕 - 옵션 변경 → 화면 표시 p50/p95")
+    sweep.add_argument("sweeps", nargs="*", help=f"스윕 이름 (기본: 전체 {' '.join(SWEEPS)})")
+    sweep.add_argument("--image-size", default=DEFAULT_IMAGE_SIZE, help=f"합성 이미지 WxH (기본: {DEFAULT_IMAGE_SIZE})")
+    sweep.add_argument("--window-size", default=DEFAULT_WINDOW_SIZE, help=f"창 크기 WxH (기본: {DEFAULT_WINDOW_SIZE})")
+    sweep.add_argument("-o", "--output", help="결과 JSON 파일")
+    sweep.set_defaults(func=cmd_sweep)
+
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,437 @@
+"""벤치마크 케이스 정의
+
+그룹:
+- ops: image_ops 함수별 마이크로벤치마크
+- pipeline: 파일 1장 전체 처리 (일반/랜덤 × JPEG/WebP)
+- gui: GUI 워커 경로 (미리보기, 랜덤 모드 TransformWorker, 배치 워커) - PySide6 필요
+- batch: 헤드리스 BatchEngine (CLI 경로)
+
+케이스 함수는 BenchEnv를 받아 측정할 호출(callable)을 돌려준다.
+(callable, cleanup) 튜플을 돌려주면 cleanup은 측정 시간에서 제외하고 매 반복 후 실행.
+"""
+import inspect
+import itertools
+import os
+import random
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+
+from app.core import image_ops
+from app.core.batch_engine import BatchEngine, build_tasks
+from app.core.pipeline import process_image_file
+from app.core.random_transform import RandomTransformConfig, generate_random_task_options
+
+BATCH_IMAGES = 8
+
+NORMAL_OPTIONS = {
+    "crop": {"top": 10, "bottom": 10, "left": 10, "right": 10},
+    "rotation": 2.0,
+    "brightness": 5,
+    "contrast": 5,
+    "saturation": 5,
+    "noise": 3.0,
+    "exif": {"remove_all": False, "override": True, "datetime": "2024:01:01 12:00:00"},
+}
+
+
+@dataclass
+class BenchEnv:
+    """해상도 1개에 대한 공용 입력 (이미지/파일/임시 폴더)"""
+    size: str
+    image: object  # PIL.Image
+    path: Path
+    work_dir: Path
+    workers: int
+    seed: int
+    _cache: dict = field(default_factory=dict)
+
+    @property
+    def width(self) -> int:
+        return self.image.size[0]
+
+    @property
+    def height(self) -> int:
+        return self.image.size[1]
+
+    def corners(self) -> list[tuple[float, float]]:
+        """랜덤 변형과 같은 형태의 원근 코너 (1개 코너만 이동)"""
+        w, h = self.image.size
+        return [(0, 0), (w, 0), (w - w * 0.01, h + h * 0.01), (0, h)]
+
+    def cached(self, key: str, factory: Callable):
+        if key not in self._cache:
+            self._cache[key] = factory()
+        return self._cache[key]
+
+    def output_dir(self, name: str) -> Path:
+        path = self.work_dir / "out" / name
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def batch_files(self) -> list[str]:
+        """배치 케이스용 입력 사본"""
+        def make():
+            files = []
+            batch_dir = self.work_dir / "batch_in"
+            batch_dir.mkdir(parents=True, exist_ok=True)
+            for i in range(BATCH_IMAGES):
+                target = batch_dir / f"img_{i:02d}.jpg"
+                shutil.copyfile(self.path, target)
+                files.append(str(target))
+            return files
+
+        return self.cached("batch_files", make)
+
+
+@dataclass
+class BenchCase:
+    name: str
+    group: str
+    setup: Callable[[BenchEnv], object]
+    max_repeat: Optional[int] = None  # 느린 케이스(프로세스 풀 시작 포함) 반복 상한
+    items: int = 1  # 1회 호출당 처리 이미지 수 (처리량 계산용)
+    requires: tuple[str, ...] = ()
+    inner: int = 1  # 측정 1회당 호출 횟수 (µs 단위 함수는 타이머 해상도 보정)
+
+
+CASES: list[BenchCase] = []
+
+
+def case(
+    name: str,
+    group: str,
+    max_repeat: Optional[int] = None,
+    items: int = 1,
+    requires=(),
+    inner: int = 1,
+):
+    def register(setup):
+        CASES.append(BenchCase(name, group, setup, max_repeat, items, tuple(requires), inner))
+        return setup
+
+    return register
+
+
+def _reset_dir(path: Path):
+    def cleanup():
+        shutil.rmtree(path, ignore_errors=True)
+        path.mkdir(parents=True, exist_ok=True)
+
+    return cleanup
+
+
+# --- ops: image_ops 마이크로벤치마크 ---
+
+@case("ops.fit_size", "ops", inner=1000)
+def _fit_size(env: BenchEnv):
+    return lambda: image_ops.fit_size(env.width, env.height, 512)
+
+
+@case("ops.get_inscribed_rect_size", "ops", inner=1000)
+def _inscribed(env: BenchEnv):
+    return lambda: image_ops.get_inscribed_rect_size(env.width, env.height, 2.5)
+
+
+@case("ops.rotate_and_crop", "ops")
+def _rotate_and_crop(env: BenchEnv):
+    return lambda: image_ops.rotate_and_crop(env.image, 2.5)
+
+
+@case("ops.crop_edges", "ops")
+def _crop_edges(env: BenchEnv):
+    return lambda: image_ops.crop_edges(env.image, 10, 10, 10, 10)
+
+
+@case("ops.crop_edges.pad", "ops")
+def _crop_edges_pad(env: BenchEnv):
+    return lambda: image_ops.crop_edges(env.image, -10, -10, -10, -10)
+
+
+@case("ops.resize_image", "ops")
+def _resize(env: BenchEnv):
+    return lambda: image_ops.resize_image(env.image, width=env.width // 2)
+
+
+@case("ops.rotate_image", "ops")
+def _rotate(env: BenchEnv):
+    return lambda: image_ops.rotate_image(env.image, 2.5)
+
+
+@case("ops.adjust_brightness", "ops")
+def _brightness(env: BenchEnv):
+    return lambda: image_ops.adjust_brightness(env.image, 10)
+
+
+@case("ops.adjust_contrast", "ops")
+def _contrast(env: BenchEnv):
+    return lambda: image_ops.adjust_contrast(env.image, 10)
+
+
+@case("ops.adjust_saturation", "ops")
+def _saturation(env: BenchEnv):
+    return lambda: image_ops.adjust_saturation(env.image, 10)
+
+
+@case("ops.add_noise", "ops")
+def _noise(env: BenchEnv):
+    return lambda: image_ops.add_noise(env.image, 3.0)
+
+
+@case("ops.apply_transforms", "ops")
+def _apply_transforms(env: BenchEnv):
+    return lambda: image_ops.apply_transforms(
+        env.image,
+        rotation=2.0,
+        brightness=5,
+        contrast=5,
+        saturation=5,
+        noise=3.0,
+        perspective_corners=env.corners(),
+        crop=NORMAL_OPTIONS["crop"],
+    )
+
+
+@case("ops.find_perspective_coeffs", "ops", inner=1000)
+def _coeffs(env: BenchEnv):
+    w, h = env.image.size
+    source = [(0, 0), (w, 0), (w, h), (0, h)]
+    return lambda: image_ops.find_perspective_coeffs(source, env.corners())
+
+
+@case("ops.perspective_transform", "ops")
+def _perspective(env: BenchEnv):
+    return lambda: image_ops.perspective_transform(env.image, env.corners())
+
+
+@case("ops._detect_bg_color", "ops", inner=1000)
+def _detect_bg(env: BenchEnv):
+    arr = env.cached("array", lambda: np.array(env.image))
+    return lambda: image_ops._detect_bg_color(arr)
+
+
+@case("ops.crop_background", "ops")
+def _crop_background(env: BenchEnv):
+    return lambda: image_ops.crop_background(env.image)
+
+
+@case("ops.crop_transparent", "ops")
+def _crop_transparent(env: BenchEnv):
+    rgba = env.cached(
+        "perspective_rgba", lambda: image_ops.perspective_transform(env.image, env.corners())
+    )
+    return lambda: image_ops.crop_transparent(rgba)
+
+
+@case("ops.get_image_info", "ops")
+def _image_info(env: BenchEnv):
+    return lambda: image_ops.get_image_info(str(env.path))
+
+
+# --- pipeline: 파일 1장 전체 처리 ---
+
+def _pipeline_case(output_format: str, randomized: bool):
+    def setup(env: BenchEnv):
+        out = env.output_dir(f"pipeline_{'random' if randomized else 'normal'}_{output_format}")
+        config = RandomTransformConfig()
+
+        def run():
+            if randomized:
+                # 반복마다 같은 시드로 재설정되므로 항상 같은 랜덤 옵션
+                options = generate_random_task_options(config, env.width, env.height)
+            else:
+                options = NORMAL_OPTIONS
+            process_image_file(str(env.path), options, out, output_format)
+
+        return run, _reset_dir(out)
+
+    return setup
+
+
+for _fmt in ("jpeg", "webp"):
+    case(f"pipeline.normal.{_fmt}", "pipeline")(_pipeline_case(_fmt, randomized=False))
+    case(f"pipeline.random.{_fmt}", "pipeline")(_pipeline_case(_fmt, randomized=True))
+
+
+# --- gui: GUI 워커 경로 ---
+
+def _qt_app():
+    """QPixmap 생성용 QGuiApplication (화면 없는 환경이면 offscreen)"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtGui import QGuiApplication
+
+    return QGuiApplication.instance() or QGuiApplication([])
+
+
+def _isolate_history(env: BenchEnv):
+    """TransformWorker의 변환 기록이 사용자 기록 파일에 쌓이지 않도록 임시 경로 사용"""
+    from app.core import transform_history
+
+    transform_history.HISTORY_FILE = env.work_dir / "transform_history.json"
+
+
+@case("gui.preview.set_source", "gui", requires=("qt",))
+def _preview_source(env: BenchEnv):
+    _qt_app()
+    from app.core.preview import PreviewWorker
+
+    worker = PreviewWorker()
+    return lambda: worker.set_source(env.image)
+
+
+@case("gui.preview.to_qpixmap", "gui", requires=("qt",))
+def _preview_to_qpixmap(env: BenchEnv):
+    """미리보기 프레임 1장 PIL → QPixmap 변환 (원근 적용 후 RGBA)"""
+    _qt_app()
+    from app.core.preview import PreviewRenderer, pil_to_qpixmap
+
+    renderer = PreviewRenderer()
+    renderer.set_source(env.image)
+    thumb_w, thumb_h = renderer.thumb_size
+    frame = renderer.render(
+        {**NORMAL_OPTIONS, "perspective_corners": [(0, 0), (thumb_w, 0), (thumb_w - 3, thumb_h + 3), (0, thumb_h)]}
+    )
+    return lambda: pil_to_qpixmap(frame)
+
+
+def _preview_process_case(tier: str, level: int = 512):
+    def setup(env: BenchEnv):
+        _qt_app()
+        from app.core.preview import PreviewWorker
+
+        worker = PreviewWorker()
+        worker.set_source(env.image)
+        thumb_w, thumb_h = worker.renderer.thumb_size
+        # 렌더러가 단계 결과를 기억하므로 두 기하를 번갈아 전체 렌더를 측정
+        variants = itertools.cycle(
+            {
+                **NORMAL_OPTIONS,
+                "perspective_corners": [(0, 0), (thumb_w, 0), (thumb_w - d, thumb_h + d), (0, thumb_h)],
+            }
+            for d in (3, 4)
+        )
+
+        def run():
+            worker.set_options(next(variants), tier, level)
+            worker.process()
+
+        return run
+
+    return setup
+
+
+# 미리보기 품질 단계별 렌더 (draft: 드래그 중, full: 조작 멈춘 뒤)
+case("gui.preview.process", "gui", requires=("qt",))(_preview_process_case("full"))
+case("gui.preview.process.draft", "gui", requires=("qt",))(_preview_process_case("draft"))
+# 고배율 화면/큰 창: 좌표는 512 기준 그대로, 픽셀만 단계 해상도로
+case("gui.preview.process.1024", "gui", requires=("qt",))(_preview_process_case("full", 1024))
+
+
+@case("gui.preview.proxy", "gui", requires=("qt",))
+def _preview_proxy(env: BenchEnv):
+    """핸들 드래그 1번 이동: 다시 렌더하지 않고 표시 중인 프레임의 QTransform만 계산"""
+    _qt_app()
+    from app.core.preview import PreviewRenderer, proxy_transform
+
+    renderer = PreviewRenderer()
+    renderer.set_source(env.image)
+    thumb_w, thumb_h = renderer.thumb_size
+    shown = {**NORMAL_OPTIONS, "perspective_corners": [(0, 0), (thumb_w, 0), (thumb_w, thumb_h), (0, thumb_h)]}
+    dragged = {**shown, "perspective_corners": [(0, 0), (thumb_w, 0), (thumb_w - 3, thumb_h + 3), (0, thumb_h)]}
+    return lambda: proxy_transform(shown, dragged, renderer.thumb_size)
+
+
+@case("gui.preview.color_drag", "gui", requires=("qt",))
+def _preview_color_drag(env: BenchEnv):
+    """밝기 슬라이더 1칸: 기하 단계는 재사용하고 밝기/대비 LUT + 채도만 다시 계산"""
+    _qt_app()
+    from app.core.preview import PreviewRenderer
+
+    renderer = PreviewRenderer()
+    renderer.set_source(env.image)
+    thumb_w, thumb_h = renderer.thumb_size
+    options = {**NORMAL_OPTIONS, "perspective_corners": [(0, 0), (thumb_w, 0), (thumb_w - 3, thumb_h + 3), (0, thumb_h)]}
+    renderer.render(options)
+    brightness = itertools.cycle(range(-30, 31, 5))
+    return lambda: renderer.render({**options, "brightness": next(brightness)})
+
+
+FILE_LIST_ROWS = 100_000
+
+
+@case("gui.file_list.set_remove", "gui", items=FILE_LIST_ROWS, requires=("qt",))
+def _file_list(env: BenchEnv):
+    """대량 목록 교체 + 흩어진 행 제거 (뷰 없이 모델만)"""
+    from app.ui.widgets.file_list_model import FileListModel
+
+    model = FileListModel()
+    paths = [str(env.work_dir / f"img_{i:06d}.jpg") for i in range(FILE_LIST_ROWS)]
+
+    def run():
+        model.set_files(paths)
+        model.add_files(paths[: FILE_LIST_ROWS // 10])
+        model.remove_rows(range(0, FILE_LIST_ROWS, 10))
+
+    return run
+
+
+@case("gui.transform_worker.random", "gui", requires=("qt",))
+def _transform_worker(env: BenchEnv):
+    from app.core.save_output import OutputManager
+    from app.ui.workers.transform_worker import TransformWorker
+
+    _isolate_history(env)
+    base = env.output_dir("transform_worker")
+    config = RandomTransformConfig()
+
+    def run():
+        options = generate_random_task_options(config, env.width, env.height)
+        TransformWorker(str(env.path), options, OutputManager(str(base), {"random": True})).run()
+
+    return run, _reset_dir(base)
+
+
+@case("gui.batch_worker", "gui", max_repeat=2, items=BATCH_IMAGES, requires=("qt",))
+def _batch_worker(env: BenchEnv):
+    from app.ui.workers.batch_worker import BatchTransformWorker
+
+    files = env.batch_files()
+    out = env.output_dir("batch_worker")
+
+    def run():
+        # QThread.run()을 직접 호출해 현재 스레드에서 동기 실행
+        BatchTransformWorker(files, NORMAL_OPTIONS, str(out), "jpeg", max_workers=env.workers).run()
+
+    return run, _reset_dir(out)
+
+
+# --- batch: 헤드리스 엔진 ---
+
+@case("batch.engine", "batch", max_repeat=2, items=BATCH_IMAGES)
+def _batch_engine(env: BenchEnv):
+    files = env.batch_files()
+    out = env.output_dir("batch_engine")
+
+    def run():
+        BatchEngine(max_workers=env.workers).run(build_tasks(files, NORMAL_OPTIONS, str(out)))
+
+    return run, _reset_dir(out)
+
+
+def uncovered_image_ops() -> list[str]:
+    """마이크로벤치마크가 없는 image_ops 함수 (새 함수 추가 시 케이스 누락 확인용)"""
+    covered = {c.name.split(".")[1] for c in CASES if c.group == "ops"}
+    functions = [
+        name
+        for name, obj in inspect.getmembers(image_ops, inspect.isfunction)
+        if obj.__module__ == image_ops.__name__
+    ]
+    return sorted(set(functions) - covered)
+
+
+def seed_all(seed: int):
+    random.seed(seed)
+    np.random.seed(seed)
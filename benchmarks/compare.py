@@ -0,0 +1,71 @@
+"""두 벤치마크 결과 비교 (회귀 감지)"""
+from dataclasses import dataclass
+from typing import Optional
+
+DEFAULT_THRESHOLD_PCT = 10.0
+# 이보다 작은 절대 차이(ms)는 측정 잡음으로 보고 회귀로 판정하지 않음
+DEFAULT_MIN_DELTA_MS = 1.0
+
+
+@dataclass
+class Comparison:
+    key: str
+    base_ms: Optional[float]
+    new_ms: Optional[float]
+    status: str  # regression / improved / same / added / removed
+
+    @property
+    def change_pct(self) -> Optional[float]:
+        if not self.base_ms or self.new_ms is None:
+            return None
+        return (self.new_ms / self.base_ms - 1) * 100
+
+
+def compare_results(
+    base: dict,
+    new: dict,
+    metric: str = "median_ms",
+    threshold_pct: float = DEFAULT_THRESHOLD_PCT,
+    min_delta_ms: float = DEFAULT_MIN_DELTA_MS,
+) -> list[Comparison]:
+    base_map = {r["key"]: r[metric] for r in base["results"]}
+    new_map = {r["key"]: r[metric] for r in new["results"]}
+
+    comparisons = []
+    for key in sorted(base_map.keys() | new_map.keys()):
+        base_ms = base_map.get(key)
+        new_ms = new_map.get(key)
+        if base_ms is None:
+            status = "added"
+        elif new_ms is None:
+            status = "removed"
+        else:
+            delta = new_ms - base_ms
+            limit = base_ms * threshold_pct / 100
+            if delta > limit and delta > min_delta_ms:
+                status = "regression"
+            elif -delta > limit and -delta > min_delta_ms:
+                status = "improved"
+            else:
+                status = "same"
+        comparisons.append(Comparison(key, base_ms, new_ms, status))
+    return comparisons
+
+
+def format_comparison(comparisons: list[Comparison], show_all: bool = False) -> list[str]:
+    marks = {"regression": "▲ 느려짐", "improved": "▼ 빨라짐", "same": "", "added": "+ 추가", "removed": "- 제거"}
+    lines = [f"{'케이스':<48} {'기준(ms)':>12} {'비교(ms)':>12} {'변화':>9}  판정"]
+    for c in comparisons:
+        if c.status == "same" and not show_all:
+            continue
+        base = f"{c.base_ms:.2f}" if c.base_ms is not None else "-"
+        new = f"{c.new_ms:.2f}" if c.new_ms is not None else "-"
+        change = f"{c.change_pct:+.1f}%" if c.change_pct is not None else "-"
+        lines.append(f"{c.key:<48} {base:>12} {new:>12} {change:>9}  {marks[c.status]}")
+
+    counts = {s: sum(1 for c in comparisons if c.status == s) for s in marks}
+    lines.append(
+        f"회귀 {counts['regression']}개, 개선 {counts['improved']}개, 변화 없음 {counts['same']}개"
+        f", 추가 {counts['added']}개, 제거 {counts['removed']}개"
+    )
+    return lines
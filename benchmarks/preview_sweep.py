@@ -0,0 +1,109 @@
+"""미리보기 슬라이더 스윕 - 실제 MainWindow에서 옵션 변경 → 화면 표시 지연 측정
+
+offscreen Qt(디스플레이가 없으면 기본)로 창을 띄우고 합성 이미지를 연 뒤,
+슬라이더를 사람 드래그처럼 INPUT_INTERVAL_MS 간격으로 움직이고
+app.core.preview_latency로 구간별(wait/render/convert/paint/total) 프레임 시간을 모은다.
+
+- 입력 수보다 프레임 수가 적은 것은 정상 (렌더 중 들어온 입력은 최신 값 1번으로 합쳐짐)
+- 회전은 드래그 중 QTransform 프록시로 표시하므로 프레임은 조작이 멈춘 뒤 고품질 렌더 위주
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+from .synthetic import DEFAULT_SEED, make_image, parse_size, write_sample
+
+DEFAULT_IMAGE_SIZE = "2048x1536"
+DEFAULT_WINDOW_SIZE = "1200x800"
+INPUT_INTERVAL_MS = 16  # 마우스 이벤트 간격 (약 60Hz)
+SETTLE_S = 0.6  # 스윕 후 고품질 렌더까지 기다리는 시간
+
+# 스윕 이름 → (OptionsPanel 위젯 속성, 슬라이더 값 목록)
+SWEEPS = {
+    "brightness": ("_brightness", list(range(0, 61, 2)) + list(range(60, -61, -2))),
+    "contrast": ("_contrast", list(range(0, 61, 2)) + list(range(60, -61, -2))),
+    "saturation": ("_saturation", list(range(0, 61, 2)) + list(range(60, -61, -2))),
+    "noise": ("_noise", list(range(0, 41, 2))),
+    "rotation": ("_rotation", list(range(0, 151, 5))),  # 0.1도 단위
+}
+
+
+def _spin(app, seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        app.processEvents()
+        time.sleep(0.001)
+
+
+def _run_sweep(app, window, latency, name: str) -> dict:
+    attr, values = SWEEPS[name]
+    slider = getattr(window._options, attr)._slider
+    latency.reset()
+    for value in values:
+        slider.setValue(value)
+        _spin(app, INPUT_INTERVAL_MS / 1000)
+    _spin(app, SETTLE_S)
+    slider.setValue(0)
+    summary = latency.summary()
+    summary["inputs"] = len(values)
+    _spin(app, SETTLE_S)
+    return summary
+
+
+def run_preview_sweep(
+    image_size: str = DEFAULT_IMAGE_SIZE,
+    window_size: str = DEFAULT_WINDOW_SIZE,
+    sweeps: Optional[list[str]] = None,
+    output: Optional[Path] = None,
+) -> int:
+    """스윕별 p50/p95 출력 (output이 있으면 JSON 저장)"""
+    if not os.environ.get("DISPLAY") and sys.platform.startswith("linux"):
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from app.main import create_application
+    from app.ui.main_window import MainWindow
+
+    names = sweeps or list(SWEEPS)
+    unknown = [name for name in names if name not in SWEEPS]
+    if unknown:
+        print(f"알 수 없는 스윕: {', '.join(unknown)} (가능: {', '.join(SWEEPS)})")
+        return 2
+
+    app = create_application([])
+    results = {"image_size": image_size, "window_size": window_size, "sweeps": {}}
+    with tempfile.TemporaryDirectory(prefix="setakgi_sweep_") as tmp:
+        path = write_sample(make_image(*parse_size(image_size), DEFAULT_SEED), Path(tmp) / "sweep.jpg")
+        window = MainWindow()
+        window.resize(*parse_size(window_size))
+        window.show()
+        _spin(app, 0.2)
+        window._add_files([str(path)])
+        window._on_file_selected(0)
+        latency = window._preview_latency
+        deadline = time.perf_counter() + 10
+        while latency.frames == 0 and time.perf_counter() < deadline:
+            _spin(app, 0.05)
+        _spin(app, SETTLE_S)
+
+        print(f"미리보기 슬라이더 스윕: 이미지 {image_size}, 창 {window_size}, 입력 간격 {INPUT_INTERVAL_MS}ms")
+        for name in names:
+            summary = _run_sweep(app, window, latency, name)
+            results["sweeps"][name] = summary
+            total = summary["stages"]["total"]
+            print(
+                f"  {name:<11} 입력 {summary['inputs']:3d}  프레임 {summary['frames']:3d}  "
+                f"total p50 {total['p50_ms']:7.1f}ms  p95 {total['p95_ms']:7.1f}ms"
+            )
+            for stage, values in summary["stages"].items():
+                if stage != "total":
+                    print(f"      {stage:<8} p50 {values['p50_ms']:7.1f}ms  p95 {values['p95_ms']:7.1f}ms")
+        window.close()
+
+    if output is not None:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"결과 저장: {output}")
+    return 0
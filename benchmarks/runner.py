@@ -0,0 +1,173 @@
+"""벤치마크 실행 + 결과 JSON"""
+import json
+import multiprocessing as mp
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+from .cases import CASES, BenchCase, BenchEnv, seed_all
+from .synthetic import DEFAULT_SEED, make_image, parse_size, write_sample
+
+RESULT_VERSION = 1
+
+
+def _available(requirement: str) -> bool:
+    if requirement == "qt":
+        try:
+            import PySide6  # noqa: F401
+        except ImportError:
+            return False
+    return True
+
+
+def environment_info() -> dict:
+    """결과 비교 시 참고할 실행 환경"""
+    import numpy
+    import PIL
+
+    info = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": mp.cpu_count(),
+        "pillow": PIL.__version__,
+        "numpy": numpy.__version__,
+    }
+    try:
+        import cv2
+
+        info["opencv"] = cv2.__version__
+    except ImportError:
+        info["opencv"] = None
+    try:
+        info["git_commit"] = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        info["git_commit"] = None
+    return info
+
+
+def measure(
+    fn: Callable,
+    cleanup: Optional[Callable],
+    repeat: int,
+    warmup: int,
+    seed: int,
+    inner: int = 1,
+) -> list[float]:
+    """반복 실행 시간 (초, 호출 1회 기준) - 매 반복 전 시드 재설정, cleanup은 측정 제외"""
+    samples = []
+    for i in range(warmup + repeat):
+        seed_all(seed)
+        start = time.perf_counter()
+        for _ in range(inner):
+            fn()
+        elapsed = (time.perf_counter() - start) / inner
+        if cleanup:
+            cleanup()
+        if i >= warmup:
+            samples.append(elapsed)
+    return samples
+
+
+def summarize(bench: BenchCase, env: BenchEnv, samples: list[float]) -> dict:
+    megapixels = env.width * env.height / 1_000_000
+    median = statistics.median(samples)
+    return {
+        "key": f"{bench.name}@{env.size}",
+        "case": bench.name,
+        "group": bench.group,
+        "size": env.size,
+        "megapixels": round(megapixels, 3),
+        "items": bench.items,
+        "repeat": len(samples),
+        "min_ms": round(min(samples) * 1000, 5),
+        "median_ms": round(median * 1000, 5),
+        "mean_ms": round(statistics.fmean(samples) * 1000, 5),
+        "stdev_ms": round(statistics.stdev(samples) * 1000, 5) if len(samples) > 1 else 0.0,
+        "ms_per_mp": round(median * 1000 / (megapixels * bench.items), 5),
+        "images_per_s": round(bench.items / median, 3) if median > 0 else None,
+    }
+
+
+def select_cases(filters: Optional[list[str]] = None) -> list[BenchCase]:
+    """이름/그룹에 filters 중 하나라도 포함된 케이스"""
+    if not filters:
+        return list(CASES)
+    return [c for c in CASES if any(f in c.name or f == c.group for f in filters)]
+
+
+def run_suite(
+    sizes: list[str],
+    filters: Optional[list[str]] = None,
+    repeat: int = 5,
+    warmup: int = 1,
+    workers: Optional[int] = None,
+    seed: int = DEFAULT_SEED,
+    log: Callable[[str], None] = print,
+) -> dict:
+    cases = select_cases(filters)
+    workers = workers or max(1, mp.cpu_count() - 1)
+    results = []
+    skipped = []
+
+    with tempfile.TemporaryDirectory(prefix="setakgi_bench_") as tmp:
+        for size in sizes:
+            w, h = parse_size(size)
+            work_dir = Path(tmp) / size
+            work_dir.mkdir()
+            image = make_image(w, h, seed)
+            path = write_sample(image, work_dir / "sample.jpg")
+            env = BenchEnv(size, image, path, work_dir, workers, seed)
+            log(f"[{size}] {w * h / 1_000_000:.1f}MP")
+
+            for bench in cases:
+                missing = [r for r in bench.requires if not _available(r)]
+                if missing:
+                    skipped.append({"key": f"{bench.name}@{size}", "reason": f"missing {', '.join(missing)}"})
+                    continue
+
+                prepared = bench.setup(env)
+                fn, cleanup = prepared if isinstance(prepared, tuple) else (prepared, None)
+                n = min(repeat, bench.max_repeat) if bench.max_repeat else repeat
+                samples = measure(fn, cleanup, n, 0 if bench.max_repeat else warmup, seed, bench.inner)
+                result = summarize(bench, env, samples)
+                results.append(result)
+                log(f"  {bench.name:<32} median {result['median_ms']:11.4f}ms  "
+                    f"min {result['min_ms']:11.4f}ms  ({result['repeat']}회)")
+
+    return {
+        "version": RESULT_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "command": " ".join(sys.argv),
+        "environment": environment_info(),
+        "settings": {
+            "sizes": list(sizes),
+            "repeat": repeat,
+            "warmup": warmup,
+            "workers": workers,
+            "seed": seed,
+            "filters": filters or [],
+        },
+        "results": results,
+        "skipped": skipped,
+    }
+
+
+def save_results(data: dict, path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def load_results(path: Path) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
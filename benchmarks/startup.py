@@ -0,0 +1,125 @@
+"""GUI 시작 시간 측정 + 예산 확인
+
+새 인터프리터에서 매번 측정한다 (모듈 캐시 영향 없음).
+- importtime: python -X importtime -c "import app.main" 결과를 최상위 패키지별로 합산
+- window: 인터프리터 시작 ~ MainWindow 표시까지 (offscreen 플랫폼 기본)
+  창 표시 시점에 app.core.startup.DEFERRED_MODULES가 로드되어 있으면 실패로 본다
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# 창 표시까지 허용 시간 (ms, 중앙값 기준) - 개발 PC 측정값에 여유를 둔 값
+DEFAULT_BUDGET_MS = 1500
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+_WINDOW_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from app.main import create_application
+from app.ui.main_window import MainWindow
+from app.core.startup import DEFERRED_MODULES
+imported = time.perf_counter()
+app = create_application([])
+window = MainWindow()
+window.show()
+app.processEvents()
+shown = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "shown_ms": (shown - start) * 1000,
+    "loaded_deferred": [m for m in DEFERRED_MODULES if m in sys.modules],
+}))
+"""
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    if not env.get("DISPLAY") and sys.platform.startswith("linux"):
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(PROJECT_ROOT), env.get("PYTHONPATH")]))
+    return env
+
+
+def parse_importtime(stderr: str) -> list[dict]:
+    """-X importtime 출력 → [{"module", "self_us", "cumulative_us", "depth"}]"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append(
+            {
+                "module": name.strip(),
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+                "depth": depth,
+            }
+        )
+    return rows
+
+
+def measure_imports(target: str = "app.main") -> list[dict]:
+    """target import 시 최상위 패키지별 누적 시간 (큰 순)"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True, text=True, env=_env(), cwd=PROJECT_ROOT, check=True,
+    )
+    packages: dict[str, int] = {}
+    for row in parse_importtime(proc.stderr):
+        package = row["module"].split(".")[0]
+        packages[package] = packages.get(package, 0) + row["self_us"]
+    return sorted(
+        ({"package": name, "ms": us / 1000} for name, us in packages.items()),
+        key=lambda r: r["ms"],
+        reverse=True,
+    )
+
+
+def measure_window() -> dict:
+    """인터프리터 시작부터 창 표시까지 1회 측정"""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", _WINDOW_SCRIPT],
+        capture_output=True, text=True, env=_env(), cwd=PROJECT_ROOT, check=True,
+    )
+    total_ms = (time.perf_counter() - start) * 1000
+    data = json.loads(proc.stdout.strip().splitlines()[-1])
+    data["process_ms"] = total_ms
+    return data
+
+
+def run_startup(repeat: int = 5, budget_ms: float = DEFAULT_BUDGET_MS, top: int = 15) -> int:
+    """측정 결과 출력, 예산 초과 또는 지연 로드 모듈이 창 표시 전에 로드되면 1"""
+    packages = measure_imports()
+    total = sum(p["ms"] for p in packages)
+    print(f"import app.main: {total:.0f}ms (패키지별 self 시간 합)")
+    for row in packages[:top]:
+        print(f"  {row['package']:<24} {row['ms']:8.1f}ms")
+
+    runs = [measure_window() for _ in range(repeat)]
+    process_ms = statistics.median(r["process_ms"] for r in runs)
+    shown_ms = statistics.median(r["shown_ms"] for r in runs)
+    import_ms = statistics.median(r["import_ms"] for r in runs)
+    print(
+        f"창 표시: {process_ms:.0f}ms (인터프리터 시작 포함, 중앙값 {repeat}회) / "
+        f"import {import_ms:.0f}ms + 창 생성 {shown_ms - import_ms:.0f}ms"
+    )
+
+    failed = False
+    loaded = sorted({m for r in runs for m in r["loaded_deferred"]})
+    if loaded:
+        print(f"실패: 창 표시 전에 로드된 지연 모듈: {', '.join(loaded)}")
+        failed = True
+    if process_ms > budget_ms:
+        print(f"실패: 시작 시간 예산 초과 ({process_ms:.0f}ms > {budget_ms:.0f}ms)")
+        failed = True
+    if not failed:
+        print(f"통과: 예산 {budget_ms:.0f}ms 이내")
+    return 1 if failed else 0
@@ -0,0 +1,68 @@
+"""벤치마크용 합성 이미지 (고정 시드, 외부 파일 불필요)
+
+사진과 비슷한 부하가 되도록 그라데이션 배경 + 도형 + 약한 노이즈로 구성하고
+EXIF(촬영일시)를 넣어 EXIF 처리 경로도 함께 측정한다.
+"""
+import random
+from pathlib import Path
+
+import numpy as np
+import piexif
+from PIL import Image, ImageDraw
+
+DEFAULT_SEED = 1234
+
+# 해상도 스윕 (이름 = WxH)
+DEFAULT_SIZES = ("1024x768", "2048x1536", "4000x3000")
+QUICK_SIZES = ("1024x768", "2048x1536")
+
+
+def parse_size(text: str) -> tuple[int, int]:
+    w, h = text.lower().split("x")
+    return int(w), int(h)
+
+
+def make_image(width: int, height: int, seed: int = DEFAULT_SEED) -> Image.Image:
+    """시드가 같으면 항상 같은 RGB 이미지"""
+    rng = np.random.default_rng(seed)
+    ys = np.linspace(0, 1, height, dtype=np.float32)[:, None]
+    xs = np.linspace(0, 1, width, dtype=np.float32)[None, :]
+
+    arr = np.empty((height, width, 3), dtype=np.float32)
+    arr[..., 0] = 60 + 140 * xs
+    arr[..., 1] = 80 + 120 * ys
+    arr[..., 2] = 170 - 90 * (xs + ys) / 2
+    arr += rng.normal(0, 6, size=(height, width, 3)).astype(np.float32)
+    img = Image.fromarray(np.clip(arr, 0, 255).astype(np.uint8), "RGB")
+
+    draw = ImageDraw.Draw(img)
+    shapes = random.Random(seed)
+    for _ in range(24):
+        x0 = shapes.randrange(width)
+        y0 = shapes.randrange(height)
+        x1 = min(width, x0 + shapes.randrange(width // 8, width // 3))
+        y1 = min(height, y0 + shapes.randrange(height // 8, height // 3))
+        color = tuple(shapes.randrange(256) for _ in range(3))
+        if shapes.random() < 0.5:
+            draw.rectangle((x0, y0, x1, y1), fill=color)
+        else:
+            draw.ellipse((x0, y0, x1, y1), fill=color)
+    return img
+
+
+def sample_exif() -> bytes:
+    return piexif.dump(
+        {
+            "0th": {piexif.ImageIFD.Make: b"Bench", piexif.ImageIFD.Orientation: 1},
+            "Exif": {piexif.ExifIFD.DateTimeOriginal: b"2024:01:01 12:00:00"},
+            "GPS": {},
+            "1st": {},
+            "thumbnail": None,
+        }
+    )
+
+
+def write_sample(img: Image.Image, path: Path) -> Path:
+    """EXIF 포함 JPEG로 저장 (파이프라인 입력용)"""
+    img.save(path, "JPEG", quality=90, exif=sample_exif())
+    return path
@@ -13,6 +13,7 @@ a = Analysis(
         'PySide6.QtWidgets',
         'PIL',
         'numpy',
+        'cv2',
         'piexif',
     ],
     hookspath=[],